@@ -6,6 +6,7 @@ from .users import router as users_router
 from .accounts import router as accounts_router
 from .opportunities import router as opportunities_router
 from .analytics import router as analytics_router
+from .export import router as export_router
 
 # 메인 API 라우터 생성
 api_router = APIRouter()
@@ -16,4 +17,5 @@ api_router.include_router(tenants_router, prefix="/tenants", tags=["tenants"])
 api_router.include_router(users_router, prefix="/users", tags=["users"])
 api_router.include_router(accounts_router, prefix="/accounts", tags=["accounts"])
 api_router.include_router(opportunities_router, prefix="/opportunities", tags=["opportunities"])
-api_router.include_router(analytics_router, prefix="/analytics", tags=["analytics"])
\ No newline at end of file
+api_router.include_router(analytics_router, prefix="/analytics", tags=["analytics"])
+api_router.include_router(export_router, prefix="/export", tags=["export"])
\ No newline at end of file
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from app.schemas.account import AccountCreate, AccountUpdate, AccountInDB
 from app.services.account_service import AccountService
 from app.core.deps import get_current_active_user, get_tenant_id
-from typing import List
+from app.core.responses import FastResponseRoute
+from app.utils.fields import FieldSelectionParams, parse_fields, selection_response
+from app.utils.pagination import CursorPage, CursorPaginationParams
+from app.utils.streaming import StreamFormat, streaming_response
+from typing import List, Optional
 
-router = APIRouter()
+router = APIRouter(route_class=FastResponseRoute)
 
 @router.post("/", response_model=AccountInDB)
 async def create_account(
@@ -19,19 +23,40 @@ async def create_account(
     account.tenant_id = tenant_id
     return await account_service.create_account(account)
 
+@router.get("/page", response_model=CursorPage[AccountInDB])
+async def list_accounts_page(
+    pagination: CursorPaginationParams = Depends(),
+    selection: FieldSelectionParams = Depends(),
+    current_user: dict = Depends(get_current_active_user),
+    tenant_id: str = Depends(get_tenant_id),
+    account_service: AccountService = Depends()
+):
+    """
+    테넌트의 계정 목록을 커서 기반 페이지네이션으로 조회 (fields로 응답 필드 선택 가능)
+    """
+    fields = parse_fields(selection.fields, AccountInDB)
+    page = await account_service.list_accounts_page(tenant_id, pagination.size, pagination.cursor, pagination.include_total, fields)
+    if fields:
+        return selection_response(page)
+    return page
+
 @router.get("/{account_id}", response_model=AccountInDB)
 async def get_account(
     account_id: str,
     current_user: dict = Depends(get_current_active_user),
     tenant_id: str = Depends(get_tenant_id),
+    selection: FieldSelectionParams = Depends(),
     account_service: AccountService = Depends()
 ):
     """
-    특정 계정 정보 조회
+    특정 계정 정보 조회 (fields로 응답 필드 선택 가능)
     """
-    account = await account_service.get_account(account_id, tenant_id)
+    fields = parse_fields(selection.fields, AccountInDB)
+    account = await account_service.get_account(account_id, tenant_id, fields)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
+    if fields:
+        return selection_response(account)
     return account
 
 @router.put("/{account_id}", response_model=AccountInDB)
@@ -67,19 +92,28 @@ async def delete_account(
 
 @router.get("/", response_model=List[AccountInDB])
 async def list_accounts(
+    selection: FieldSelectionParams = Depends(),
+    stream: Optional[StreamFormat] = Query(None, description="전체 목록을 스트리밍으로 반환 (ndjson 또는 json 배열)"),
     current_user: dict = Depends(get_current_active_user),
     tenant_id: str = Depends(get_tenant_id),
     account_service: AccountService = Depends()
 ):
     """
-    테넌트의 모든 계정 목록 조회
+    테넌트의 모든 계정 목록 조회 (fields로 응답 필드 선택 가능, stream으로 전체 목록 스트리밍)
     """
-    return await account_service.list_accounts(tenant_id)
+    fields = parse_fields(selection.fields, AccountInDB)
+    if stream:
+        return await streaming_response(account_service.stream_accounts(tenant_id, fields), stream)
+    items = [item async for page in account_service.stream_accounts(tenant_id, fields) for item in page]
+    if fields:
+        return selection_response(items)
+    return items
 
 @router.put("/{account_id}/change-manager", response_model=AccountInDB)
 async def change_account_manager(
     account_id: str,
     new_manager_id: str,
+    version: Optional[int] = None,
     current_user: dict = Depends(get_current_active_user),
     tenant_id: str = Depends(get_tenant_id),
     account_service: AccountService = Depends()
@@ -87,7 +121,7 @@ async def change_account_manager(
     """
     계정 담당자 변경
     """
-    account = await account_service.change_account_manager(account_id, tenant_id, new_manager_id)
+    account = await account_service.change_account_manager(account_id, tenant_id, new_manager_id, version)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
     return account
\ No newline at end of file
@@ -1,12 +1,43 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
+from app.core.config import settings
 from app.services.analytics_service import AnalyticsService
 from app.core.deps import get_current_active_user, get_tenant_id
-from typing import Dict, List
+from app.core.responses import FastResponseRoute, dumps
+from typing import Any, Dict, List, Optional
+import hashlib
 
-router = APIRouter()
+router = APIRouter(route_class=FastResponseRoute)
+
+def _make_etag(tenant_id: str, resource: str, result: Any, *params: Any) -> str:
+    """
+    응답 내용으로 분석 응답의 ETag 생성
+    프로세스 내 데이터 버전이 아니라 응답 본문에서 만들므로 다른 워커/인스턴스에서 일어난 쓰기도
+    결과 캐시가 만료되어 다시 계산되면(ANALYTICS_CACHE_TTL_SECONDS 이내) ETag에 반영된다.
+    """
+    digest = hashlib.sha256(f"{tenant_id}:{resource}:{params}:".encode() + dumps(result)).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+def _weak(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+def _conditional(request: Request, response: Response, etag: str, result: Any) -> Any:
+    """
+    If-None-Match가 현재 ETag와 일치하면 304 응답 반환, 아니면 응답에 ETag를 설정하고 결과 반환
+    (결과는 캐시된 분석 결과이므로 304여도 본문 직렬화/전송만 생략된다)
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {_weak(tag.strip()) for tag in if_none_match.split(",")}
+        if "*" in candidates or _weak(etag) in candidates:
+            return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return result
 
 @router.get("/tenant-summary", response_model=Dict)
 async def get_tenant_summary(
+    request: Request,
+    response: Response,
     current_user: dict = Depends(get_current_active_user),
     tenant_id: str = Depends(get_tenant_id),
     analytics_service: AnalyticsService = Depends()
@@ -14,10 +45,13 @@ async def get_tenant_summary(
     """
     테넌트의 요약 정보 조회
     """
-    return await analytics_service.get_tenant_summary(tenant_id)
+    result = await analytics_service.get_tenant_summary(tenant_id)
+    return _conditional(request, response, _make_etag(tenant_id, "tenant-summary", result), result)
 
 @router.get("/opportunity-stage-distribution", response_model=Dict[str, int])
 async def get_opportunity_stage_distribution(
+    request: Request,
+    response: Response,
     current_user: dict = Depends(get_current_active_user),
     tenant_id: str = Depends(get_tenant_id),
     analytics_service: AnalyticsService = Depends()
@@ -25,11 +59,14 @@ async def get_opportunity_stage_distribution(
     """
     테넌트의 영업 기회 단계별 분포 조회
     """
-    return await analytics_service.get_opportunity_stage_distribution(tenant_id)
+    result = await analytics_service.get_opportunity_stage_distribution(tenant_id)
+    return _conditional(request, response, _make_etag(tenant_id, "opportunity-stage-distribution", result), result)
 
 @router.get("/top-accounts-by-revenue", response_model=List[Dict])
 async def get_top_accounts_by_revenue(
-    limit: int = 5,
+    request: Request,
+    response: Response,
+    limit: int = Query(5, ge=1, le=settings.ANALYTICS_TOP_ACCOUNTS_MAX_LIMIT, description="조회할 계정 수"),
     current_user: dict = Depends(get_current_active_user),
     tenant_id: str = Depends(get_tenant_id),
     analytics_service: AnalyticsService = Depends()
@@ -37,10 +74,13 @@ async def get_top_accounts_by_revenue(
     """
     기대 매출 기준 상위 계정 조회
     """
-    return await analytics_service.get_top_accounts_by_revenue(tenant_id, limit)
+    result = await analytics_service.get_top_accounts_by_revenue(tenant_id, limit)
+    return _conditional(request, response, _make_etag(tenant_id, "top-accounts-by-revenue", result, limit), result)
 
 @router.get("/sales-pipeline", response_model=List[Dict])
 async def get_sales_pipeline(
+    request: Request,
+    response: Response,
     current_user: dict = Depends(get_current_active_user),
     tenant_id: str = Depends(get_tenant_id),
     analytics_service: AnalyticsService = Depends()
@@ -48,4 +88,5 @@ async def get_sales_pipeline(
     """
     테넌트의 영업 파이프라인 조회
     """
-    return await analytics_service.get_sales_pipeline(tenant_id)
\ No newline at end of file
+    result = await analytics_service.get_sales_pipeline(tenant_id)
+    return _conditional(request, response, _make_etag(tenant_id, "sales-pipeline", result), result)
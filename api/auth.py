@@ -2,9 +2,10 @@ from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 from app.schemas.user import UserCreate, UserInDB
 from app.services.auth_service import AuthService
-from app.core.deps import get_current_active_user
+from app.core.deps import get_current_active_user, oauth2_scheme
+from app.core.responses import FastResponseRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastResponseRoute)
 
 @router.post("/register", response_model=UserInDB)
 async def register_user(user: UserCreate, auth_service: AuthService = Depends()):
@@ -24,9 +25,15 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), auth_service:
     return {"access_token": user["access_token"], "token_type": "bearer"}
 
 @router.post("/logout")
-async def logout(current_user: UserInDB = Depends(get_current_active_user), auth_service: AuthService = Depends()):
-    # 여기서 로그아웃 로직을 구현합니다
-    await auth_service.logout_user(current_user.user_id)
+async def logout(
+    token: str = Depends(oauth2_scheme),
+    current_user: UserInDB = Depends(get_current_active_user),
+    auth_service: AuthService = Depends()
+):
+    """
+    로그아웃 (현재 토큰과 사용자의 기존 토큰을 폐기)
+    """
+    await auth_service.logout_user(token)
     return {"message": "Successfully logged out"}
 
 @router.post("/change-password")
@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from app.core.config import settings
+from app.core.deps import get_current_active_user, get_tenant_id
+from app.core.responses import FastResponseRoute
+from app.schemas.account import AccountInDB
+from app.schemas.opportunity import OpportunityInDB
+from app.services.export_service import ExportService
+from app.utils.fields import FieldSelectionParams, parse_fields
+from app.utils.streaming import ExportFormat, accepts_gzip, export_response
+
+router = APIRouter(route_class=FastResponseRoute)
+
+@router.get("/accounts", response_class=StreamingResponse)
+async def export_accounts(
+    request: Request,
+    format: ExportFormat = Query(ExportFormat.CSV, description="내보내기 형식 (csv 또는 ndjson)"),
+    selection: FieldSelectionParams = Depends(),
+    current_user: dict = Depends(get_current_active_user),
+    tenant_id: str = Depends(get_tenant_id),
+    export_service: ExportService = Depends()
+):
+    """
+    테넌트의 모든 활성 계정을 한 번의 요청으로 내보내기 (CSV/NDJSON 스트리밍, Accept-Encoding에 gzip이 있으면 압축)
+    """
+    fields = parse_fields(selection.fields, AccountInDB)
+    return await export_response(
+        export_service.export_accounts(tenant_id, fields),
+        format,
+        export_service.account_columns(fields),
+        "accounts",
+        compress=accepts_gzip(request.headers.get("accept-encoding")),
+        compress_level=settings.EXPORT_GZIP_LEVEL
+    )
+
+@router.get("/opportunities", response_class=StreamingResponse)
+async def export_opportunities(
+    request: Request,
+    account_id: str = None,
+    format: ExportFormat = Query(ExportFormat.CSV, description="내보내기 형식 (csv 또는 ndjson)"),
+    include_account_name: bool = Query(False, description="각 행에 계정 이름(account_name) 추가"),
+    selection: FieldSelectionParams = Depends(),
+    current_user: dict = Depends(get_current_active_user),
+    tenant_id: str = Depends(get_tenant_id),
+    export_service: ExportService = Depends()
+):
+    """
+    테넌트의 모든 활성 영업 기회를 한 번의 요청으로 내보내기 (선택적으로 특정 계정의 영업 기회만, 계정 이름 조인 가능)
+    """
+    fields = parse_fields(selection.fields, OpportunityInDB)
+    return await export_response(
+        export_service.export_opportunities(tenant_id, account_id, fields, include_account_name),
+        format,
+        export_service.opportunity_columns(fields, include_account_name),
+        "opportunities",
+        compress=accepts_gzip(request.headers.get("accept-encoding")),
+        compress_level=settings.EXPORT_GZIP_LEVEL
+    )
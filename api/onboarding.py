@@ -5,8 +5,9 @@ from app.schemas.user import UserCreate
 from app.schemas.onboarding import OnboardingRequest
 from app.services.onboarding_service import get_onboarding_service, OnboardingService
 from app.core.deps import get_current_active_admin
+from app.core.responses import FastResponseRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastResponseRoute)
 
 @router.post("/onboard")
 async def onboard_tenant_and_admin(
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from app.schemas.opportunity import OpportunityCreate, OpportunityUpdate, OpportunityInDB
 from app.services.opportunity_service import OpportunityService
 from app.core.deps import get_current_active_user, get_tenant_id
-from typing import List
+from app.core.responses import FastResponseRoute
+from app.utils.fields import FieldSelectionParams, parse_fields, selection_response
+from app.utils.pagination import CursorPage, CursorPaginationParams
+from app.utils.streaming import StreamFormat, streaming_response
+from typing import List, Optional
 
-router = APIRouter()
+router = APIRouter(route_class=FastResponseRoute)
 
 @router.post("/", response_model=OpportunityInDB)
 async def create_opportunity(
@@ -19,19 +23,43 @@ async def create_opportunity(
     opportunity.tenant_id = tenant_id
     return await opportunity_service.create_opportunity(opportunity)
 
+@router.get("/page", response_model=CursorPage[OpportunityInDB])
+async def list_opportunities_page(
+    account_id: str = None,
+    pagination: CursorPaginationParams = Depends(),
+    selection: FieldSelectionParams = Depends(),
+    current_user: dict = Depends(get_current_active_user),
+    tenant_id: str = Depends(get_tenant_id),
+    opportunity_service: OpportunityService = Depends()
+):
+    """
+    테넌트의 영업 기회 목록을 커서 기반 페이지네이션으로 조회 (선택적으로 특정 계정의 영업 기회만 조회, fields로 응답 필드 선택 가능)
+    account_id를 지정하면 테넌트의 영업 기회를 읽으며 필터링하므로 한 페이지가 size개보다 적거나 비어 있어도
+    next_cursor가 있으면 다음 페이지가 남아 있다 (next_cursor가 null일 때까지 이어서 조회).
+    """
+    fields = parse_fields(selection.fields, OpportunityInDB)
+    page = await opportunity_service.list_opportunities_page(tenant_id, account_id, pagination.size, pagination.cursor, pagination.include_total, fields)
+    if fields:
+        return selection_response(page)
+    return page
+
 @router.get("/{opportunity_id}", response_model=OpportunityInDB)
 async def get_opportunity(
     opportunity_id: str,
     current_user: dict = Depends(get_current_active_user),
     tenant_id: str = Depends(get_tenant_id),
+    selection: FieldSelectionParams = Depends(),
     opportunity_service: OpportunityService = Depends()
 ):
     """
-    특정 영업 기회 정보 조회
+    특정 영업 기회 정보 조회 (fields로 응답 필드 선택 가능)
     """
-    opportunity = await opportunity_service.get_opportunity(opportunity_id, tenant_id)
+    fields = parse_fields(selection.fields, OpportunityInDB)
+    opportunity = await opportunity_service.get_opportunity(opportunity_id, tenant_id, fields)
     if not opportunity:
         raise HTTPException(status_code=404, detail="Opportunity not found")
+    if fields:
+        return selection_response(opportunity)
     return opportunity
 
 @router.put("/{opportunity_id}", response_model=OpportunityInDB)
@@ -68,19 +96,28 @@ async def delete_opportunity(
 @router.get("/", response_model=List[OpportunityInDB])
 async def list_opportunities(
     account_id: str = None,
+    selection: FieldSelectionParams = Depends(),
+    stream: Optional[StreamFormat] = Query(None, description="전체 목록을 스트리밍으로 반환 (ndjson 또는 json 배열)"),
     current_user: dict = Depends(get_current_active_user),
     tenant_id: str = Depends(get_tenant_id),
     opportunity_service: OpportunityService = Depends()
 ):
     """
-    테넌트의 모든 영업 기회 목록 조회 (선택적으로 특정 계정의 영업 기회만 조회)
+    테넌트의 모든 영업 기회 목록 조회 (선택적으로 특정 계정의 영업 기회만 조회, fields로 응답 필드 선택 가능, stream으로 전체 목록 스트리밍)
     """
-    return await opportunity_service.list_opportunities(tenant_id, account_id)
+    fields = parse_fields(selection.fields, OpportunityInDB)
+    if stream:
+        return await streaming_response(opportunity_service.stream_opportunities(tenant_id, account_id, fields), stream)
+    items = [item async for page in opportunity_service.stream_opportunities(tenant_id, account_id, fields) for item in page]
+    if fields:
+        return selection_response(items)
+    return items
 
 @router.put("/{opportunity_id}/change-manager", response_model=OpportunityInDB)
 async def change_opportunity_manager(
     opportunity_id: str,
     new_manager_id: str,
+    version: Optional[int] = None,
     current_user: dict = Depends(get_current_active_user),
     tenant_id: str = Depends(get_tenant_id),
     opportunity_service: OpportunityService = Depends()
@@ -88,7 +125,7 @@ async def change_opportunity_manager(
     """
     영업 기회 담당자 변경
     """
-    opportunity = await opportunity_service.change_opportunity_manager(opportunity_id, tenant_id, new_manager_id)
+    opportunity = await opportunity_service.change_opportunity_manager(opportunity_id, tenant_id, new_manager_id, version)
     if not opportunity:
         raise HTTPException(status_code=404, detail="Opportunity not found")
     return opportunity
@@ -2,9 +2,10 @@ from fastapi import APIRouter, Depends, HTTPException
 from app.schemas.tenant import TenantCreate, TenantUpdate, TenantInDB
 from app.services.tenant_service import TenantService
 from app.core.deps import get_current_active_admin
+from app.core.responses import FastResponseRoute
 from typing import List
 
-router = APIRouter()
+router = APIRouter(route_class=FastResponseRoute)
 
 @router.post("/", response_model=TenantInDB)
 async def create_tenant(tenant: TenantCreate, current_admin: dict = Depends(get_current_active_admin), tenant_service: TenantService = Depends()):
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from app.schemas.user import UserCreate, UserUpdate, UserInDB
 from app.services.user_service import UserService
 from app.core.deps import get_current_active_user, get_current_active_admin
-from typing import List
+from app.core.responses import FastResponseRoute
+from app.utils.fields import FieldSelectionParams, parse_fields, select_fields, selection_response
+from app.utils.pagination import CursorPage, CursorPaginationParams
+from app.utils.streaming import StreamFormat, streaming_response
+from typing import List, Optional
 
-router = APIRouter()
+router = APIRouter(route_class=FastResponseRoute)
 
 @router.post("/", response_model=UserInDB)
 async def create_user(user: UserCreate, current_admin: dict = Depends(get_current_active_admin), user_service: UserService = Depends()):
@@ -27,14 +31,29 @@ async def update_current_user(user_update: UserUpdate, current_user: UserInDB =
     """
     return await user_service.update_user(current_user.user_id, current_user.tenant_id, user_update)
 
+@router.get("/page", response_model=CursorPage[UserInDB])
+async def list_users_page(pagination: CursorPaginationParams = Depends(), selection: FieldSelectionParams = Depends(), current_admin: dict = Depends(get_current_active_admin), user_service: UserService = Depends()):
+    """
+    테넌트의 사용자 목록을 커서 기반 페이지네이션으로 조회 (관리자 전용, fields로 응답 필드 선택 가능)
+    """
+    fields = parse_fields(selection.fields, UserInDB)
+    page = await user_service.list_users_page(current_admin.tenant_name, pagination.size, pagination.cursor, pagination.include_total, fields)
+    if fields:
+        return selection_response(page)
+    return page
+
 @router.get("/{user_id}", response_model=UserInDB)
-async def get_user(user_id: str, current_admin: dict = Depends(get_current_active_admin), user_service: UserService = Depends()):
+async def get_user(user_id: str, selection: FieldSelectionParams = Depends(), current_admin: dict = Depends(get_current_active_admin), user_service: UserService = Depends()):
     """
-    특정 사용자 정보 조회 (관리자 전용)
+    특정 사용자 정보 조회 (관리자 전용, fields로 응답 필드 선택 가능)
     """
+    fields = parse_fields(selection.fields, UserInDB)
     user = await user_service.get_user(user_id, current_admin.tenant_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
+    if fields:
+        # 사용자 조회는 동시 요청을 병합하는 전체 조회를 그대로 사용하고 응답만 줄인다
+        return selection_response(select_fields(user, fields, UserInDB))
     return user
 
 @router.put("/{user_id}", response_model=UserInDB)
@@ -58,8 +77,14 @@ async def delete_user(user_id: str, current_admin: dict = Depends(get_current_ac
     return {"message": "User successfully deleted"}
 
 @router.get("/", response_model=List[UserInDB])
-async def list_users(current_admin: dict = Depends(get_current_active_admin), user_service: UserService = Depends()):
+async def list_users(selection: FieldSelectionParams = Depends(), stream: Optional[StreamFormat] = Query(None, description="전체 목록을 스트리밍으로 반환 (ndjson 또는 json 배열)"), current_admin: dict = Depends(get_current_active_admin), user_service: UserService = Depends()):
     """
-    테넌트의 모든 사용자 목록 조회 (관리자 전용)
+    테넌트의 모든 사용자 목록 조회 (관리자 전용, fields로 응답 필드 선택 가능, stream으로 전체 목록 스트리밍)
     """
-    return await user_service.list_users(current_admin.tenant_id)
\ No newline at end of file
+    fields = parse_fields(selection.fields, UserInDB)
+    if stream:
+        return await streaming_response(user_service.stream_users(current_admin.tenant_name, fields), stream)
+    items = [item async for page in user_service.stream_users(current_admin.tenant_name, fields) for item in page]
+    if fields:
+        return selection_response(items)
+    return items
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+분석 집계 벤치마크: 행 단위(OpportunityInDB + 파이썬 루프) vs 컬럼 단위(OpportunityColumns)
+
+사용법:
+    python -m app.benchmarks.bench_analytics_columnar [--sizes 10000 100000 1000000] [--accounts 5000]
+"""
+import argparse
+import heapq
+from collections import defaultdict
+from app.benchmarks.fixtures import make_raw_items, timed
+from app.schemas.opportunity import OpportunityInDB
+from app.services.analytics_columnar import OpportunityColumns, get_numpy
+
+def row_based(items, account_ids, limit):
+    """
+    기존 방식: 항목마다 OpportunityInDB 생성 후 dict 루프로 집계
+    """
+    opportunities = [
+        OpportunityInDB(
+            opportunity_id=item["opportunity_id"]["S"],
+            tenant_id=item["tenant_id"]["S"],
+            account_id=item["account_id"]["S"],
+            name=item["name"]["S"],
+            stage=item["stage"]["S"],
+            expected_revenue=float(item["expected_revenue"]["N"]),
+            manager_id=item["manager_id"]["S"],
+            created_at=item["created_at"]["S"],
+            updated_at=item["updated_at"]["S"],
+            is_active=True,
+        )
+        for item in items
+    ]
+    pipeline = {}
+    revenue_by_account = defaultdict(float)
+    for opportunity in opportunities:
+        entry = pipeline.setdefault(opportunity.stage, {"count": 0, "total_expected_revenue": 0})
+        entry["count"] += 1
+        entry["total_expected_revenue"] += opportunity.expected_revenue
+        revenue_by_account[opportunity.account_id] += opportunity.expected_revenue
+    top = heapq.nlargest(limit, account_ids, key=lambda account_id: revenue_by_account.get(account_id, 0))
+    return pipeline, top
+
+def columnar(items, account_ids, limit):
+    """
+    컬럼 방식: 원시 항목을 바로 배열로 디코딩 후 벡터 연산으로 집계
+    """
+    columns = OpportunityColumns.from_raw_items(items)
+    pipeline = columns.stage_totals()
+    top = columns.top_accounts(account_ids, limit)
+    return pipeline, top
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Row-based vs columnar analytics aggregation")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--accounts", type=int, default=5_000)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    account_ids = [f"acc-{i}" for i in range(args.accounts)]
+    print(f"numpy: {'yes' if get_numpy() is not None else 'no (pure-python fallback)'}")
+    print(f"{'rows':>10} {'row-based (s)':>14} {'columnar (s)':>13} {'speedup':>8}")
+    for rows in args.sizes:
+        items = make_raw_items(rows, args.accounts)
+        baseline = timed(row_based, items, account_ids, args.limit, repeat=args.repeat)
+        vectorized = timed(columnar, items, account_ids, args.limit, repeat=args.repeat)
+        print(f"{rows:>10} {baseline:>14.3f} {vectorized:>13.3f} {baseline / vectorized:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+내보내기 벤치마크: 영업 기회 CSV/NDJSON 내보내기 (계정 이름 조인, gzip 유무)의 처리량과 최대 메모리
+
+DynamoDB 조회는 페이지마다 합성 원시 항목을 만드는 것으로 대신하고, 응답 본문은 버린다.
+처리량은 tracemalloc 없이, 최대 할당량은 tracemalloc을 켜고 따로 측정한다.
+
+사용법:
+    python -m app.benchmarks.bench_export [--rows 1000000] [--page-size 1000]
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from app.benchmarks.fixtures import fetch_page, make_items
+from app.services.export_service import ACCOUNT_NAME_COLUMN, ExportService
+from app.services.raw_records import OpportunityRecord
+from app.utils.streaming import ExportFormat, encode_export
+
+async def export(template, account_names, rows: int, page_size: int, export_format: ExportFormat, compress: bool) -> int:
+    async def pages():
+        for start in range(0, rows, page_size):
+            yield join(fetch_page(template, start, min(page_size, rows - start)))
+
+    def join(items):
+        page = [OpportunityRecord.to_dict(item) for item in items]
+        for row in page:
+            row[ACCOUNT_NAME_COLUMN] = account_names.get(row["account_id"])
+        return page
+
+    chunks = encode_export(pages(), export_format, ExportService.opportunity_columns(include_account_name=True), compress)
+    sent = 0
+    async for chunk in chunks:
+        sent += len(chunk)
+    return sent
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Opportunity export throughput and peak memory")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--page-size", type=int, default=1_000)
+    args = parser.parse_args(argv)
+
+    template = make_items(args.page_size, 500)
+    account_names = {item["account_id"]["S"]: f"Account {i}" for i, item in enumerate(template)}
+    print(f"{args.rows} rows")
+    print(f"{'format':>8} {'gzip':>5} {'rows/s':>10} {'MB sent':>8} {'peak MB':>8}")
+    for export_format in ExportFormat:
+        for compress in (False, True):
+            run = lambda: asyncio.run(export(template, account_names, args.rows, args.page_size, export_format, compress))
+            started = time.perf_counter()
+            sent = run()
+            elapsed = time.perf_counter() - started
+            tracemalloc.start()
+            try:
+                run()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            print(f"{export_format.value:>8} {'yes' if compress else 'no':>5} {args.rows / elapsed:>10,.0f} {sent / 1e6:>8.1f} {peak / (1024 * 1024):>8.1f}")
+
+if __name__ == "__main__":
+    main()
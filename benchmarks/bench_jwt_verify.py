@@ -0,0 +1,108 @@
+"""
+JWT 검증 벤치마크: 기존 방식(헤더/서명/클레임 개별 파싱) vs CognitoTokenVerifier (한 번 파싱, 검증 LRU)
+
+사용법:
+    python -m app.benchmarks.bench_jwt_verify [--tokens 1000] [--repeat 3]
+"""
+import argparse
+import asyncio
+import time
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+from jose.utils import base64url_decode
+from app.core.token_verifier import CognitoTokenVerifier
+
+ISSUER = "https://cognito-idp.ap-northeast-2.amazonaws.com/bench-pool"
+CLIENT_ID = "bench-client"
+
+def make_keys():
+    """
+    벤치마크용 RSA 키 쌍과 kid별 공개 키 객체 생성
+    """
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    return private_pem, {"bench-kid": jwk.construct(public_pem, "RS256")}
+
+def make_tokens(private_pem: str, count: int):
+    now = int(time.time())
+    return [
+        jwt.encode(
+            {
+                "sub": f"user-{i}",
+                "iss": ISSUER,
+                "client_id": CLIENT_ID,
+                "token_use": "access",
+                "iat": now,
+                "exp": now + 3600,
+                "jti": f"jti-{i}",
+            },
+            private_pem,
+            algorithm="RS256",
+            headers={"kid": "bench-kid"},
+        )
+        for i in range(count)
+    ]
+
+def legacy_verify(token: str, keys):
+    """
+    기존 방식: 헤더, 서명, 클레임을 각각 다시 파싱하여 검증
+    """
+    headers = jwt.get_unverified_headers(token)
+    key = keys[headers["kid"]]
+    message, encoded_signature = token.rsplit(".", 1)
+    decoded_signature = base64url_decode(encoded_signature.encode())
+    if not key.verify(message.encode(), decoded_signature):
+        raise ValueError("Signature verification failed")
+    claims = jwt.get_unverified_claims(token)
+    if time.time() > claims["exp"]:
+        raise ValueError("Token is expired")
+    return claims
+
+async def run_verifier(verifier: CognitoTokenVerifier, tokens) -> None:
+    for token in tokens:
+        await verifier.verify(token)
+
+def timed(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="JWT verification throughput (single core)")
+    parser.add_argument("--tokens", type=int, default=1000, help="서로 다른 토큰 수")
+    parser.add_argument("--requests-per-token", type=int, default=20, help="토큰당 반복 검증 횟수 (캐시 적중 측정용)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    private_pem, keys = make_keys()
+    tokens = make_tokens(private_pem, args.tokens)
+
+    async def key_provider(kid):
+        return keys[kid]
+
+    def verifier(cache_size):
+        return CognitoTokenVerifier(key_provider, issuer=ISSUER, client_id=CLIENT_ID, cache_size=cache_size)
+
+    workload = tokens * args.requests_per_token
+    cases = [
+        ("legacy (unique tokens)", tokens, lambda: [legacy_verify(token, keys) for token in tokens]),
+        ("parse-once, no cache (unique tokens)", tokens, lambda: asyncio.run(run_verifier(verifier(0), tokens))),
+        ("legacy (repeated tokens)", workload, lambda: [legacy_verify(token, keys) for token in workload]),
+        ("parse-once + LRU (repeated tokens)", workload, lambda: asyncio.run(run_verifier(verifier(args.tokens), workload))),
+    ]
+    print(f"{'case':<40} {'verifications/s':>16}")
+    for name, items, func in cases:
+        elapsed = timed(func, args.repeat)
+        print(f"{name:<40} {len(items) / elapsed:>16,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+목록 응답 벤치마크: response_model 검증 + jsonable_encoder + json (FastAPI 기본) vs FastResponseRoute + orjson
+
+네트워크 없이 ASGI 앱을 직접 호출하여 요청당 CPU 시간(process_time)을 1,000행 기준으로 측정한다.
+서비스 단계(원시 항목 -> 응답 dict -> CursorPage)는 두 경우 모두 포함한다.
+
+사용법:
+    python -m app.benchmarks.bench_list_response [--rows 1000 10000] [--requests 20]
+"""
+import argparse
+import asyncio
+import time
+from typing import Any, Dict
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from app.benchmarks.fixtures import make_items
+from app.core.responses import FastJSONResponse, FastResponseRoute, get_orjson, trusted_endpoint
+from app.schemas.opportunity import OpportunityInDB
+from app.services.raw_records import OpportunityRecord
+from app.utils.pagination import CursorPage
+
+def build_app(items, route_class, response_class) -> FastAPI:
+    async def list_opportunities():
+        return CursorPage[Dict[str, Any]].construct(
+            items=[OpportunityRecord.to_dict(item) for item in items],
+            size=len(items)
+        )
+
+    router = APIRouter(route_class=route_class)
+    if route_class is FastResponseRoute:
+        # 설정(RESPONSE_VALIDATION)과 무관하게 신뢰 경로로 등록
+        router.add_api_route("/", trusted_endpoint(list_opportunities), response_model=CursorPage[OpportunityInDB], route_class_override=APIRoute)
+    else:
+        router.add_api_route("/", list_opportunities, response_model=CursorPage[OpportunityInDB])
+    app = FastAPI(default_response_class=response_class)
+    app.include_router(router)
+    return app
+
+async def call(app: FastAPI) -> bytes:
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http", "path": "/",
+        "raw_path": b"/", "root_path": "", "query_string": b"", "headers": [], "server": ("bench", 80), "client": ("bench", 1)
+    }
+    body = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+async def measure(app: FastAPI, requests: int) -> float:
+    """
+    요청당 CPU 시간 (초, 최솟값)
+    """
+    await call(app)  # 라우트/스키마 캐시 준비
+    best = float("inf")
+    for _ in range(requests):
+        started = time.process_time()
+        await call(app)
+        best = min(best, time.process_time() - started)
+    return best
+
+async def run(rows_list, requests: int):
+    print(f"orjson: {'yes' if get_orjson() is not None else 'no (json fallback)'}")
+    print(f"{'rows':>8} {'validated ms/1k':>16} {'trusted ms/1k':>14} {'speedup':>8}")
+    for rows in rows_list:
+        items = make_items(rows, max(1, rows // 20))
+        validated = build_app(items, APIRoute, JSONResponse)
+        trusted = build_app(items, FastResponseRoute, FastJSONResponse)
+        assert await call(validated) == await call(trusted)
+        baseline = await measure(validated, requests)
+        fast = await measure(trusted, requests)
+        print(f"{rows:>8} {baseline * 1e6 / rows:>16.2f} {fast * 1e6 / rows:>14.2f} {baseline / fast:>7.1f}x")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validated vs trusted list response serialization")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args(argv)
+    asyncio.run(run(args.rows, args.requests))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+대량 조회 디코딩 벤치마크: PynamoDB 모델 + OpportunityInDB 생성 vs 원시 항목 레코드(__slots__) / 응답 dict 디코딩
+
+단일 스레드에서 측정하므로 결과는 코어당 처리량(rows/s)이다.
+
+사용법:
+    python -m app.benchmarks.bench_raw_records [--rows 100000] [--repeat 3]
+"""
+import argparse
+from app.benchmarks.fixtures import make_items, timed
+from app.models.opportunity import OpportunityModel
+from app.schemas.opportunity import OpportunityInDB
+from app.services.raw_records import OpportunityRecord
+from app.utils.item_updates import current_version
+
+def hydrated(items):
+    """
+    기존 방식: 항목마다 PynamoDB 모델 역직렬화 후 OpportunityInDB 생성 (행마다 객체 두 개)
+    """
+    opportunities = [OpportunityModel.from_raw_data(item) for item in items]
+    return [
+        OpportunityInDB(
+            opportunity_id=opportunity.opportunity_id,
+            tenant_id=opportunity.tenant_id,
+            account_id=opportunity.account_id,
+            name=opportunity.name,
+            stage=opportunity.stage,
+            expected_revenue=opportunity.expected_revenue,
+            manager_id=opportunity.manager_id,
+            created_at=opportunity.created_at,
+            updated_at=opportunity.updated_at,
+            is_active=opportunity.is_active,
+            version=current_version(opportunity)
+        )
+        for opportunity in opportunities
+    ]
+
+def records(items):
+    """
+    원시 항목을 __slots__ 레코드로 바로 디코딩 (list_* / 분석 경로)
+    """
+    return OpportunityRecord.from_items(items)
+
+def dicts(items):
+    """
+    원시 항목을 응답용 dict로 바로 디코딩 (list_*_page 경로)
+    """
+    return [OpportunityRecord.to_dict(item) for item in items]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Model hydration vs raw-item record decoding")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--accounts", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    items = make_items(args.rows, args.accounts)
+    # 세 경로가 같은 값을 만드는지 먼저 확인
+    expected = hydrated(items[:100])
+    assert [OpportunityInDB(**record.dict()) for record in records(items[:100])] == expected
+    assert [OpportunityInDB(**row) for row in dicts(items[:100])] == expected
+
+    baseline = timed(hydrated, items, repeat=args.repeat)
+    print(f"rows: {args.rows}")
+    print(f"{'decoder':>28} {'seconds':>8} {'rows/s/core':>12} {'speedup':>8}")
+    for label, func in (("model + OpportunityInDB", hydrated), ("OpportunityRecord", records), ("response dict", dicts)):
+        elapsed = baseline if func is hydrated else timed(func, items, repeat=args.repeat)
+        print(f"{label:>28} {elapsed:>8.3f} {args.rows / elapsed:>12,.0f} {baseline / elapsed:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
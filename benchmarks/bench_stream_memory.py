@@ -0,0 +1,66 @@
+"""
+목록 응답 메모리 벤치마크: 전체 목록 + 전체 JSON 본문 생성 vs 페이지 단위 스트리밍 (NDJSON / JSON 배열)
+
+tracemalloc으로 응답 생성 중 최대 할당량을 측정한다. DynamoDB 조회는 페이지마다 합성 원시 항목을 만드는 것으로 대신한다.
+
+사용법:
+    python -m app.benchmarks.bench_stream_memory [--rows 10000 50000 150000] [--page-size 1000]
+"""
+import argparse
+import asyncio
+import tracemalloc
+from app.benchmarks.fixtures import fetch_page, make_items
+from app.core.responses import dumps
+from app.services.raw_records import OpportunityRecord
+from app.utils.streaming import StreamFormat, encode_stream
+
+def buffered(template, rows: int, page_size: int) -> int:
+    """
+    기존 방식: 모든 페이지를 모아 전체 목록과 전체 JSON 본문을 만든 뒤 응답
+    """
+    items = []
+    for start in range(0, rows, page_size):
+        items.extend(fetch_page(template, start, min(page_size, rows - start)))
+    body = dumps([OpportunityRecord.to_dict(item) for item in items])
+    return len(body)
+
+async def streamed(template, rows: int, page_size: int, stream_format: StreamFormat) -> int:
+    """
+    스트리밍 방식: 페이지를 읽는 대로 인코딩하여 청크 전송 (전송한 청크는 버림)
+    """
+    async def pages():
+        for start in range(0, rows, page_size):
+            yield [OpportunityRecord.to_dict(item) for item in fetch_page(template, start, min(page_size, rows - start))]
+
+    sent = 0
+    async for chunk in encode_stream(pages(), stream_format):
+        sent += len(chunk)
+    return sent
+
+def peak_mb(func, *args) -> float:
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        if asyncio.iscoroutine(result):
+            asyncio.run(result)
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Buffered vs streaming list response memory")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 50_000, 150_000])
+    parser.add_argument("--page-size", type=int, default=1_000)
+    args = parser.parse_args(argv)
+
+    template = make_items(args.page_size, 500)
+    print(f"{'rows':>8} {'buffered MB':>12} {'ndjson MB':>10} {'json array MB':>14}")
+    for rows in args.rows:
+        print(
+            f"{rows:>8} {peak_mb(buffered, template, rows, args.page_size):>12.1f}"
+            f" {peak_mb(streamed, template, rows, args.page_size, StreamFormat.NDJSON):>10.1f}"
+            f" {peak_mb(streamed, template, rows, args.page_size, StreamFormat.JSON):>14.1f}"
+        )
+
+if __name__ == "__main__":
+    main()
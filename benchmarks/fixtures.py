@@ -0,0 +1,59 @@
+"""
+벤치마크 공용 합성 데이터와 측정 도구 (DynamoDB Query 응답 형식의 원시 항목)
+"""
+import random
+import time
+from datetime import datetime, timezone
+from pynamodb.attributes import UTCDateTimeAttribute
+from app.services.analytics_columnar import STAGES
+
+def make_raw_items(rows: int, accounts: int, managers: int = 200):
+    """
+    DynamoDB Query 응답 형식의 합성 영업 기회 항목 생성
+    """
+    random.seed(rows)
+    now = datetime.utcnow().isoformat() + "000+0000"
+    return [
+        {
+            "opportunity_id": {"S": f"opp-{i}"},
+            "tenant_id": {"S": "bench-tenant"},
+            "account_id": {"S": f"acc-{random.randrange(accounts)}"},
+            "name": {"S": f"Opportunity {i}"},
+            "stage": {"S": random.choice(STAGES).value},
+            "expected_revenue": {"N": str(random.randrange(100, 1_000_000))},
+            "manager_id": {"S": f"mgr-{random.randrange(managers)}"},
+            "created_at": {"S": now},
+            "updated_at": {"S": now},
+            "is_active": {"N": "1"},
+        }
+        for i in range(rows)
+    ]
+
+def make_items(rows: int, accounts: int):
+    """
+    합성 영업 기회 원시 항목 (모델 역직렬화가 가능하도록 날짜는 PynamoDB 저장 형식, 일부는 version 포함)
+    """
+    now = {"S": UTCDateTimeAttribute().serialize(datetime.now(timezone.utc))}
+    items = make_raw_items(rows, accounts)
+    for i, item in enumerate(items):
+        item["created_at"] = item["updated_at"] = now
+        if i % 2:
+            item["version"] = {"N": str(i % 7 + 1)}
+    return items
+
+def fetch_page(template, start: int, count: int):
+    """
+    DynamoDB 페이지 하나 분량의 원시 항목 (항목마다 새 dict)
+    """
+    return [
+        dict(template[i % len(template)], opportunity_id={"S": f"opp-{start + i}"})
+        for i in range(count)
+    ]
+
+def timed(func, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
@@ -0,0 +1,98 @@
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from botocore.config import Config
+from app.core.startup import startup
+
+# 커넥션 풀 / 재시도 설정 (설정 로드 이전에도 사용되므로 환경 변수로 구성)
+AWS_MAX_POOL_CONNECTIONS = int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "64"))
+AWS_RETRY_MODE = os.getenv("AWS_RETRY_MODE", "standard")
+AWS_MAX_ATTEMPTS = int(os.getenv("AWS_MAX_ATTEMPTS", "3"))
+AWS_TCP_KEEPALIVE = os.getenv("AWS_TCP_KEEPALIVE", "true").lower() == "true"
+AWS_CONNECT_TIMEOUT = float(os.getenv("AWS_CONNECT_TIMEOUT", "5"))
+AWS_READ_TIMEOUT = float(os.getenv("AWS_READ_TIMEOUT", "10"))
+
+_lock = threading.Lock()
+_session: Optional["boto3.session.Session"] = None
+_clients: Dict[Tuple[str, Optional[str]], Any] = {}
+# boto3 리소스 객체는 스레드 안전하지 않으므로 스레드별로 캐시
+_local = threading.local()
+_generation = 0  # reset_clients 호출 시 증가하여 다른 스레드의 리소스 캐시도 무효화
+
+def get_client_config() -> Config:
+    """
+    공유 클라이언트에 적용할 botocore 설정 생성
+    :return: botocore Config 객체
+    """
+    return Config(
+        max_pool_connections=AWS_MAX_POOL_CONNECTIONS,
+        retries={"mode": AWS_RETRY_MODE, "max_attempts": AWS_MAX_ATTEMPTS},
+        tcp_keepalive=AWS_TCP_KEEPALIVE,
+        connect_timeout=AWS_CONNECT_TIMEOUT,
+        read_timeout=AWS_READ_TIMEOUT
+    )
+
+def get_session() -> "boto3.session.Session":
+    """
+    프로세스 공유 boto3 세션 가져오기 (최초 호출 시 생성)
+    :return: boto3 Session 객체
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                import boto3  # 첫 사용 시 import (시작 시간 단축)
+                _session = boto3.session.Session()
+    return _session
+
+def get_client(service_name: str, region_name: Optional[str] = None) -> Any:
+    """
+    서비스/리전별 공유 boto3 클라이언트 가져오기
+    클라이언트는 스레드 안전하며 커넥션 풀을 재사용한다.
+    :param service_name: AWS 서비스 이름 (예: 'ssm', 'cognito-idp', 'dynamodb')
+    :param region_name: 리전 이름 (None이면 기본 자격 증명 체인의 리전 사용)
+    :return: boto3 클라이언트
+    """
+    key = (service_name, region_name)
+    client = _clients.get(key)
+    if client is None:
+        session = get_session()
+        with _lock:
+            client = _clients.get(key)
+            if client is None:
+                started = time.perf_counter()
+                client = session.client(service_name, region_name=region_name, config=get_client_config())
+                startup.record_lazy(f"client:{service_name}", time.perf_counter() - started)
+                _clients[key] = client
+    return client
+
+def get_resource(service_name: str, region_name: Optional[str] = None) -> Any:
+    """
+    현재 스레드용 boto3 리소스 가져오기
+    :param service_name: AWS 서비스 이름
+    :param region_name: 리전 이름
+    :return: boto3 리소스
+    """
+    resources = getattr(_local, "resources", None)
+    if resources is None or getattr(_local, "generation", None) != _generation:
+        resources = _local.resources = {}
+        _local.generation = _generation
+    key = (service_name, region_name)
+    resource = resources.get(key)
+    if resource is None:
+        session = get_session()
+        with _lock:
+            resource = session.resource(service_name, region_name=region_name, config=get_client_config())
+        resources[key] = resource
+    return resource
+
+def reset_clients() -> None:
+    """
+    캐시된 세션과 클라이언트를 모두 폐기 (fork 이후 또는 테스트용)
+    """
+    global _session, _generation
+    with _lock:
+        _session = None
+        _clients.clear()
+        _generation += 1
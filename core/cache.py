@@ -0,0 +1,338 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, ValidationError
+from typing import Any, Dict, Hashable, Optional, Tuple, Type
+from app.core.config import settings
+from app.core.shared_cache import SharedCache, open_shared_cache
+from app.schemas.user import UserInDB
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+class TTLCache:
+    """
+    크기 제한(LRU)과 항목별 만료 시간(TTL)을 가진 프로세스 내 캐시
+    """
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        캐시 값 조회 (없거나 만료되었으면 default)
+        """
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        캐시 값 저장
+        :param ttl: 항목별 만료 시간(초) - 없으면 캐시 기본값 사용
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+def get_shared_cache() -> Optional[SharedCache]:
+    """
+    노드 공유 캐시 (SHARED_CACHE_FILE이 설정되지 않았거나 열 수 없으면 None)
+    """
+    if not settings.SHARED_CACHE_FILE:
+        return None
+    try:
+        return open_shared_cache(settings.SHARED_CACHE_FILE)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Shared cache %s unavailable: %s", settings.SHARED_CACHE_FILE, e)
+        return None
+
+class TieredCache:
+    """
+    2단 캐시: 프로세스 내 LRU(TTLCache) -> 노드 공유 캐시(SharedCache)
+    로컬에 없으면 공유 캐시에서 읽어 로컬에 채우고, 저장은 두 단계 모두에 한다.
+    공유 캐시 오류는 캐시 미스로 처리한다.
+    :param namespace: 공유 캐시 키 접두사
+    """
+    def __init__(self, namespace: str, maxsize: int = 1024, ttl: float = 60.0, shared: Optional[SharedCache] = None):
+        self.namespace = namespace
+        self.local = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.shared = shared
+
+    def _shared_key(self, key: Hashable) -> str:
+        return f"{self.namespace}:{key!r}"
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if self.shared is not None:
+            try:
+                value = self.shared.get(self._shared_key(key), _MISSING)
+            except sqlite3.Error as e:
+                logger.warning("Shared cache read failed: %s", e)
+                value = _MISSING
+            if value is not _MISSING:
+                self.local.set(key, value)
+                return value
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        self.local.set(key, value, ttl)
+        if self.shared is not None:
+            try:
+                self.shared.set(self._shared_key(key), value, self.local.ttl if ttl is None else ttl)
+            except sqlite3.Error as e:
+                logger.warning("Shared cache write failed: %s", e)
+
+    def delete(self, key: Hashable) -> None:
+        self.local.delete(key)
+        if self.shared is not None:
+            try:
+                self.shared.delete(self._shared_key(key))
+            except sqlite3.Error as e:
+                logger.warning("Shared cache delete failed: %s", e)
+
+    def clear(self) -> None:
+        self.local.clear()
+        if self.shared is not None:
+            try:
+                self.shared.delete_prefix(f"{self.namespace}:")
+            except sqlite3.Error as e:
+                logger.warning("Shared cache clear failed: %s", e)
+
+    def __len__(self) -> int:
+        return len(self.local)
+
+def make_cache(namespace: str, maxsize: int, ttl: float) -> TieredCache:
+    """
+    설정에 따라 공유 캐시를 2단계로 사용하는 캐시 생성
+    :param namespace: 공유 캐시 키 접두사
+    :param maxsize: 프로세스 내 LRU 크기
+    :param ttl: 항목 유지 시간 (초)
+    """
+    return TieredCache(namespace, maxsize=maxsize, ttl=ttl, shared=get_shared_cache())
+
+class SharedCounters:
+    """
+    이름별 정수 카운터 (공유 캐시가 있으면 노드의 모든 워커가 같은 값을 봄)
+    공유 카운터 조회 결과는 local_ttl 동안 프로세스 내에 보관하며, 자신이 증가시킨 값은 즉시 반영된다.
+    다른 워커의 증가가 보이기까지의 최대 지연 시간은 local_ttl이다.
+    """
+    def __init__(self, namespace: str, shared: Optional[SharedCache] = None, local_ttl: float = 1.0):
+        self.namespace = namespace
+        self.shared = shared
+        self._local = TTLCache(maxsize=100000, ttl=local_ttl)
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.prefix = os.urandom(4).hex()
+        if shared is not None:
+            try:
+                self.prefix = shared.instance_id
+            except sqlite3.Error as e:
+                logger.warning("Shared counters unavailable, using process-local values: %s", e)
+                self.shared = None
+
+    def get(self, name: str) -> int:
+        if self.shared is None:
+            return self._counts.get(name, 0)
+        value = self._local.get(name)
+        if value is None:
+            try:
+                value = self.shared.counter(f"{self.namespace}:{name}")
+            except sqlite3.Error as e:
+                logger.warning("Shared counter read failed: %s", e)
+                return self._counts.get(name, 0)
+            self._local.set(name, value)
+        return value
+
+    def incr(self, name: str) -> int:
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + 1
+            value = self._counts[name]
+        if self.shared is not None:
+            try:
+                value = self.shared.incr(f"{self.namespace}:{name}")
+            except sqlite3.Error as e:
+                logger.warning("Shared counter increment failed: %s", e)
+            self._local.set(name, value)
+        return value
+
+class TenantVersions:
+    """
+    테넌트별 데이터 버전 카운터
+    계정/영업 기회 쓰기 시 증가시키며, 캐시 키와 ETag에 포함하여 쓰기 즉시 무효화되도록 한다.
+    공유 캐시가 설정되면 버전을 노드의 워커들이 공유하므로 다른 워커의 쓰기도 SHARED_CACHE_LOCAL_TTL_SECONDS 이내에 반영된다.
+    재시작 후 이전 ETag와 충돌하지 않도록 버전 문자열에 프로세스(공유 시 공유 캐시 파일) 고유 접두사를 붙인다.
+    """
+    def __init__(self, counters: Optional[SharedCounters] = None):
+        self._counters = counters or SharedCounters("tenant_version")
+
+    def get(self, tenant_id: str) -> str:
+        """
+        테넌트의 현재 데이터 버전
+        """
+        return f"{self._counters.prefix}.{self._counters.get(tenant_id)}"
+
+    def bump(self, tenant_id: str) -> str:
+        """
+        테넌트의 데이터 버전 증가
+        :return: 증가된 버전
+        """
+        return f"{self._counters.prefix}.{self._counters.incr(tenant_id)}"
+
+tenant_versions = TenantVersions(
+    SharedCounters("tenant_version", shared=get_shared_cache(), local_ttl=settings.SHARED_CACHE_LOCAL_TTL_SECONDS)
+)
+
+class PrincipalCache:
+    """
+    인증된 주체(검증된 JWT 클레임 + 사용자 정보) 캐시
+    토큰 해시를 키로 토큰 만료 시각까지 보관하며 LRU 방식으로 크기를 제한한다.
+    사용자 정보가 변경되면 invalidate_user로 해당 사용자의 항목을 폐기한다.
+    공유 캐시가 주어지면 주체를 워커 간에 공유하고, 사용자별 무효화 스탬프를 비교하여
+    다른 워커에서 일어난 무효화도 반영한다.
+    공유 캐시에는 사용자 정보를 JSON 호환 dict로 저장하고, 읽을 때 user_model로 다시 만든다.
+    """
+    def __init__(self, maxsize: int = 10000, max_ttl: float = 300.0, shared: Optional[SharedCache] = None,
+                 local_ttl: float = 1.0, user_model: Optional[Type[BaseModel]] = None):
+        self.maxsize = maxsize
+        self.max_ttl = max_ttl
+        self.shared = shared
+        self.user_model = user_model
+        self._stamps = SharedCounters("principal_user", shared=shared, local_ttl=local_ttl) if shared is not None else None
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 무효화 횟수 - 조회 중 무효화가 일어났으면 조회 결과를 캐시하지 않기 위해 사용
+        self.generation = 0
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _stamp(self, claims: Dict[str, Any]) -> int:
+        return 0 if self._stamps is None else self._stamps.get(str(claims.get("sub")))
+
+    def _get_shared(self, key: str) -> Optional[tuple]:
+        try:
+            entry = self.shared.get(f"principal:{key}")
+        except sqlite3.Error as e:
+            logger.warning("Shared cache read failed: %s", e)
+            return None
+        if entry is None:
+            return None
+        claims, user, expires_at, stamp = entry
+        if self.user_model is not None:
+            try:
+                user = self.user_model.parse_obj(user)
+            except ValidationError:
+                return None
+        return claims, user, expires_at, stamp
+
+    def get(self, token: str) -> Optional[Tuple[Dict[str, Any], Any]]:
+        """
+        토큰의 캐시된 (클레임, 사용자) 조회
+        :param token: 액세스 토큰
+        :return: (클레임, 사용자) 또는 None
+        """
+        key = self._key(token)
+        with self._lock:
+            entry = self._data.get(key)
+        if entry is None and self.shared is not None:
+            entry = self._get_shared(key)
+        if entry is None:
+            return None
+        claims, user, expires_at, stamp = entry
+        if expires_at <= time.time() or stamp != self._stamp(claims):
+            with self._lock:
+                self._data.pop(key, None)
+            return None
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return claims, user
+
+    def set(self, token: str, claims: Dict[str, Any], user: Any, generation: int) -> None:
+        """
+        검증된 주체 저장 (토큰 만료 시각과 max_ttl 중 이른 시각까지)
+        :param token: 액세스 토큰
+        :param claims: 검증된 클레임 (exp 포함)
+        :param user: 사용자 정보
+        :param generation: 조회를 시작할 때의 generation 값
+        """
+        now = time.time()
+        expires_at = min(float(claims["exp"]), now + self.max_ttl)
+        key = self._key(token)
+        entry = (claims, user, expires_at, self._stamp(claims))
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._data[key] = entry
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        if self.shared is not None and expires_at > now:
+            try:
+                shared_user = jsonable_encoder(user) if self.user_model is not None else user
+                self.shared.set(f"principal:{key}", (claims, shared_user, expires_at, entry[3]), expires_at - now)
+            except sqlite3.Error as e:
+                logger.warning("Shared cache write failed: %s", e)
+
+    def invalidate_user(self, user_id: str, tenant_id: Optional[str] = None) -> None:
+        """
+        사용자의 캐시된 주체를 모두 폐기
+        :param user_id: 사용자 ID (클레임의 sub)
+        :param tenant_id: 테넌트 ID (주어지면 해당 테넌트의 항목만 폐기 - 공유 캐시는 사용자 단위로 폐기)
+        """
+        with self._lock:
+            self.generation += 1
+            for key in [
+                key for key, (claims, _, _, _) in self._data.items()
+                if claims.get("sub") == user_id and (tenant_id is None or claims.get("custom:tenant_id") == tenant_id)
+            ]:
+                del self._data[key]
+        if self._stamps is not None:
+            self._stamps.incr(user_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    max_ttl=settings.PRINCIPAL_CACHE_MAX_TTL_SECONDS,
+    shared=get_shared_cache(),
+    local_ttl=settings.SHARED_CACHE_LOCAL_TTL_SECONDS,
+    user_model=UserInDB
+)
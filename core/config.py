@@ -1,7 +1,33 @@
-import boto3
 from botocore.exceptions import ClientError
+from app.core.aws_clients import get_client
+from app.core.shared_cache import open_shared_cache
+from app.core.startup import startup
 from pydantic import BaseSettings, AnyHttpUrl
 from typing import Any, Dict, Optional, List
+import asyncio
+import json
+import os
+import sqlite3
+import time
+
+PARAMETER_PATH_PREFIX = "/crm-saas/"
+
+# 설정 속성 -> Parameter Store 파라미터 이름
+PARAMETERS = {
+    "AWS_REGION": "/crm-saas/aws/region",
+    "COGNITO_USER_POOL_ID": "/crm-saas/cognito/user_pool_id",
+    "COGNITO_APP_CLIENT_ID": "/crm-saas/cognito/app_client_id",
+    "DYNAMODB_TENANT_TABLE": "/crm-saas/dynamodb/tenants_table",
+    "DYNAMODB_USER_TABLE": "/crm-saas/dynamodb/users_table",
+    "DYNAMODB_ACCOUNT_TABLE": "/crm-saas/dynamodb/accounts_table",
+    "DYNAMODB_OPPORTUNITY_TABLE": "/crm-saas/dynamodb/opportunities_table",
+    "DYNAMODB_TENANT_STATS_TABLE": "/crm-saas/dynamodb/tenant_stats_table",
+    "JWT_SECRET_KEY": "/crm-saas/jwt/secret_key",
+    "PROJECT_NAME": "/crm-saas/app/project_name",
+    "ALLOWED_ORIGINS": "/crm-saas/app/allowed_origins",  # 이 줄을 추가했습니다
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "/crm-saas/cognito/access_token_expire_minutes",
+    "JWT_ALGORITHM": "/crm-saas/cognito/jwt_algorithm"
+}
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "CRM SaaS"
@@ -13,14 +39,59 @@ class Settings(BaseSettings):
     DYNAMODB_USER_TABLE: Optional[str] = None
     DYNAMODB_ACCOUNT_TABLE: Optional[str] = None
     DYNAMODB_OPPORTUNITY_TABLE: Optional[str] = None
+    DYNAMODB_TENANT_STATS_TABLE: Optional[str] = None
     JWT_SECRET_KEY: Optional[str] = None
     ALLOWED_ORIGINS: List[AnyHttpUrl] = []  # 이 줄을 추가했습니다
     ACCESS_TOKEN_EXPIRE_MINUTES: Optional[int] = None
     JWT_ALGORITHM: Optional[str] = None
+    PAGINATION_CURSOR_SECRET: Optional[str] = None  # 미설정 시 JWT_SECRET_KEY 사용
+    PAGINATION_FILTER_READ_SIZE: int = 100  # 필터가 있는 목록 페이지 조회에서 요청당 평가할 항목 수
+    PAGINATION_FILTER_MAX_EVALUATED: int = 1000  # 필터가 있는 목록 페이지 하나를 채우기 위해 평가할 최대 항목 수
+    DYNAMODB_EXECUTOR_MAX_WORKERS: int = 64  # DynamoDB 호출 전용 스레드 풀 크기
+    DYNAMODB_TABLE_CONCURRENCY: int = 32  # 테이블별 최대 동시 요청 수
+    TRANSACTION_MAX_ATTEMPTS: int = 5  # 다른 트랜잭션과 충돌(TransactionConflict)한 쓰기 트랜잭션의 최대 시도 횟수
+    TRANSACTION_RETRY_BASE_DELAY_SECONDS: float = 0.02  # 트랜잭션 재시도 백오프 기본 간격 (시도마다 2배)
+    ANALYTICS_TOP_ACCOUNTS_MAX_LIMIT: int = 100  # 상위 계정 조회 limit 최대값
+    ANALYTICS_SNAPSHOT_TTL_SECONDS: float = 5.0  # 분석용 테넌트 스냅샷 재사용 시간
+    ANALYTICS_SNAPSHOT_CACHE_SIZE: int = 256  # 캐시할 테넌트 스냅샷 최대 개수
+    ANALYTICS_CACHE_TTL_SECONDS: float = 30.0  # 분석 결과 캐시 유지 시간
+    ANALYTICS_CACHE_SIZE: int = 4096  # 캐시할 분석 결과 최대 개수
+    PRINCIPAL_CACHE_SIZE: int = 10000  # 캐시할 인증 주체(토큰) 최대 개수
+    PRINCIPAL_CACHE_MAX_TTL_SECONDS: float = 300.0  # 토큰 만료 전이라도 인증 주체를 다시 조회하는 주기
+    COGNITO_JWKS_URL: Optional[str] = None  # 미설정 시 사용자 풀의 JWKS URL 사용
+    COGNITO_JWKS_FILE: Optional[str] = None  # 설정 시 URL 대신 로컬 JWKS 파일 사용 (테스트용)
+    JWKS_REFRESH_INTERVAL_SECONDS: float = 3600.0  # JWKS 백그라운드 갱신 주기
+    JWKS_MIN_REFRESH_INTERVAL_SECONDS: float = 30.0  # 알 수 없는 kid로 인한 갱신의 최소 간격
+    JWKS_NEGATIVE_CACHE_TTL_SECONDS: float = 300.0  # 알 수 없는 kid를 기억하는 시간
+    JWKS_FETCH_TIMEOUT_SECONDS: float = 5.0  # JWKS 조회 타임아웃
+    JWKS_PRELOAD: bool = True  # False면 시작 시 JWKS를 기다리지 않고 첫 토큰 검증 시 로드
+    COGNITO_TOKEN_USES: List[str] = ["access", "id"]  # 허용할 토큰 종류 (token_use 클레임)
+    TOKEN_VERIFY_CACHE_SIZE: int = 1024  # 검증된 토큰 LRU 크기
+    TOKEN_REVOCATION_FILE: Optional[str] = None  # 설정 시 워커 간 공유하는 토큰 폐기 목록 파일
+    TOKEN_REVOCATION_CAPACITY: int = 10000  # 폐기 목록 블룸 필터 초기 용량
+    TOKEN_REVOCATION_SYNC_INTERVAL_SECONDS: float = 1.0  # 공유 파일 동기화 주기
+    TOKEN_MAX_LIFETIME_SECONDS: float = 86400.0  # 발급 토큰의 최대 수명 (사용자 단위 폐기 유지 시간)
+    PARAMETER_STORE_ENABLED: bool = True  # False면 환경 변수만 사용 (로컬/스텁 환경)
+    SETTINGS_SNAPSHOT_FILE: Optional[str] = None  # 설정 시 Parameter Store 값을 파일로 캐시 (재시작 시 재사용, SHARED_CACHE_FILE이 우선)
+    SETTINGS_SNAPSHOT_MAX_AGE_SECONDS: float = 300.0  # 설정 스냅샷 파일 유효 시간
+    SETTINGS_RELOAD_INTERVAL_SECONDS: float = 0.0  # Parameter Store 주기적 재로드 간격 (0이면 비활성)
+    STREAM_PAGE_SIZE: int = 1000  # 스트리밍 목록 응답에서 DynamoDB 페이지당 읽는 항목 수
+    EXPORT_GZIP_LEVEL: int = 6  # 내보내기 응답의 gzip 압축 수준 (1-9, Accept-Encoding에 gzip이 있을 때)
+    RESPONSE_VALIDATION: bool = False  # response_model로 응답 검증 (False면 서비스 결과를 바로 직렬화, 라우트 등록 시점에 적용 - 테스트/개발 환경에서 켬)
+    SHARED_CACHE_FILE: Optional[str] = None  # 설정 시 워커 간 공유 캐시 파일 (SQLite, 예: /dev/shm/crm-cache.db)
+    SHARED_CACHE_LOCAL_TTL_SECONDS: float = 1.0  # 공유 버전/무효화 스탬프를 프로세스 내에 보관하는 시간
+    WEB_CONCURRENCY: int = 1  # 워커 프로세스 수 (1이면 단일 프로세스, 0이면 CPU 수)
+    WORKER_MAX_REQUESTS: int = 10000  # 워커 재시작 전 최대 처리 요청 수 (0이면 비활성)
+    WORKER_MAX_REQUESTS_JITTER: int = 1000  # 워커들이 동시에 재시작하지 않도록 더하는 무작위 값
+    WORKER_MAX_MEMORY_MB: float = 0.0  # 워커 메모리 상한 - 넘으면 정상 종료 후 재시작 (0이면 비활성)
+    WORKER_MEMORY_CHECK_INTERVAL_SECONDS: float = 10.0  # 워커 메모리 검사 간격
+    WORKER_GRACEFUL_TIMEOUT_SECONDS: int = 30  # 워커 종료 시 진행 중 요청 대기 시간
+    WORKER_TIMEOUT_SECONDS: int = 60  # 응답 없는 워커를 재시작하기까지의 시간
+    INTERNAL_ENDPOINTS_ENABLED: bool = False  # /internal/* 진단 엔드포인트(준비 상태, 요청 병합/시작 통계) 노출 여부 (인증 없음 - 꺼져 있으면 404)
 
     @staticmethod
     def get_ssm_parameter(param_name: str, region: str, with_decryption: bool = True) -> Optional[str]:
-        ssm_client = boto3.client('ssm', region_name=region)
+        ssm_client = get_client('ssm', region)
         try:
             response = ssm_client.get_parameter(Name=param_name, WithDecryption=with_decryption)
             return response['Parameter']['Value']
@@ -28,39 +99,135 @@ class Settings(BaseSettings):
             print(f"Error getting parameter {param_name}: {e}")
             return None
 
-    def _load_from_parameter_store(self):
-        params = {
-            "AWS_REGION": "/crm-saas/aws/region",
-            "COGNITO_USER_POOL_ID": "/crm-saas/cognito/user_pool_id",
-            "COGNITO_APP_CLIENT_ID": "/crm-saas/cognito/app_client_id",
-            "DYNAMODB_TENANT_TABLE": "/crm-saas/dynamodb/tenants_table",
-            "DYNAMODB_USER_TABLE": "/crm-saas/dynamodb/users_table",
-            "DYNAMODB_ACCOUNT_TABLE": "/crm-saas/dynamodb/accounts_table",
-            "DYNAMODB_OPPORTUNITY_TABLE": "/crm-saas/dynamodb/opportunities_table",
-            "JWT_SECRET_KEY": "/crm-saas/jwt/secret_key",
-            "PROJECT_NAME": "/crm-saas/app/project_name",
-            "ALLOWED_ORIGINS": "/crm-saas/app/allowed_origins",  # 이 줄을 추가했습니다
-            "ACCESS_TOKEN_EXPIRE_MINUTES": "/crm-saas/cognito/access_token_expire_minutes",
-            "JWT_ALGORITHM": "/crm-saas/cognito/jwt_algorithm"
-        }
+    @staticmethod
+    def fetch_parameters(region: str) -> Dict[str, str]:
+        """
+        Parameter Store에서 설정 값을 일괄 조회
+        get_parameters_by_path로 PARAMETER_PATH_PREFIX 아래를 한 번에 읽고 (페이지당 10개),
+        경로 조회 권한이 없으면 get_parameters로 10개씩 나누어 조회한다.
+        :param region: 리전
+        :return: 설정 속성 이름 -> 값
+        """
+        ssm_client = get_client('ssm', region)
+        names = {param_name: attr for attr, param_name in PARAMETERS.items()}
+        values: Dict[str, str] = {}
+        try:
+            paginator = ssm_client.get_paginator('get_parameters_by_path')
+            for page in paginator.paginate(Path=PARAMETER_PATH_PREFIX, Recursive=True, WithDecryption=True):
+                for parameter in page['Parameters']:
+                    attr = names.get(parameter['Name'])
+                    if attr is not None:
+                        values[attr] = parameter['Value']
+            return values
+        except ClientError as e:
+            print(f"Error getting parameters by path {PARAMETER_PATH_PREFIX}: {e}")
 
-        # AWS_REGION이 None인 경우 기본값 사용
-        region = self.AWS_REGION or "ap-northeast-2"
+        param_names = list(names)
+        for start in range(0, len(param_names), 10):
+            try:
+                response = ssm_client.get_parameters(Names=param_names[start:start + 10], WithDecryption=True)
+            except ClientError as e:
+                print(f"Error getting parameters {param_names[start:start + 10]}: {e}")
+                continue
+            for parameter in response['Parameters']:
+                values[names[parameter['Name']]] = parameter['Value']
+        return values
 
-        for attr, param_name in params.items():
-            value = self.get_ssm_parameter(param_name, region)
+    def _apply_parameters(self, values: Dict[str, str]) -> List[str]:
+        """
+        조회한 설정 값을 반영
+        :param values: 설정 속성 이름 -> 값
+        :return: 값이 바뀐 속성 이름 목록
+        """
+        changed = []
+        for attr in PARAMETERS:
+            value = values.get(attr)
             if value is not None:
                 if attr == "ALLOWED_ORIGINS":
                     # ALLOWED_ORIGINS를 쉼표로 구분된 문자열로 저장했다고 가정
-                    setattr(self, attr, [origin.strip() for origin in value.split(',')])
-                else:
+                    value = [origin.strip() for origin in value.split(',')]
+                if getattr(self, attr) != value:
                     setattr(self, attr, value)
+                    changed.append(attr)
             else:
                 print(f"Warning: Failed to load {attr} from Parameter Store. Using default value if available.")
+        return changed
+
+    def _load_snapshot(self, max_age: Optional[float] = None) -> Optional[Dict[str, str]]:
+        """
+        max_age(기본: SETTINGS_SNAPSHOT_MAX_AGE_SECONDS) 이내에 기록된 설정 스냅샷 읽기
+        SHARED_CACHE_FILE이 설정되면 공유 캐시에서, 아니면 SETTINGS_SNAPSHOT_FILE에서 읽는다.
+        """
+        max_age = self.SETTINGS_SNAPSHOT_MAX_AGE_SECONDS if max_age is None else max_age
+        if self.SHARED_CACHE_FILE:
+            try:
+                entry = open_shared_cache(self.SHARED_CACHE_FILE).get("settings:parameters")
+            except (OSError, sqlite3.Error):
+                return None
+            if entry is None or time.time() - entry[0] > max_age:
+                return None
+            return entry[1]
+        path = self.SETTINGS_SNAPSHOT_FILE
+        if not path:
+            return None
+        try:
+            if time.time() - os.path.getmtime(path) > max_age:
+                return None
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_snapshot(self, values: Dict[str, str]) -> None:
+        """
+        설정 스냅샷 기록 (비밀 값이 포함되므로 소유자만 읽을 수 있도록 생성)
+        """
+        if not values:
+            return
+        if self.SHARED_CACHE_FILE:
+            try:
+                open_shared_cache(self.SHARED_CACHE_FILE).set(
+                    "settings:parameters", (time.time(), values), self.SETTINGS_SNAPSHOT_MAX_AGE_SECONDS
+                )
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: Failed to write settings to shared cache: {e}")
+            return
+        path = self.SETTINGS_SNAPSHOT_FILE
+        if not path:
+            return
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(values, f)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Warning: Failed to write settings snapshot {path}: {e}")
+
+    def _load_from_parameter_store(self):
+        values = self._load_snapshot()
+        if values is None:
+            # AWS_REGION이 None인 경우 기본값 사용
+            values = self.fetch_parameters(self.AWS_REGION or "ap-northeast-2")
+            self._save_snapshot(values)
+        self._apply_parameters(values)
+
+    def reload(self, max_age: float = 0.0) -> List[str]:
+        """
+        Parameter Store에서 설정을 다시 읽어 반영 (스냅샷도 갱신)
+        :param max_age: 이 시간(초) 이내에 다른 워커가 기록한 스냅샷이 있으면 Parameter Store 대신 사용
+        :return: 값이 바뀐 속성 이름 목록
+        """
+        values = self._load_snapshot(max_age) if max_age > 0 else None
+        if values is None:
+            values = self.fetch_parameters(self.AWS_REGION or "ap-northeast-2")
+            self._save_snapshot(values)
+        return self._apply_parameters(values)
 
     def __init__(self, **values: Any):
         super().__init__(**values)
-        self._load_from_parameter_store()
+        if self.PARAMETER_STORE_ENABLED:
+            self._load_from_parameter_store()
 
     def get_settings_dict(self) -> Dict[str, Any]:
         return {
@@ -68,13 +235,21 @@ class Settings(BaseSettings):
             if not key.startswith('_') and isinstance(value, (str, int, float, bool, list))
         }
 
-settings = Settings()
+with startup.phase("config"):
+    settings = Settings()
 
-# 설정 값 로드 확인
-print("Loaded settings:")
-for key, value in settings.get_settings_dict().items():
-    #if key in ["JWT_SECRET_KEY"]:
-    #    print(f"{key}: {'*' * 10}")  # 민감한 정보는 별표로 마스킹
-    #else:
-    #    print(f"{key}: {value}")
-    print(f"{key}: {value}")
\ No newline at end of file
+async def run_settings_reloader(interval: float) -> None:
+    """
+    interval마다 Parameter Store에서 설정을 다시 읽어 반영 (ALLOWED_ORIGINS 등 재시작 없이 변경)
+    :param interval: 재로드 간격 (초)
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            # 같은 노드의 다른 워커가 이번 주기에 이미 읽어 둔 값이 있으면 재사용
+            changed = await loop.run_in_executor(None, settings.reload, interval)
+            if changed:
+                print(f"Reloaded settings: {', '.join(changed)}")
+        except Exception as e:
+            print(f"Error reloading settings: {e}")
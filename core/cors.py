@@ -0,0 +1,22 @@
+from starlette.middleware.cors import CORSMiddleware
+from app.core.config import settings
+
+class DynamicCORSMiddleware(CORSMiddleware):
+    """
+    허용 출처를 요청 시점의 settings.ALLOWED_ORIGINS에서 읽는 CORS 미들웨어
+    설정 재로드로 ALLOWED_ORIGINS가 바뀌면 재시작 없이 반영된다.
+    """
+    _origins_source = None
+    _origins = frozenset()
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        origins = settings.ALLOWED_ORIGINS
+        if origins is not self._origins_source:
+            # 목록이 교체되었을 때만 정규화 (AnyHttpUrl / 끝의 '/' 차이 제거)
+            self._origins = frozenset(str(allowed).rstrip("/") for allowed in origins)
+            self._origins_source = origins
+        if "*" in self._origins:
+            return True
+        if self.allow_origin_regex is not None and self.allow_origin_regex.fullmatch(origin):
+            return True
+        return origin.rstrip("/") in self._origins
@@ -1,8 +1,9 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
 from pydantic import ValidationError
+from app.core.cache import principal_cache
 from app.core.config import settings
+from app.core.revocation import revocation_store
 from app.schemas.user import UserInDB
 from app.services.user_service import UserService
 from app.core.security import verify_cognito_token
@@ -12,8 +13,25 @@ from typing import Generator
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserInDB:
+    """
+    토큰으로 현재 사용자 정보 가져오기
+    검증된 클레임과 사용자 정보는 토큰 만료 시까지 캐시되어, 같은 토큰의 이후 요청은
+    서명 검증과 DynamoDB 조회를 생략한다.
+    :param token: 액세스 토큰
+    :return: 현재 사용자 정보 (요청마다 별도 복사본)
+    """
+    cached = principal_cache.get(token)
+    if cached is not None:
+        claims, user = cached
+        if revocation_store.is_revoked(claims):
+            raise HTTPException(status_code=401, detail="Token has been revoked")
+        return user.copy(deep=True)
+
+    generation = principal_cache.generation
     try:
-        claims = verify_cognito_token(token)
+        claims = await verify_cognito_token(token)
+        if revocation_store.is_revoked(claims):
+            raise HTTPException(status_code=401, detail="Token has been revoked")
         user_id = claims['sub']
         tenant_id = claims.get('custom:tenant_id')
         is_active = claims.get('custom:is_active', 'true').lower() == 'true'
@@ -29,7 +47,8 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserInDB:
         # JWT 클레임의 정보로 사용자 정보 업데이트
         user.is_active = is_active
         user.role = role
-        
+
+        principal_cache.set(token, claims, user.copy(deep=True), generation)
         return user
     except ValueError as e:
         raise HTTPException(status_code=401, detail=str(e))
@@ -34,4 +34,18 @@ class BadRequestException(CRMException):
     잘못된 요청에 대한 예외
     """
     def __init__(self, detail: str):
-        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
\ No newline at end of file
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+class ConflictException(CRMException):
+    """
+    다른 요청의 변경과 충돌한 요청에 대한 예외 (버전 불일치 등)
+    """
+    def __init__(self, detail: str = "Resource was modified concurrently"):
+        super().__init__(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+class ServiceUnavailableException(CRMException):
+    """
+    일시적으로 처리할 수 없는 요청에 대한 예외 (재시도 가능한 동시 변경이 계속 충돌하는 경우 등)
+    """
+    def __init__(self, detail: str = "Service temporarily unavailable"):
+        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
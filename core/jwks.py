@@ -0,0 +1,199 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from typing import Any, Dict, Optional
+
+from app.core.cache import TTLCache, get_shared_cache
+from app.core.config import settings
+from app.core.shared_cache import SharedCache
+from app.core.singleflight import single_flight
+
+logger = logging.getLogger(__name__)
+
+def default_jwks_url() -> str:
+    """
+    Cognito 사용자 풀의 JWKS URL (COGNITO_JWKS_URL이 설정되면 그 값)
+    """
+    if settings.COGNITO_JWKS_URL:
+        return settings.COGNITO_JWKS_URL
+    return f"https://cognito-idp.{settings.AWS_REGION}.amazonaws.com/{settings.COGNITO_USER_POOL_ID}/.well-known/jwks.json"
+
+class JWKSManager:
+    """
+    JWT 서명 검증용 공개 키 집합(JWKS) 관리자
+    - 백그라운드 태스크가 refresh_interval마다 키 집합을 비동기로 갱신한다.
+    - 알 수 없는 kid로 인한 동시 갱신 요청은 한 번의 조회로 병합하고,
+      갱신 시도 간격을 min_refresh_interval 이상으로 제한한다.
+    - 갱신 후에도 없는 kid는 negative_ttl 동안 기억하여 위조 kid 토큰이 외부 요청을 유발하지 않도록 한다.
+    - 조회에 실패하면 마지막으로 성공한 키 집합을 계속 사용한다.
+    - file_path가 주어지면 URL 대신 로컬 JWKS 파일을 읽는다 (테스트/오프라인 환경용).
+    - shared(공유 캐시)가 주어지면 조회한 JWKS 문서를 같은 노드의 워커들과 공유한다.
+    """
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        file_path: Optional[str] = None,
+        refresh_interval: float = 3600.0,
+        min_refresh_interval: float = 30.0,
+        negative_ttl: float = 300.0,
+        fetch_timeout: float = 5.0,
+        shared: Optional[SharedCache] = None
+    ):
+        self.url = url
+        self.file_path = file_path
+        self.refresh_interval = refresh_interval
+        self.min_refresh_interval = min_refresh_interval
+        self.fetch_timeout = fetch_timeout
+        self.shared = shared
+        self._keys: Dict[str, Any] = {}
+        self._unknown_kids = TTLCache(maxsize=4096, ttl=negative_ttl)
+        self._last_attempt: Optional[float] = None
+        self._last_success: Optional[float] = None
+        self._flight = single_flight("jwks_refresh")
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def keys(self) -> Dict[str, Any]:
+        return self._keys
+
+    def _read_shared(self, max_age: float) -> Optional[Dict[str, Any]]:
+        if self.shared is None or max_age <= 0:
+            return None
+        try:
+            entry = self.shared.get(f"jwks:{self.file_path or self.url}")
+        except sqlite3.Error as e:
+            logger.warning("Shared JWKS read failed: %s", e)
+            return None
+        if entry is None or time.time() - entry[0] > max_age:
+            return None
+        return entry[1]
+
+    def _write_shared(self, document: Dict[str, Any]) -> None:
+        if self.shared is None:
+            return
+        try:
+            self.shared.set(f"jwks:{self.file_path or self.url}", (time.time(), document), self.refresh_interval)
+        except sqlite3.Error as e:
+            logger.warning("Shared JWKS write failed: %s", e)
+
+    def _fetch_document(self) -> Dict[str, Any]:
+        if self.file_path:
+            with open(self.file_path) as f:
+                return json.load(f)
+        import requests  # URL 조회 시에만 필요하므로 지연 import
+        response = requests.get(self.url or default_jwks_url(), timeout=self.fetch_timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def _fetch(self, max_age: float = 0.0) -> Dict[str, Any]:
+        """
+        JWKS 원본을 읽어 kid별 공개 키 객체로 변환 (블로킹, 스레드에서 실행)
+        :param max_age: 다른 워커가 이 시간(초) 이내에 조회해 공유 캐시에 둔 문서가 있으면 재사용
+        """
+        from jose import jwk
+        document = self._read_shared(max_age)
+        if document is None:
+            document = self._fetch_document()
+            self._write_shared(document)
+        return {key["kid"]: jwk.construct(key) for key in document["keys"]}
+
+    def load_blocking(self) -> bool:
+        """
+        키 집합을 현재 스레드에서 즉시 로드 (이벤트 루프 시작 전, 예: pre-fork 마스터)
+        :return: 로드 성공 여부
+        """
+        self._last_attempt = time.monotonic()
+        try:
+            self._keys = self._fetch(self.refresh_interval)
+        except Exception as e:
+            logger.warning("JWKS load failed: %s", e)
+            return False
+        self._last_success = time.monotonic()
+        return True
+
+    async def _refresh(self, max_age: float) -> bool:
+        self._last_attempt = time.monotonic()
+        try:
+            keys = await asyncio.get_running_loop().run_in_executor(None, self._fetch, max_age)
+        except Exception as e:
+            # 마지막으로 성공한 키 집합을 유지
+            logger.warning("JWKS refresh failed, keeping %d cached keys: %s", len(self._keys), e)
+            return False
+        self._keys = keys
+        self._last_success = time.monotonic()
+        self._unknown_kids.clear()
+        return True
+
+    async def refresh(self, max_age: float = 0.0) -> bool:
+        """
+        키 집합 갱신 (동시 호출은 한 번의 조회로 병합)
+        :param max_age: 공유 캐시의 문서가 이 시간(초) 이내에 조회된 것이면 재사용 (0이면 항상 새로 조회)
+        :return: 갱신 성공 여부
+        """
+        return await self._flight.do("refresh", self._refresh, max_age)
+
+    async def get_key(self, kid: str) -> Any:
+        """
+        kid에 해당하는 공개 키 조회 (캐시에 없으면 제한된 빈도로 갱신 후 재조회)
+        :param kid: 토큰 헤더의 키 ID
+        :return: 공개 키 객체
+        """
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+        if self._unknown_kids.get(kid) is None:
+            if self._last_attempt is None or time.monotonic() - self._last_attempt >= self.min_refresh_interval:
+                # 다른 워커가 방금 갱신한 문서는 재사용 (키 교체 직후 워커마다 조회하지 않도록)
+                await self.refresh(self.min_refresh_interval)
+            key = self._keys.get(kid)
+            if key is not None:
+                return key
+            self._unknown_kids.set(kid, True)
+        raise ValueError("Public key not found in JWKS")
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh(self.refresh_interval)
+
+    async def start(self, preload: bool = True) -> None:
+        """
+        백그라운드 갱신 태스크 시작
+        :param preload: 초기 키 집합 로드를 기다릴지 여부 (False면 첫 get_key 호출 시 로드)
+        """
+        if preload and not self._keys:
+            await self.refresh(self.refresh_interval)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """
+        백그라운드 갱신 태스크 중지
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def status(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "kids": sorted(self._keys),
+            "last_success_age": None if self._last_success is None else now - self._last_success,
+            "unknown_kids": len(self._unknown_kids)
+        }
+
+jwks_manager = JWKSManager(
+    url=settings.COGNITO_JWKS_URL,
+    file_path=settings.COGNITO_JWKS_FILE,
+    refresh_interval=settings.JWKS_REFRESH_INTERVAL_SECONDS,
+    min_refresh_interval=settings.JWKS_MIN_REFRESH_INTERVAL_SECONDS,
+    negative_ttl=settings.JWKS_NEGATIVE_CACHE_TTL_SECONDS,
+    fetch_timeout=settings.JWKS_FETCH_TIMEOUT_SECONDS,
+    shared=get_shared_cache()
+)
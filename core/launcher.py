@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import os
+import resource
+import signal
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 현재 프로세스가 pre-fork 워커인지, 재시작을 위해 종료 중인지
+worker_state: Dict[str, Any] = {"prefork_worker": False, "draining": False}
+
+def reset_after_fork() -> None:
+    """
+    fork 직후 워커에서 부모로부터 복사된 연결/스레드 상태를 폐기
+    (boto3 클라이언트, DynamoDB 스레드 풀, PynamoDB 모델 연결은 fork 안전하지 않음)
+    """
+    from app.core.aws_clients import reset_clients
+    from app.models import TenantModel, UserModel, AccountModel, OpportunityModel, TenantStatsModel
+    from app.utils.async_dynamodb import reset_db_state
+
+    reset_clients()
+    reset_db_state()
+    for model in (TenantModel, UserModel, AccountModel, OpportunityModel, TenantStatsModel):
+        model._connection = None
+    worker_state["prefork_worker"] = True
+
+def get_rss_mb() -> float:
+    """
+    현재 프로세스의 상주 메모리(RSS) 크기 (MB)
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except OSError:
+        # /proc이 없는 환경에서는 최대 RSS로 대체 (Linux: KB 단위)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+async def watch_memory(limit_mb: float, interval: float) -> None:
+    """
+    워커 메모리가 limit_mb를 넘으면 자신에게 SIGTERM을 보내 정상 종료 (마스터가 새 워커를 띄움)
+    :param limit_mb: 메모리 상한 (MB)
+    :param interval: 검사 간격 (초)
+    """
+    while True:
+        await asyncio.sleep(interval)
+        rss_mb = get_rss_mb()
+        if rss_mb > limit_mb:
+            logger.warning("Worker %d RSS %.0fMB exceeds %.0fMB, recycling", os.getpid(), rss_mb, limit_mb)
+            worker_state["draining"] = True
+            os.kill(os.getpid(), signal.SIGTERM)
+            return
+
+def _post_fork(server, worker) -> None:
+    reset_after_fork()
+
+def build_options(workers: int, host: str, port: int, max_requests: Optional[int] = None) -> Dict[str, Any]:
+    """
+    gunicorn 설정 생성
+    :param workers: 워커 수 (0이면 CPU 수)
+    :param host: 바인드 호스트
+    :param port: 바인드 포트
+    :param max_requests: 워커 재시작 전 최대 처리 요청 수 (None이면 WORKER_MAX_REQUESTS)
+    :return: gunicorn 설정
+    """
+    return {
+        "bind": f"{host}:{port}",
+        "workers": workers or os.cpu_count() or 1,
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        # 마스터에서 앱을 미리 로드하여 설정, JWKS, 라우트를 워커가 copy-on-write로 공유
+        "preload_app": True,
+        "max_requests": settings.WORKER_MAX_REQUESTS if max_requests is None else max_requests,
+        "max_requests_jitter": settings.WORKER_MAX_REQUESTS_JITTER,
+        "graceful_timeout": settings.WORKER_GRACEFUL_TIMEOUT_SECONDS,
+        "timeout": settings.WORKER_TIMEOUT_SECONDS,
+        "post_fork": _post_fork,
+    }
+
+def run(app: Any, workers: int, host: str, port: int, max_requests: Optional[int] = None) -> None:
+    """
+    pre-fork 멀티 워커 모드로 서버 실행 (gunicorn + uvicorn 워커 필요)
+    :param app: ASGI 애플리케이션 (마스터에서 로드된 상태로 워커에 복사됨)
+    :param workers: 워커 수 (0이면 CPU 수)
+    :param host: 바인드 호스트
+    :param port: 바인드 포트
+    :param max_requests: 워커 재시작 전 최대 처리 요청 수
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        raise SystemExit("Multi-worker mode requires gunicorn: pip install gunicorn uvicorn")
+
+    options = build_options(workers, host, port, max_requests)
+
+    class PreforkApplication(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from app.core.jwks import jwks_manager
+            # 포크 전에 JWKS를 로드해 두면 워커는 시작 시 다시 조회하지 않음
+            jwks_manager.load_blocking()
+            return app
+
+    PreforkApplication().run()
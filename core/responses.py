@@ -0,0 +1,114 @@
+import functools
+import inspect
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Callable, List, Optional
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+from app.core.config import settings
+
+_UNLOADED = object()
+_orjson = _UNLOADED
+
+def get_orjson():
+    """
+    orjson 모듈 (설치되어 있지 않으면 None - 표준 json으로 동작)
+    """
+    global _orjson
+    if _orjson is _UNLOADED:
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+        _orjson = orjson
+    return _orjson
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        # 필드 값을 그대로 넘겨 인코더가 중첩 값을 직렬화 (dict()의 재귀 복사를 피함)
+        return obj.__dict__
+    # RawRecord 등 dict()를 제공하는 객체
+    to_dict = getattr(obj, "dict", None)
+    if callable(to_dict):
+        return to_dict()
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    return jsonable_encoder(obj)
+
+def dumps(content: Any) -> bytes:
+    """
+    응답 내용을 JSON 바이트로 직렬화 (orjson이 있으면 사용, 출력 형식은 jsonable_encoder + json과 동일)
+    :param content: dict / list / pydantic 모델 / RawRecord 등
+    :return: JSON 바이트
+    """
+    orjson = get_orjson()
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+class FastJSONResponse(JSONResponse):
+    """
+    dumps로 직렬화하는 JSON 응답 (애플리케이션 기본 응답 클래스)
+    """
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+def response_validation_enabled() -> bool:
+    """
+    response_model 검증 여부 (RESPONSE_VALIDATION 설정)
+    """
+    return settings.RESPONSE_VALIDATION
+
+def _response_params(endpoint: Callable) -> List[str]:
+    return [
+        name for name, param in inspect.signature(endpoint).parameters.items()
+        if inspect.isclass(param.annotation) and issubclass(param.annotation, Response)
+    ]
+
+def trusted_endpoint(endpoint: Callable, status_code: Optional[int] = None) -> Callable:
+    """
+    엔드포인트 결과를 response_model 검증/jsonable_encoder 변환 없이 바로 FastJSONResponse로 감싸는 래퍼
+    엔드포인트가 Response 파라미터에 설정한 헤더/상태 코드는 FastAPI와 같은 방식으로 옮긴다.
+    :param endpoint: 라우트 엔드포인트 함수
+    :param status_code: 라우트의 기본 상태 코드
+    :return: 래핑된 엔드포인트 (시그니처는 원래 함수와 같아 의존성 주입이 그대로 동작)
+    """
+    response_params = _response_params(endpoint)
+    is_coroutine = inspect.iscoroutinefunction(endpoint)
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if is_coroutine:
+            result = await endpoint(*args, **kwargs)
+        else:
+            result = await run_in_threadpool(endpoint, *args, **kwargs)
+        if isinstance(result, Response):
+            return result
+        response = FastJSONResponse(result, status_code=status_code or 200)
+        for name in response_params:
+            sub_response = kwargs.get(name)
+            if sub_response is not None:
+                response.headers.raw.extend(sub_response.headers.raw)
+                if sub_response.status_code:
+                    response.status_code = sub_response.status_code
+        return response
+    return wrapper
+
+class FastResponseRoute(APIRoute):
+    """
+    서비스가 만든 결과를 신뢰하고 한 번만 직렬화하는 라우트
+    - response_model은 OpenAPI 문서에만 사용하고, 응답은 FastJSONResponse로 바로 직렬화한다.
+    - response_validation_enabled()가 참이면 FastAPI 기본 동작대로 검증한다 (테스트/개발 환경).
+    """
+    def __init__(self, path: str, endpoint: Callable, **kwargs: Any):
+        if not response_validation_enabled():
+            endpoint = trusted_endpoint(endpoint, kwargs.get("status_code"))
+        super().__init__(path, endpoint, **kwargs)
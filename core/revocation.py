@@ -0,0 +1,254 @@
+import fcntl
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+# 공유 파일이 이 크기를 넘으면 만료 항목 정리 시 파일도 압축
+COMPACT_THRESHOLD_BYTES = 1 << 20
+
+class BloomFilter:
+    """
+    폐기 여부의 빠른 음성 판정용 블룸 필터
+    might_contain이 False면 확실히 없는 키이며, True면 실제 저장소 확인이 필요하다.
+    """
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.capacity = capacity
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _hashes(self, key: str) -> Tuple[int, int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+    def add(self, key: str) -> None:
+        h1, h2 = self._hashes(key)
+        for i in range(self.hash_count):
+            position = (h1 + i * h2) % self.size
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, key: str) -> bool:
+        h1, h2 = self._hashes(key)
+        bits, size = self._bits, self.size
+        for i in range(self.hash_count):
+            position = (h1 + i * h2) % size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+class RevocationStore:
+    """
+    로컬 토큰 폐기 목록
+    - 토큰 단위 폐기: jti (없으면 sub + iat) 키를 토큰 만료 시각까지 보관
+    - 사용자 단위 폐기: 해당 시각 이전에 발급된 사용자(sub)의 모든 토큰 (글로벌 로그아웃)
+    요청 경로의 조회는 블룸 필터로 대부분 메모리 비트 검사만으로 끝난다.
+    file_path가 주어지면 폐기 항목을 공유 파일에 추가 기록하고, 다른 프로세스가 기록한 항목을
+    sync_interval마다 이어 읽어 여러 워커가 같은 폐기 목록을 공유한다.
+    """
+    def __init__(self, file_path: Optional[str] = None, capacity: int = 10000, sync_interval: float = 1.0):
+        self.file_path = file_path
+        self.sync_interval = sync_interval
+        self._tokens: Dict[str, float] = {}  # 토큰 키 -> 만료 시각
+        self._subjects: Dict[str, Tuple[float, float]] = {}  # sub -> (기준 발급 시각, 만료 시각)
+        self._bloom = BloomFilter(capacity)
+        self._lock = threading.RLock()
+        self._file_offset = 0
+        self._file_inode: Optional[int] = None
+        self._last_sync = 0.0
+        self._next_purge = time.time() + 60
+
+    @staticmethod
+    def token_key(claims: Dict[str, Any]) -> str:
+        """
+        토큰 폐기 키 (jti, 없으면 sub + iat)
+        """
+        if claims.get("jti"):
+            return f"jti:{claims['jti']}"
+        return f"tok:{claims.get('sub')}:{claims.get('iat')}"
+
+    def is_revoked(self, claims: Dict[str, Any]) -> bool:
+        """
+        토큰의 폐기 여부
+        :param claims: 검증된 토큰 클레임
+        :return: 폐기 여부
+        """
+        self._maybe_sync()
+        if not self._tokens and not self._subjects:
+            return False
+        token_key = self.token_key(claims)
+        subject_key = f"sub:{claims.get('sub')}"
+        bloom = self._bloom
+        if not bloom.might_contain(token_key) and not bloom.might_contain(subject_key):
+            return False
+
+        now = time.time()
+        with self._lock:
+            expires_at = self._tokens.get(token_key)
+            if expires_at is not None and expires_at > now:
+                return True
+            subject = self._subjects.get(claims.get("sub"))
+            if subject is not None:
+                cutoff, expires_at = subject
+                if expires_at > now and float(claims.get("iat", 0)) < cutoff:
+                    return True
+        return False
+
+    def revoke(self, claims: Dict[str, Any]) -> None:
+        """
+        토큰 하나를 만료 시각까지 폐기
+        :param claims: 검증된 토큰 클레임
+        """
+        self._apply(self.token_key(claims), float(claims["exp"]), None, persist=True)
+
+    def revoke_subject(self, sub: str, ttl: float, issued_before: Optional[float] = None) -> None:
+        """
+        사용자의 issued_before 이전(iat < issued_before)에 발급된 모든 토큰을 ttl 동안 폐기
+        iat는 초 단위 정수이므로 기본 기준은 현재 초의 시작이다 - 같은 초에 다시 로그인하여 받은 토큰은 폐기되지 않는다.
+        :param sub: 사용자 ID (sub 클레임)
+        :param ttl: 폐기 유지 시간 (발급되는 토큰의 최대 수명 이상)
+        :param issued_before: 기준 발급 시각 (epoch 초, 기본: 현재 초)
+        """
+        now = time.time()
+        cutoff = math.floor(now) if issued_before is None else issued_before
+        self._apply(f"sub:{sub}", now + ttl, cutoff, persist=True)
+
+    def _apply(self, key: str, expires_at: float, cutoff: Optional[float], persist: bool) -> None:
+        with self._lock:
+            if key.startswith("sub:"):
+                sub = key[4:]
+                previous = self._subjects.get(sub)
+                if previous is not None:
+                    cutoff = max(cutoff, previous[0])
+                    expires_at = max(expires_at, previous[1])
+                self._subjects[sub] = (cutoff, expires_at)
+            else:
+                self._tokens[key] = max(expires_at, self._tokens.get(key, 0.0))
+            if len(self._tokens) + len(self._subjects) > self._bloom.capacity:
+                self._rebuild(self._bloom.capacity * 2)
+            else:
+                self._bloom.add(key)
+        if persist and self.file_path:
+            self._append(key, expires_at, cutoff)
+
+    def _rebuild(self, capacity: int) -> None:
+        bloom = BloomFilter(capacity)
+        for key in self._tokens:
+            bloom.add(key)
+        for sub in self._subjects:
+            bloom.add(f"sub:{sub}")
+        self._bloom = bloom
+
+    def purge(self) -> None:
+        """
+        만료된 항목 제거 후 블룸 필터 재구성
+        """
+        now = time.time()
+        with self._lock:
+            self._tokens = {key: expires_at for key, expires_at in self._tokens.items() if expires_at > now}
+            self._subjects = {sub: entry for sub, entry in self._subjects.items() if entry[1] > now}
+            self._rebuild(self._bloom.capacity)
+            self._next_purge = now + 60
+
+    @contextmanager
+    def _file_lock(self):
+        # 압축 시 파일이 교체되므로 잠금은 별도 파일로 건다
+        with open(f"{self.file_path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _append(self, key: str, expires_at: float, cutoff: Optional[float]) -> None:
+        line = json.dumps({"k": key, "e": expires_at, "c": cutoff}) + "\n"
+        with self._file_lock():
+            with open(self.file_path, "a") as f:
+                f.write(line)
+
+    def _maybe_sync(self) -> None:
+        now = time.time()
+        if now >= self._next_purge:
+            if self.file_path and self._file_offset > COMPACT_THRESHOLD_BYTES:
+                self.compact()
+            else:
+                self.purge()
+        if not self.file_path or now - self._last_sync < self.sync_interval:
+            return
+        self._last_sync = now
+        self.sync()
+
+    def sync(self) -> None:
+        """
+        공유 파일에서 다른 프로세스가 추가한 폐기 항목을 읽어 반영
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return
+        with self._lock:
+            if stat.st_ino != self._file_inode or stat.st_size < self._file_offset:
+                # 파일이 교체(압축)되었으면 처음부터 다시 읽음
+                self._file_inode = stat.st_ino
+                self._file_offset = 0
+            if stat.st_size == self._file_offset:
+                return
+            with open(self.file_path) as f:
+                f.seek(self._file_offset)
+                data = f.read()
+            # 기록 중인 마지막 줄은 다음 동기화에서 읽음
+            complete = data[:data.rfind("\n") + 1]
+            self._file_offset += len(complete.encode())
+            now = time.time()
+            for line in complete.splitlines():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry["e"] > now:
+                    self._apply(entry["k"], entry["e"], entry.get("c"), persist=False)
+
+    def compact(self) -> None:
+        """
+        공유 파일을 만료되지 않은 항목만 남도록 다시 기록
+        """
+        if not self.file_path:
+            return
+        with self._file_lock():
+            # 잠금을 잡은 상태에서 다른 프로세스의 최신 기록까지 반영한 뒤 다시 기록
+            self.sync()
+            self.purge()
+            with self._lock:
+                lines = [json.dumps({"k": key, "e": expires_at, "c": None}) for key, expires_at in self._tokens.items()]
+                lines += [json.dumps({"k": f"sub:{sub}", "e": expires_at, "c": cutoff}) for sub, (cutoff, expires_at) in self._subjects.items()]
+                temp_path = f"{self.file_path}.{os.getpid()}.tmp"
+                with open(temp_path, "w") as f:
+                    f.write("".join(line + "\n" for line in lines))
+                os.replace(temp_path, self.file_path)
+                self._file_inode = None
+                self._file_offset = 0
+
+revocation_store = RevocationStore(
+    file_path=settings.TOKEN_REVOCATION_FILE,
+    capacity=settings.TOKEN_REVOCATION_CAPACITY,
+    sync_interval=settings.TOKEN_REVOCATION_SYNC_INTERVAL_SECONDS
+)
+
+def check_revocation_store(multi_process: bool) -> None:
+    """
+    토큰 폐기 목록 공유 설정 확인 (애플리케이션 시작 시 호출)
+    TOKEN_REVOCATION_FILE이 없으면 폐기 목록이 프로세스 내에만 있어 로그아웃이 그 요청을 처리한 워커에서만 반영된다.
+    :param multi_process: 여러 워커 프로세스로 실행 중인지 여부 (True이면 공유 파일이 없을 때 시작 실패)
+    """
+    if multi_process and revocation_store.file_path is None:
+        raise RuntimeError(
+            "TOKEN_REVOCATION_FILE must be set when running more than one worker; "
+            "otherwise logouts are only enforced by the worker that handled them"
+        )
@@ -1,60 +1,44 @@
-import json
-import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-import requests
-from jose import jwk, jwt
-from jose.utils import base64url_decode
 from datetime import datetime, timedelta
 from typing import Any, Union
-from passlib.context import CryptContext
+from functools import lru_cache
 from app.core.config import settings
+from app.core.jwks import jwks_manager
+from app.core.token_verifier import CognitoTokenVerifier
 
 
-# JWKS URL
-JWKS_URL = f"https://cognito-idp.{settings.AWS_REGION}.amazonaws.com/{settings.COGNITO_USER_POOL_ID}/.well-known/jwks.json"
-
-# JWKS를 가져오고 캐시하는 함수
-def get_jwks():
-    response = requests.get(JWKS_URL)
-    jwks = response.json()
-    return {key["kid"]: jwk.construct(key) for key in jwks["keys"]}
-
-# JWKS 캐시
-jwks_cache = get_jwks()
-
-def verify_cognito_token(token: str) -> Dict[str, Any]:
-    # 토큰의 헤더를 디코딩
-    headers = jwt.get_unverified_headers(token)
-    kid = headers["kid"]
-
-    # 토큰 서명에 사용된 키 찾기
-    key = jwks_cache.get(kid)
-    if not key:
-        # 키가 캐시에 없으면 JWKS를 다시 가져옴
-        jwks_cache.update(get_jwks())
-        key = jwks_cache.get(kid)
-        if not key:
-            raise ValueError("Public key not found in JWKS")
-
-    # 토큰 검증
-    message, encoded_signature = token.rsplit(".", 1)
-    decoded_signature = base64url_decode(encoded_signature.encode())
-
-    if not key.verify(message.encode(), decoded_signature):
-        raise ValueError("Signature verification failed")
-
-    # 클레임 검증
-    claims = jwt.get_unverified_claims(token)
-    if time.time() > claims["exp"]:
-        raise ValueError("Token is expired")
-
-    # 여기에 추가적인 클레임 검증 로직을 넣을 수 있습니다
-    # 예: 발행자(iss) 확인, 대상(aud) 확인 등
-
-    return claims
+def cognito_issuer() -> Optional[str]:
+    """
+    사용자 풀이 발급한 토큰의 iss 값
+    """
+    if not settings.COGNITO_USER_POOL_ID:
+        return None
+    return f"https://cognito-idp.{settings.AWS_REGION}.amazonaws.com/{settings.COGNITO_USER_POOL_ID}"
+
+token_verifier = CognitoTokenVerifier(
+    jwks_manager.get_key,
+    issuer=cognito_issuer(),
+    client_id=settings.COGNITO_APP_CLIENT_ID,
+    token_uses=settings.COGNITO_TOKEN_USES,
+    cache_size=settings.TOKEN_VERIFY_CACHE_SIZE
+)
+
+async def verify_cognito_token(token: str) -> Dict[str, Any]:
+    """
+    Cognito 토큰의 서명과 클레임(exp, iss, aud/client_id, token_use) 검증
+    :param token: JWT 문자열
+    :return: 검증된 클레임 (검증 실패 시 ValueError 발생)
+    """
+    return await token_verifier.verify(token)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    """
+    비밀번호 해시 컨텍스트 (첫 사용 시 생성)
+    """
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def create_access_token(subject: Union[str, Any], expires_delta: timedelta = None) -> str:
     """
@@ -63,6 +47,8 @@ def create_access_token(subject: Union[str, Any], expires_delta: timedelta = Non
     :param expires_delta: 토큰 만료 시간
     :return: 생성된 JWT 토큰
     """
+    from jose import jwt  # 토큰 발급 시에만 필요하므로 지연 import
+
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
@@ -78,7 +64,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     :param hashed_password: 해시된 비밀번호
     :return: 비밀번호 일치 여부
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """
@@ -86,4 +72,4 @@ def get_password_hash(password: str) -> str:
     :param password: 평문 비밀번호
     :return: 해시된 비밀번호
     """
-    return pwd_context.hash(password)
\ No newline at end of file
+    return get_pwd_context().hash(password)
\ No newline at end of file
@@ -0,0 +1,127 @@
+import functools
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+# set 호출이 이 횟수만큼 일어날 때마다 만료 항목 정리
+_PURGE_EVERY = 1000
+
+class SharedCache:
+    """
+    같은 노드의 워커 프로세스들이 공유하는 캐시 (SQLite 파일, WAL 모드)
+    - 키/값 항목: TTL을 가지며 값은 JSON으로 직렬화한다 (튜플은 리스트로 읽힘, JSON으로 표현할 수 없는 값은 TypeError).
+    - 카운터: 원자적으로 증가하는 정수 (데이터 버전/무효화 스탬프용)
+    연결은 프로세스(pid)와 스레드별로 만들므로 fork 이후에도 안전하게 사용할 수 있다.
+    파일에는 설정 값(비밀 포함)과 JWKS 문서가 기록되므로 소유자만 읽을 수 있도록 생성하고,
+    이미 있는 파일은 현재 사용자 소유이며 다른 사용자에게 권한이 없을 때만 사용한다 (아니면 PermissionError).
+    """
+    def __init__(self, path: str, timeout: float = 1.0):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._sets = 0
+        fd = os.open(path, os.O_RDONLY | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        try:
+            stat = os.fstat(fd)
+        finally:
+            os.close(fd)
+        if stat.st_uid != os.geteuid() or stat.st_mode & 0o077:
+            raise PermissionError(
+                f"Shared cache file {path} must be owned by uid {os.geteuid()} and not accessible to others "
+                f"(owner uid {stat.st_uid}, mode {stat.st_mode & 0o777:o})"
+            )
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB, expires_at REAL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS counters (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            # 파일이 새로 만들어질 때마다 달라지는 식별자 (버전 문자열의 접두사로 사용)
+            conn.execute("INSERT OR IGNORE INTO counters (key, value) VALUES ('__instance__', ?)",
+                         (int.from_bytes(os.urandom(4), "big"),))
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @property
+    def instance_id(self) -> str:
+        return format(self.counter("__instance__"), "08x")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        캐시 값 조회 (없거나 만료되었으면 default)
+        """
+        row = self._connect().execute(
+            "SELECT value FROM entries WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        if row is None:
+            return default
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            return default
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        캐시 값 저장
+        :param value: JSON으로 표현할 수 있는 값
+        :param ttl: 만료 시간 (초)
+        """
+        data = json.dumps(value, separators=(",", ":"))
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO entries (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, data, time.time() + ttl)
+        )
+        self._sets += 1
+        if self._sets % _PURGE_EVERY == 0:
+            self.purge()
+
+    def delete(self, key: str) -> None:
+        self._connect().execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        prefix로 시작하는 키의 항목을 모두 삭제
+        """
+        self._connect().execute("DELETE FROM entries WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+
+    def purge(self) -> None:
+        """
+        만료된 항목 삭제
+        """
+        self._connect().execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+
+    def counter(self, key: str) -> int:
+        """
+        카운터 현재 값 (없으면 0)
+        """
+        row = self._connect().execute("SELECT value FROM counters WHERE key = ?", (key,)).fetchone()
+        return 0 if row is None else row[0]
+
+    def incr(self, key: str) -> int:
+        """
+        카운터를 원자적으로 1 증가
+        :return: 증가된 값
+        """
+        return self._connect().execute(
+            "INSERT INTO counters (key, value) VALUES (?, 1) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + 1 RETURNING value",
+            (key,)
+        ).fetchone()[0]
+
+@functools.lru_cache(maxsize=None)
+def open_shared_cache(path: str) -> SharedCache:
+    """
+    경로별 공유 캐시 (프로세스 내에서 하나의 인스턴스를 재사용)
+    :param path: SQLite 파일 경로 (워커들이 같은 경로를 사용해야 공유됨, 예: /dev/shm/crm-cache.db)
+    :return: 공유 캐시
+    """
+    return SharedCache(path)
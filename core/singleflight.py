@@ -0,0 +1,80 @@
+import asyncio
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+class SingleFlight:
+    """
+    같은 키에 대한 동시 비동기 호출을 하나의 실행으로 합치는 요청 병합기
+    먼저 도착한 호출이 작업을 태스크로 실행하고, 완료 전에 도착한 호출은 같은 결과(또는 예외)를 공유한다.
+    작업은 별도 태스크로 실행되므로 한 호출자가 취소되어도 다른 호출자의 작업은 취소되지 않는다.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0  # 전체 호출 수
+        self.executions = 0  # 실제 작업 실행 수
+        self.merged = 0  # 진행 중인 작업에 합류한 호출 수
+        # 이벤트 루프별 진행 중인 작업 (태스크는 생성된 루프에서만 await 가능)
+        self._inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Task]]" = weakref.WeakKeyDictionary()
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """
+        key에 대해 진행 중인 작업이 있으면 그 결과를 기다리고, 없으면 func를 실행
+        :param key: 병합 기준 키
+        :param func: 실행할 코루틴 함수
+        :return: 작업 결과
+        """
+        inflight = self._inflight.setdefault(asyncio.get_running_loop(), {})
+        self.calls += 1
+        task = inflight.get(key)
+        if task is not None:
+            self.merged += 1
+        else:
+            self.executions += 1
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(inflight, key, done))
+        return await asyncio.shield(task)
+
+    def forget(self, key: Hashable) -> None:
+        """
+        key의 진행 중인 작업을 이후 호출이 공유하지 않도록 분리 (이미 기다리는 호출자는 그 결과를 받음)
+        데이터를 변경한 뒤 호출하면 변경 전에 시작된 조회 결과가 이후 호출에 반환되지 않는다.
+        :param key: 병합 기준 키
+        """
+        for inflight in list(self._inflight.values()):
+            inflight.pop(key, None)
+
+    @staticmethod
+    def _finish(inflight: Dict[Hashable, asyncio.Task], key: Hashable, task: asyncio.Task) -> None:
+        if inflight.get(key) is task:
+            del inflight[key]
+        # 모든 호출자가 취소된 경우에도 "exception was never retrieved" 경고가 나지 않도록 예외를 확인
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        병합 통계
+        :return: 호출 수, 실행 수, 병합 수
+        """
+        return {"name": self.name, "calls": self.calls, "executions": self.executions, "merged": self.merged}
+
+# 등록된 병합기 (통계 조회용)
+_registry: "weakref.WeakValueDictionary[str, Any]" = weakref.WeakValueDictionary()
+
+def single_flight(name: str) -> SingleFlight:
+    """
+    이름으로 비동기 요청 병합기 생성 및 등록
+    :param name: 병합기 이름
+    :return: SingleFlight 객체
+    """
+    flight = SingleFlight(name)
+    _registry[name] = flight
+    return flight
+
+def get_single_flight_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    등록된 모든 병합기의 통계
+    :return: 이름별 통계
+    """
+    return {name: flight.stats() for name, flight in list(_registry.items())}
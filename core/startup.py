@@ -0,0 +1,65 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+class StartupTimer:
+    """
+    애플리케이션 시작 단계별 소요 시간 기록
+    phase: 시작 시 순서대로 실행되는 단계 (import, config, routers, jwks 등)
+    lazy: 첫 사용 시점으로 미룬 초기화 (AWS 클라이언트 생성 등)
+    """
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.phases: List[Dict[str, Any]] = []
+        self.lazy: List[Dict[str, Any]] = []
+        self.ready_at: Optional[float] = None
+
+    def _elapsed_ms(self, at: float) -> float:
+        return round((at - self.started_at) * 1000, 2)
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        시작 단계 소요 시간 측정
+        :param name: 단계 이름
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append({
+                "name": name,
+                "start_ms": self._elapsed_ms(started),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2)
+            })
+
+    def record_lazy(self, name: str, duration: float) -> None:
+        """
+        지연 초기화 소요 시간 기록
+        :param name: 초기화 대상 이름
+        :param duration: 소요 시간 (초)
+        """
+        self.lazy.append({
+            "name": name,
+            "at_ms": self._elapsed_ms(time.perf_counter()),
+            "duration_ms": round(duration * 1000, 2)
+        })
+
+    def mark_ready(self) -> None:
+        if self.ready_at is None:
+            self.ready_at = time.perf_counter()
+
+    def report(self) -> Dict[str, Any]:
+        """
+        시작 소요 시간 보고서
+        :return: 단계별/지연 초기화 소요 시간과 준비 완료까지의 시간
+        """
+        return {
+            "ready": self.ready_at is not None,
+            "ready_ms": None if self.ready_at is None else self._elapsed_ms(self.ready_at),
+            "phases": list(self.phases),
+            "lazy": list(self.lazy)
+        }
+
+# 이 모듈이 처음 import된 시점을 기준으로 측정
+startup = StartupTimer()
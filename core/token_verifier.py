@@ -0,0 +1,92 @@
+import base64
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from app.core.cache import TTLCache
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+class CognitoTokenVerifier:
+    """
+    Cognito JWT 검증기
+    토큰을 한 번만 분리/디코딩하여 서명과 클레임(exp, iss, aud/client_id, token_use)을 함께 검증하고,
+    최근 검증된 토큰은 만료 시각까지 LRU에 보관하여 같은 토큰의 재검증을 생략한다.
+    """
+    def __init__(
+        self,
+        key_provider: Callable[[str], Awaitable[Any]],
+        issuer: Optional[str] = None,
+        client_id: Optional[str] = None,
+        token_uses: Iterable[str] = ("access", "id"),
+        algorithms: Iterable[str] = ("RS256",),
+        cache_size: int = 1024
+    ):
+        """
+        :param key_provider: kid로 공개 키 객체를 반환하는 코루틴 함수
+        :param issuer: 기대하는 iss (None이면 검사하지 않음)
+        :param client_id: 기대하는 앱 클라이언트 ID - ID 토큰은 aud, 액세스 토큰은 client_id와 비교 (None이면 검사하지 않음)
+        :param token_uses: 허용할 token_use 값
+        :param algorithms: 허용할 서명 알고리즘
+        :param cache_size: 검증 결과 LRU 크기 (0이면 캐시하지 않음)
+        """
+        self.key_provider = key_provider
+        self.issuer = issuer
+        self.client_id = client_id
+        self.token_uses = frozenset(token_uses)
+        self.algorithms = frozenset(algorithms)
+        self._verified = TTLCache(maxsize=cache_size, ttl=0)
+
+    async def verify(self, token: str) -> Dict[str, Any]:
+        """
+        토큰 검증
+        :param token: JWT 문자열
+        :return: 검증된 클레임 (호출자별 복사본)
+        """
+        claims = self._verified.get(token)
+        if claims is not None:
+            if time.time() >= claims["exp"]:
+                raise ValueError("Token is expired")
+            return dict(claims)
+
+        try:
+            header_segment, payload_segment, signature_segment = token.split(".")
+            header = json.loads(_b64decode(header_segment))
+            claims = json.loads(_b64decode(payload_segment))
+            signature = _b64decode(signature_segment)
+        except (ValueError, TypeError):
+            raise ValueError("Malformed token")
+        if not isinstance(header, dict) or not isinstance(claims, dict):
+            raise ValueError("Malformed token")
+
+        if header.get("alg") not in self.algorithms:
+            raise ValueError("Unsupported token algorithm")
+        kid = header.get("kid")
+        if not kid:
+            raise ValueError("Token has no key id")
+
+        key = await self.key_provider(kid)
+        if not key.verify(f"{header_segment}.{payload_segment}".encode(), signature):
+            raise ValueError("Signature verification failed")
+
+        self._validate_claims(claims)
+        self._verified.set(token, claims, ttl=claims["exp"] - time.time())
+        return dict(claims)
+
+    def _validate_claims(self, claims: Dict[str, Any]) -> None:
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)):
+            raise ValueError("Token has no expiration")
+        if time.time() >= exp:
+            raise ValueError("Token is expired")
+        if self.issuer and claims.get("iss") != self.issuer:
+            raise ValueError("Invalid token issuer")
+        token_use = claims.get("token_use")
+        if token_use not in self.token_uses:
+            raise ValueError("Invalid token use")
+        if self.client_id:
+            # ID 토큰은 aud, 액세스 토큰은 client_id 클레임에 앱 클라이언트 ID가 들어 있음
+            audience = claims.get("aud") if token_use == "id" else claims.get("client_id")
+            if audience != self.client_id:
+                raise ValueError("Invalid token audience")
@@ -1,32 +1,103 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from app.api import auth, tenants, users, accounts, opportunities, onboarding
-from app.core.config import settings
+from app.core.startup import startup
+
+with startup.phase("import"):
+    import argparse
+    import asyncio
+    import json
+    import os
+    from fastapi import Depends, FastAPI
+    from fastapi.responses import JSONResponse
+    from app.api import auth, tenants, users, accounts, opportunities, onboarding, analytics, export
+    from app.core.config import settings, run_settings_reloader
+    from app.core.cors import DynamicCORSMiddleware
+    from app.core.exceptions import NotFoundException
+    from app.core.jwks import jwks_manager
+    from app.core.responses import FastJSONResponse
+    from app.core.launcher import worker_state, watch_memory
+    from app.core.revocation import check_revocation_store
+    from app.core.singleflight import get_single_flight_stats
+    from app.utils.pagination import check_cursor_secret
 
 # FastAPI 애플리케이션 인스턴스 생성
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="Multi-tenant CRM SaaS application",
     version="1.0.0",
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=FastJSONResponse
 )
 
-# CORS 미들웨어 설정
+# CORS 미들웨어 설정 (허용 출처는 요청마다 settings.ALLOWED_ORIGINS에서 읽음)
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS,
+    DynamicCORSMiddleware,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 # API 라우터 포함
-app.include_router(auth.router, prefix="/api/v1/auth", tags=["auth"])
-app.include_router(users.router, prefix="/api/v1/users", tags=["users"])
-app.include_router(accounts.router, prefix="/api/v1/accounts", tags=["accounts"])
-app.include_router(opportunities.router, prefix="/api/v1/opportunities", tags=["opportunities"])
-app.include_router(tenants.router, prefix="/api/v1/tenants", tags=["tenants"])
-app.include_router(onboarding.router, prefix="/api/v1/onboarding", tags=["onboarding"])
+with startup.phase("routers"):
+    app.include_router(auth.router, prefix="/api/v1/auth", tags=["auth"])
+    app.include_router(users.router, prefix="/api/v1/users", tags=["users"])
+    app.include_router(accounts.router, prefix="/api/v1/accounts", tags=["accounts"])
+    app.include_router(opportunities.router, prefix="/api/v1/opportunities", tags=["opportunities"])
+    app.include_router(tenants.router, prefix="/api/v1/tenants", tags=["tenants"])
+    app.include_router(onboarding.router, prefix="/api/v1/onboarding", tags=["onboarding"])
+    app.include_router(analytics.router, prefix="/api/v1/analytics", tags=["analytics"])
+    app.include_router(export.router, prefix="/api/v1/export", tags=["export"])
+
+def check_shared_settings(multi_process: bool) -> None:
+    check_cursor_secret(multi_process)
+    check_revocation_store(multi_process)
+
+@app.on_event("startup")
+async def check_settings():
+    """
+    워커 간에 공유되어야 하는 설정 확인 (커서 서명 키나 토큰 폐기 목록 파일이 없으면 여러 워커로 시작 실패)
+    """
+    check_shared_settings(multi_process=worker_state["prefork_worker"] or settings.WEB_CONCURRENCY != 1)
+
+@app.on_event("startup")
+async def start_jwks_refresher():
+    """
+    JWKS 초기 로드 및 백그라운드 갱신 시작
+    """
+    with startup.phase("jwks"):
+        await jwks_manager.start(preload=settings.JWKS_PRELOAD)
+
+@app.on_event("startup")
+async def start_settings_reloader():
+    """
+    SETTINGS_RELOAD_INTERVAL_SECONDS가 설정되어 있으면 설정 주기적 재로드 시작
+    """
+    if settings.PARAMETER_STORE_ENABLED and settings.SETTINGS_RELOAD_INTERVAL_SECONDS > 0:
+        app.state.settings_reloader = asyncio.get_running_loop().create_task(
+            run_settings_reloader(settings.SETTINGS_RELOAD_INTERVAL_SECONDS)
+        )
+
+@app.on_event("startup")
+async def start_memory_watchdog():
+    """
+    pre-fork 워커에서 WORKER_MAX_MEMORY_MB가 설정되어 있으면 메모리 감시 시작
+    """
+    if worker_state["prefork_worker"] and settings.WORKER_MAX_MEMORY_MB > 0:
+        app.state.memory_watchdog = asyncio.get_running_loop().create_task(
+            watch_memory(settings.WORKER_MAX_MEMORY_MB, settings.WORKER_MEMORY_CHECK_INTERVAL_SECONDS)
+        )
+
+@app.on_event("startup")
+async def mark_ready():
+    # 마지막 startup 핸들러 - 여기까지가 요청 처리 준비 시간
+    startup.mark_ready()
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    await jwks_manager.stop()
+    worker_state["draining"] = True
+    for name in ("settings_reloader", "memory_watchdog"):
+        task = getattr(app.state, name, None)
+        if task is not None:
+            task.cancel()
 
 @app.get("/")
 async def root():
@@ -42,6 +113,64 @@ async def health_check():
     """
     return {"status": "healthy"}
 
+def require_internal_endpoints():
+    """
+    내부 진단 엔드포인트는 인증이 없으므로 INTERNAL_ENDPOINTS_ENABLED가 켜져 있을 때만 응답 (아니면 404)
+    """
+    if not settings.INTERNAL_ENDPOINTS_ENABLED:
+        raise NotFoundException("Not Found")
+
+@app.get("/internal/ready", include_in_schema=False, dependencies=[Depends(require_internal_endpoints)])
+async def readiness_check():
+    """
+    워커별 준비 상태 - 시작 완료 전이거나 종료(재시작) 중이면 503
+    """
+    ready = startup.ready_at is not None and not worker_state["draining"]
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, "pid": os.getpid(), "draining": worker_state["draining"]}
+    )
+
+@app.get("/internal/single-flight", include_in_schema=False, dependencies=[Depends(require_internal_endpoints)])
+async def single_flight_stats():
+    """
+    요청 병합(single-flight) 통계 - 병합기별 호출/실행/병합 수
+    """
+    return get_single_flight_stats()
+
+@app.get("/internal/startup", include_in_schema=False, dependencies=[Depends(require_internal_endpoints)])
+async def startup_report():
+    """
+    시작 단계별 소요 시간 보고서 (import는 config를 포함)
+    """
+    return startup.report()
+
+async def _run_startup_report() -> dict:
+    """
+    startup/shutdown 핸들러만 실행하여 시작 보고서 생성 (서버는 띄우지 않음)
+    """
+    await app.router.startup()
+    try:
+        return startup.report()
+    finally:
+        await app.router.shutdown()
+
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="CRM SaaS API server")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=settings.WEB_CONCURRENCY, help="워커 프로세스 수 (0이면 CPU 수)")
+    parser.add_argument("--max-requests", type=int, default=None, help="워커 재시작 전 최대 처리 요청 수")
+    parser.add_argument("--startup-report", action="store_true", help="시작 단계별 소요 시간을 출력하고 종료")
+    args = parser.parse_args()
+
+    if args.startup_report:
+        print(json.dumps(asyncio.run(_run_startup_report()), indent=2))
+    elif args.workers != 1:
+        from app.core.launcher import run
+        # 워커를 띄우기 전에 확인 (워커마다 시작 실패를 반복하지 않도록)
+        check_shared_settings(multi_process=True)
+        run(app, args.workers, args.host, args.port, args.max_requests)
+    else:
+        import uvicorn
+        uvicorn.run(app, host=args.host, port=args.port)
@@ -1,4 +1,5 @@
 from .tenant import TenantModel
 from .user import UserModel
 from .account import AccountModel
-from .opportunity import OpportunityModel
\ No newline at end of file
+from .opportunity import OpportunityModel
+from .tenant_stats import TenantStatsModel
\ No newline at end of file
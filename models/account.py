@@ -1,9 +1,23 @@
 from pynamodb.models import Model
 from pynamodb.attributes import UnicodeAttribute, NumberAttribute, UTCDateTimeAttribute
+from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
 from datetime import datetime
+from app.core.aws_clients import AWS_MAX_POOL_CONNECTIONS
 from app.core.config import settings
 import os
 
+class AccountActiveIndex(GlobalSecondaryIndex):
+    """
+    활성 계정만 포함하는 희소 GSI (active_tenant_id 파티션, account_id 정렬 키)
+    active_tenant_id는 활성 항목에만 설정되므로 비활성(소프트 삭제) 항목은 인덱스에 들어가지 않는다.
+    """
+    class Meta:
+        index_name = "active_tenant_id-account_id-index"
+        projection = AllProjection()
+
+    active_tenant_id = UnicodeAttribute(hash_key=True)
+    account_id = UnicodeAttribute(range_key=True)
+
 class AccountModel(Model):
     """
     고객 계정 정보를 저장하는 DynamoDB 모델
@@ -11,6 +25,7 @@ class AccountModel(Model):
     class Meta:
         table_name = settings.DYNAMODB_ACCOUNT_TABLE
         region = settings.AWS_REGION
+        max_pool_connections = AWS_MAX_POOL_CONNECTIONS
 
     account_id = UnicodeAttribute(hash_key=True)
     tenant_id = UnicodeAttribute(range_key=True)
@@ -19,7 +34,12 @@ class AccountModel(Model):
     created_at = UTCDateTimeAttribute(default=datetime.utcnow)
     updated_at = UTCDateTimeAttribute(default=datetime.utcnow)
     is_active = NumberAttribute(default=1)  # 1: 활성, 0: 비활성
+    active_tenant_id = UnicodeAttribute(null=True)  # 활성 항목에만 tenant_id 값 설정 (active_index 키)
+    version = NumberAttribute(null=True)  # 변경 시마다 1씩 증가 (낙관적 동시성 제어, 없으면 0으로 간주)
+
+    active_index = AccountActiveIndex()
 
     def save(self, **kwargs):
         self.updated_at = datetime.utcnow()
+        self.active_tenant_id = self.tenant_id if self.is_active else None
         super().save(**kwargs)
\ No newline at end of file
@@ -1,6 +1,7 @@
 from pynamodb.models import Model
 from pynamodb.attributes import UnicodeAttribute, BooleanAttribute, UTCDateTimeAttribute
 from datetime import datetime
+from app.core.aws_clients import AWS_MAX_POOL_CONNECTIONS
 from app.core.config import settings
 import os
 
@@ -11,6 +12,7 @@ class TenantModel(Model):
     class Meta:
         table_name = settings.DYNAMODB_TENANT_TABLE
         region = settings.AWS_REGION
+        max_pool_connections = AWS_MAX_POOL_CONNECTIONS
 
     tenant_id = UnicodeAttribute(hash_key=True)  # Cognito 그룹 이름과 연동
     tenant_name = UnicodeAttribute()
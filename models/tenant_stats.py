@@ -0,0 +1,41 @@
+from pynamodb.models import Model
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute, UTCDateTimeAttribute
+from datetime import datetime
+from app.core.aws_clients import AWS_MAX_POOL_CONNECTIONS
+from app.core.config import settings
+from app.schemas.opportunity import OpportunityStage
+
+class TenantStatsModel(Model):
+    """
+    테넌트별 집계 값을 저장하는 DynamoDB 모델
+    계정/영업 기회 쓰기와 같은 트랜잭션 안에서 ADD 업데이트로 갱신된다.
+    """
+    class Meta:
+        table_name = settings.DYNAMODB_TENANT_STATS_TABLE
+        region = settings.AWS_REGION
+        max_pool_connections = AWS_MAX_POOL_CONNECTIONS
+
+    tenant_id = UnicodeAttribute(hash_key=True)
+    account_count = NumberAttribute(default=0)  # 활성 계정 수
+    opportunity_count = NumberAttribute(default=0)  # 활성 영업 기회 수
+    total_expected_revenue = NumberAttribute(default=0)  # 활성 영업 기회 기대 매출 합계
+    prospecting_count = NumberAttribute(default=0)
+    prospecting_revenue = NumberAttribute(default=0)
+    qualification_count = NumberAttribute(default=0)
+    qualification_revenue = NumberAttribute(default=0)
+    committed_count = NumberAttribute(default=0)
+    committed_revenue = NumberAttribute(default=0)
+    closed_lost_count = NumberAttribute(default=0)
+    closed_lost_revenue = NumberAttribute(default=0)
+    closed_won_count = NumberAttribute(default=0)
+    closed_won_revenue = NumberAttribute(default=0)
+    updated_at = UTCDateTimeAttribute(default=datetime.utcnow)
+
+# 영업 기회 단계별 (건수, 기대 매출) 집계 속성 이름
+STAGE_STAT_ATTRIBUTES = {
+    OpportunityStage.PROSPECTING: ("prospecting_count", "prospecting_revenue"),
+    OpportunityStage.QUALIFICATION: ("qualification_count", "qualification_revenue"),
+    OpportunityStage.COMMITTED: ("committed_count", "committed_revenue"),
+    OpportunityStage.CLOSED_LOST: ("closed_lost_count", "closed_lost_revenue"),
+    OpportunityStage.CLOSED_WON: ("closed_won_count", "closed_won_revenue"),
+}
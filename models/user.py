@@ -1,9 +1,23 @@
 from pynamodb.models import Model
-from pynamodb.attributes import UnicodeAttribute, BooleanAttribute, UTCDateTimeAttribute, ListAttribute
+from pynamodb.attributes import UnicodeAttribute, BooleanAttribute, NumberAttribute, UTCDateTimeAttribute, ListAttribute
+from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
 from datetime import datetime
+from app.core.aws_clients import AWS_MAX_POOL_CONNECTIONS
 from app.core.config import settings
 import os
 
+class UserActiveIndex(GlobalSecondaryIndex):
+    """
+    활성 사용자만 포함하는 희소 GSI (active_tenant_id 파티션, user_id 정렬 키)
+    active_tenant_id는 활성 항목에만 설정되므로 비활성(소프트 삭제) 항목은 인덱스에 들어가지 않는다.
+    """
+    class Meta:
+        index_name = "active_tenant_id-user_id-index"
+        projection = AllProjection()
+
+    active_tenant_id = UnicodeAttribute(hash_key=True)
+    user_id = UnicodeAttribute(range_key=True)
+
 class UserModel(Model):
     """
     사용자 정보를 저장하는 DynamoDB 모델
@@ -11,6 +25,7 @@ class UserModel(Model):
     class Meta:
         table_name = settings.DYNAMODB_USER_TABLE
         region = settings.AWS_REGION
+        max_pool_connections = AWS_MAX_POOL_CONNECTIONS
 
     user_id = UnicodeAttribute(hash_key=True)  # Cognito의 사용자 ID와 연동
     tenant_name = UnicodeAttribute(range_key=True)  # 테넌트 ID (Cognito 그룹 이름)
@@ -22,7 +37,12 @@ class UserModel(Model):
     updated_at = UTCDateTimeAttribute(default=datetime.utcnow)
     is_active = BooleanAttribute(default=True)  # 1: 활성, 0: 비활성
     managed_account_ids = ListAttribute(default=list)  # 사용자가 관리하는 계정 ID 목록
+    active_tenant_id = UnicodeAttribute(null=True)  # 활성 항목에만 tenant_name 값 설정 (active_index 키)
+    version = NumberAttribute(null=True)  # 변경 시마다 1씩 증가 (낙관적 동시성 제어, 없으면 0으로 간주)
+
+    active_index = UserActiveIndex()
 
     def save(self, **kwargs):
         self.updated_at = datetime.utcnow()
+        self.active_tenant_id = self.tenant_name if self.is_active else None
         super().save(**kwargs)
\ No newline at end of file
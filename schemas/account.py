@@ -16,6 +16,7 @@ class AccountUpdate(BaseModel):
     name: Optional[str] = Field(None, description="고객 계정의 이름")
     manager_id: Optional[str] = Field(None, description="고객 계정 담당자의 사용자 ID")
     is_active: Optional[bool] = Field(None, description="고객 계정의 활성 상태")
+    version: Optional[int] = Field(None, description="마지막으로 읽은 버전 (주어지면 그 이후 다른 변경이 있었을 때 409 반환)")
 
 class AccountInDB(AccountBase):
     """데이터베이스에 저장된 고객 계정 정보를 표현하는 스키마"""
@@ -24,6 +25,7 @@ class AccountInDB(AccountBase):
     created_at: datetime = Field(..., description="고객 계정 생성 시간")
     updated_at: datetime = Field(..., description="고객 계정 정보 최종 수정 시간")
     is_active: bool = Field(..., description="고객 계정의 활성 상태")
+    version: int = Field(0, description="고객 계정의 버전 (변경 시마다 증가)")
 
 class AccountOut(AccountInDB):
     """API 응답으로 반환되는 고객 계정 정보 스키마"""
@@ -30,6 +30,7 @@ class OpportunityUpdate(BaseModel):
     expected_revenue: Optional[float] = Field(None, description="예상 매출")
     manager_id: Optional[str] = Field(None, description="영업 기회 담당자의 사용자 ID")
     is_active: Optional[bool] = Field(None, description="영업 기회의 활성 상태")
+    version: Optional[int] = Field(None, description="마지막으로 읽은 버전 (주어지면 그 이후 다른 변경이 있었을 때 409 반환)")
 
 class OpportunityInDB(OpportunityBase):
     """데이터베이스에 저장된 영업 기회 정보를 표현하는 스키마"""
@@ -38,6 +39,7 @@ class OpportunityInDB(OpportunityBase):
     created_at: datetime = Field(..., description="영업 기회 생성 시간")
     updated_at: datetime = Field(..., description="영업 기회 정보 최종 수정 시간")
     is_active: bool = Field(..., description="영업 기회의 활성 상태")
+    version: int = Field(0, description="영업 기회의 버전 (변경 시마다 증가)")
 
 class OpportunityOut(OpportunityInDB):
     """API 응답으로 반환되는 영업 기회 정보 스키마"""
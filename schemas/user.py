@@ -23,6 +23,7 @@ class UserUpdate(BaseModel):
     familyname: str = Field(..., description="사용자의 성")
     role: Optional[str] = Field(None, description="사용자의 역할 (admin 또는 user)")
     is_active: Optional[bool] = Field(None, description="사용자의 활성 상태")
+    version: Optional[int] = Field(None, description="마지막으로 읽은 버전 (주어지면 그 이후 다른 변경이 있었을 때 409 반환)")
 
 class UserInDB(UserBase):
     """데이터베이스에 저장된 사용자 정보를 표현하는 스키마"""
@@ -32,6 +33,7 @@ class UserInDB(UserBase):
     updated_at: datetime = Field(..., description="사용자 정보 최종 수정 시간")
     is_active: bool = Field(..., description="사용자의 활성 상태")
     managed_account_ids: List[str] = Field(..., description="사용자가 관리하는 계정 ID 목록")
+    version: int = Field(0, description="사용자 정보의 버전 (변경 시마다 증가)")
 
 class UserOut(UserInDB):
     """API 응답으로 반환되는 사용자 정보 스키마"""
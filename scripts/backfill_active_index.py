@@ -0,0 +1,141 @@
+"""
+희소 활성 인덱스(active_tenant_id-*-index) 생성 및 기존 항목 backfill
+
+활성 항목에는 active_tenant_id(테넌트 ID)를 설정하고 비활성 항목에서는 제거한다.
+이미 올바른 항목은 건너뛰므로 여러 번 실행해도 안전하다.
+
+적용 순서:
+    1. --create-index로 인덱스를 만들고 backfill (인덱스가 CREATING 상태여도 진행 가능)
+    2. 활성 인덱스를 읽는 애플리케이션 배포
+    3. 배포 전 버전이 그 사이에 저장한 항목을 반영하도록 한 번 더 실행
+
+사용법:
+    python -m app.scripts.backfill_active_index [--create-index] [--dry-run] [--segments 4] [--tables accounts opportunities users]
+"""
+import argparse
+import asyncio
+import sys
+from typing import Dict, Type
+from pynamodb.exceptions import UpdateError
+from pynamodb.models import Model
+from app.models.account import AccountModel
+from app.models.opportunity import OpportunityModel
+from app.models.user import UserModel
+from app.utils.async_dynamodb import db_call
+from app.utils.dynamodb_utils import get_dynamodb_client
+
+# 테이블 이름 -> (모델, 테넌트 키 속성)
+TABLES = {
+    "accounts": (AccountModel, "tenant_id"),
+    "opportunities": (OpportunityModel, "tenant_id"),
+    "users": (UserModel, "tenant_name"),
+}
+
+def create_active_index(model_cls: Type[Model]) -> bool:
+    """
+    테이블에 활성 인덱스가 없으면 생성 요청
+    :param model_cls: PynamoDB 모델 클래스
+    :return: 새로 생성을 요청했는지 여부
+    """
+    client = get_dynamodb_client()
+    index = model_cls.active_index
+    table = client.describe_table(TableName=model_cls.Meta.table_name)["Table"]
+    if any(gsi["IndexName"] == index.Meta.index_name for gsi in table.get("GlobalSecondaryIndexes", [])):
+        return False
+    range_key = model_cls._hash_key_attribute().attr_name  # 인덱스 정렬 키는 항목 ID
+    create = {
+        "IndexName": index.Meta.index_name,
+        "KeySchema": [
+            {"AttributeName": "active_tenant_id", "KeyType": "HASH"},
+            {"AttributeName": range_key, "KeyType": "RANGE"},
+        ],
+        "Projection": {"ProjectionType": "ALL"},
+    }
+    throughput = table.get("ProvisionedThroughput", {})
+    if table.get("BillingModeSummary", {}).get("BillingMode") != "PAY_PER_REQUEST" and throughput.get("ReadCapacityUnits"):
+        # 프로비저닝 모드 테이블은 기본 테이블과 같은 처리량으로 생성
+        create["ProvisionedThroughput"] = {
+            "ReadCapacityUnits": throughput["ReadCapacityUnits"],
+            "WriteCapacityUnits": throughput["WriteCapacityUnits"],
+        }
+    client.update_table(
+        TableName=model_cls.Meta.table_name,
+        AttributeDefinitions=[
+            {"AttributeName": "active_tenant_id", "AttributeType": "S"},
+            {"AttributeName": range_key, "AttributeType": "S"},
+        ],
+        GlobalSecondaryIndexUpdates=[{"Create": create}],
+    )
+    return True
+
+def backfill_segment(model_cls: Type[Model], tenant_key: str, segment: int, total_segments: int, dry_run: bool) -> Dict[str, int]:
+    """
+    테이블 스캔 세그먼트 하나의 active_tenant_id를 맞춤 (블로킹, 스레드 풀에서 실행)
+    읽은 뒤 is_active가 바뀐 항목은 애플리케이션 쓰기가 인덱스 키를 관리하므로 건너뛴다.
+    :return: 결과별 항목 수 (scanned, set, removed, skipped)
+    """
+    counts = {"scanned": 0, "set": 0, "removed": 0, "skipped": 0}
+    hash_key = model_cls._hash_key_attribute().attr_name
+    items = model_cls.scan(
+        segment=segment,
+        total_segments=total_segments,
+        attributes_to_get=[hash_key, tenant_key, "is_active", "active_tenant_id"],
+    )
+    for item in items:
+        counts["scanned"] += 1
+        tenant_id = getattr(item, tenant_key)
+        desired = tenant_id if item.is_active else None
+        if item.active_tenant_id == desired:
+            continue
+        action = "set" if desired else "removed"
+        if not dry_run:
+            try:
+                item.update(
+                    actions=[model_cls.active_tenant_id.set(desired) if desired else model_cls.active_tenant_id.remove()],
+                    condition=model_cls.is_active == item.is_active,
+                )
+            except UpdateError as e:
+                if e.cause_response_code != "ConditionalCheckFailedException":
+                    raise
+                action = "skipped"
+        counts[action] += 1
+    return counts
+
+async def backfill_table(model_cls: Type[Model], tenant_key: str, segments: int, dry_run: bool) -> Dict[str, int]:
+    """
+    테이블 전체를 병렬 스캔 세그먼트로 backfill
+    :return: 결과별 항목 수 합계
+    """
+    results = await asyncio.gather(*(
+        db_call(model_cls, backfill_segment, model_cls, tenant_key, segment, segments, dry_run)
+        for segment in range(segments)
+    ))
+    totals = {"scanned": 0, "set": 0, "removed": 0, "skipped": 0}
+    for counts in results:
+        for key, value in counts.items():
+            totals[key] += value
+    return totals
+
+async def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Create and backfill the sparse active-item indexes")
+    parser.add_argument("--tables", nargs="*", choices=sorted(TABLES), default=sorted(TABLES), help="대상 테이블")
+    parser.add_argument("--create-index", action="store_true", help="인덱스가 없으면 생성")
+    parser.add_argument("--segments", type=int, default=4, help="병렬 스캔 세그먼트 수")
+    parser.add_argument("--dry-run", action="store_true", help="변경할 항목 수만 보고")
+    args = parser.parse_args(argv)
+
+    for name in args.tables:
+        model_cls, tenant_key = TABLES[name]
+        if args.create_index and not args.dry_run:
+            if create_active_index(model_cls):
+                print(f"[{name}] creating index {model_cls.active_index.Meta.index_name}")
+        totals = await backfill_table(model_cls, tenant_key, args.segments, args.dry_run)
+        verb = "would update" if args.dry_run else "updated"
+        print(
+            f"[{name}] scanned={totals['scanned']} {verb}: set={totals['set']} removed={totals['removed']}"
+            f" skipped(concurrently changed)={totals['skipped']}"
+        )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
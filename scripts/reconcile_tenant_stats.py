@@ -0,0 +1,56 @@
+"""
+테넌트 집계(TenantStatsModel)를 계정/영업 기회 원본 데이터로부터 다시 계산하고 차이를 보고
+
+집계 항목이 없는 테넌트는 첫 쓰기 때 원본 데이터로 생성되지만(TenantStatsService.ensure_stats), 그 이전 버전이
+첫 쓰기의 ADD 업데이트로 만든 부분 항목은 잘못된 값으로 남아 있으므로 배포 후 --all로 한 번 실행해야 한다.
+
+사용법:
+    python -m app.scripts.reconcile_tenant_stats <tenant_id> [<tenant_id> ...] [--dry-run]
+    python -m app.scripts.reconcile_tenant_stats --all [--dry-run]
+"""
+import argparse
+import asyncio
+import sys
+from app.models.tenant import TenantModel
+from app.services.tenant_stats_service import TenantStatsService
+from app.utils.async_dynamodb import db_query
+
+async def reconcile_tenants(tenant_ids, apply: bool) -> int:
+    """
+    테넌트별 집계를 재계산하고 drift를 출력
+    :param tenant_ids: 대상 테넌트 ID 목록
+    :param apply: True이면 재계산된 값으로 덮어씀
+    :return: drift가 발견된 테넌트 수
+    """
+    drifted = 0
+    for tenant_id in tenant_ids:
+        drift = await TenantStatsService.reconcile(tenant_id, apply=apply)
+        if drift:
+            drifted += 1
+            print(f"[drift] {tenant_id}")
+            for attr, values in drift.items():
+                print(f"    {attr}: stored={values['stored']} actual={values['actual']}")
+        else:
+            print(f"[ok] {tenant_id}")
+    return drifted
+
+async def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Rebuild per-tenant aggregates and report drift")
+    parser.add_argument("tenant_ids", nargs="*", help="재계산할 테넌트 ID")
+    parser.add_argument("--all", action="store_true", help="모든 테넌트 재계산")
+    parser.add_argument("--dry-run", action="store_true", help="drift만 보고하고 저장하지 않음")
+    args = parser.parse_args(argv)
+
+    tenant_ids = list(args.tenant_ids)
+    if args.all:
+        tenants = await db_query(TenantModel, TenantModel.scan)
+        tenant_ids.extend(tenant.tenant_id for tenant in tenants)
+    if not tenant_ids:
+        parser.error("tenant_ids 또는 --all 중 하나가 필요합니다")
+
+    drifted = await reconcile_tenants(tenant_ids, apply=not args.dry_run)
+    print(f"{len(tenant_ids)} tenants checked, {drifted} with drift")
+    return 1 if drifted and args.dry_run else 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -1,10 +1,74 @@
+from app.core.cache import tenant_versions
+from app.core.config import settings
+from app.core.exceptions import ConflictException
 from app.models.account import AccountModel
+from app.models.tenant_stats import TenantStatsModel
 from app.schemas.account import AccountCreate, AccountUpdate, AccountInDB
+from app.services.raw_records import AccountRecord
+from app.services.tenant_stats_service import TenantStatsService
+from app.utils.fields import projection, select_fields
+from app.utils.pagination import CursorPage, encode_cursor, decode_cursor
+from app.utils.async_dynamodb import db_call, db_get, db_query_raw, db_query_raw_page, db_query_raw_pages
+from app.utils.item_updates import apply_update, check_version, current_version, transact_write, update_actions, update_item, version_condition, with_active_index
+from datetime import datetime
 from fastapi import HTTPException
-from typing import List
+from pynamodb.expressions.condition import Condition
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Union
 import uuid
 
 class AccountService:
+    @staticmethod
+    async def _save_with_stats(account: AccountModel, active_delta: int, condition: Optional[Condition] = None):
+        """
+        계정 저장과 테넌트 활성 계정 수 ADD 업데이트를 하나의 트랜잭션으로 실행
+        :param account: 저장할 계정
+        :param active_delta: 활성 계정 수 증감
+        :param condition: 계정 저장 조건
+        """
+        account.updated_at = datetime.utcnow()
+        account.active_tenant_id = account.tenant_id if account.is_active else None
+        if active_delta:
+            await TenantStatsService.ensure_stats(account.tenant_id)
+
+        def build(transaction):
+            transaction.save(account, condition=condition)
+            if active_delta:
+                transaction.update(
+                    TenantStatsModel(account.tenant_id),
+                    actions=TenantStatsService.account_count_actions(active_delta)
+                )
+
+        await transact_write(AccountModel, build, "Account was modified concurrently")
+        tenant_versions.bump(account.tenant_id)
+
+    @staticmethod
+    async def _update_with_stats(account: AccountModel, values: Dict[str, Any], active_delta: int, condition: Optional[Condition] = None):
+        """
+        계정의 지정 속성 UPDATE와 테넌트 활성 계정 수 ADD 업데이트를 하나의 트랜잭션으로 실행
+        :param account: 읽은 계정 (성공 시 변경 내용이 반영됨)
+        :param values: 변경할 속성 이름 -> 새 값
+        :param active_delta: 활성 계정 수 증감
+        :param condition: 계정 변경 조건 (기본: 읽은 시점의 버전과 같을 때만)
+        """
+        values = with_active_index(dict(values, updated_at=datetime.utcnow()), account.tenant_id)
+        actions = update_actions(AccountModel, values)
+        if condition is None:
+            condition = version_condition(AccountModel, current_version(account))
+        if active_delta:
+            await TenantStatsService.ensure_stats(account.tenant_id)
+
+        def build(transaction):
+            transaction.update(account, actions=actions, condition=condition)
+            if active_delta:
+                transaction.update(
+                    TenantStatsModel(account.tenant_id),
+                    actions=TenantStatsService.account_count_actions(active_delta)
+                )
+
+        await transact_write(AccountModel, build, "Account was modified concurrently")
+        apply_update(account, values)
+        tenant_versions.bump(account.tenant_id)
+
     @staticmethod
     async def create_account(account: AccountCreate) -> AccountInDB:
         """
@@ -17,10 +81,13 @@ class AccountService:
             account_id=account_id,
             tenant_id=account.tenant_id,
             name=account.name,
-            manager_id=account.manager_id
+            manager_id=account.manager_id,
+            version=1
         )
         try:
-            db_account.save()
+            await AccountService._save_with_stats(
+                db_account, 1, condition=AccountModel.account_id.does_not_exist()
+            )
             return AccountInDB(
                 account_id=db_account.account_id,
                 tenant_id=db_account.tenant_id,
@@ -28,21 +95,27 @@ class AccountService:
                 manager_id=db_account.manager_id,
                 created_at=db_account.created_at,
                 updated_at=db_account.updated_at,
-                is_active=db_account.is_active
+                is_active=db_account.is_active,
+                version=current_version(db_account)
             )
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Could not create account: {str(e)}")
 
     @staticmethod
-    async def get_account(account_id: str, tenant_id: str) -> AccountInDB:
+    async def get_account(account_id: str, tenant_id: str, fields: Optional[List[str]] = None) -> Union[AccountInDB, Dict[str, Any]]:
         """
         계정 ID와 테넌트 ID로 계정 조회
         :param account_id: 계정 ID
         :param tenant_id: 테넌트 ID
+        :param fields: 응답에 포함할 필드 (주어지면 해당 속성만 읽고 dict로 반환)
         :return: 조회된 계정 정보
         """
         try:
-            account = AccountModel.get(account_id, tenant_id)
+            account = await db_get(AccountModel, account_id, tenant_id, attributes_to_get=projection(AccountModel, fields))
+            if fields:
+                return select_fields(account, fields, AccountInDB)
             return AccountInDB(
                 account_id=account.account_id,
                 tenant_id=account.tenant_id,
@@ -50,7 +123,8 @@ class AccountService:
                 manager_id=account.manager_id,
                 created_at=account.created_at,
                 updated_at=account.updated_at,
-                is_active=account.is_active
+                is_active=account.is_active,
+                version=current_version(account)
             )
         except AccountModel.DoesNotExist:
             raise HTTPException(status_code=404, detail="Account not found")
@@ -58,18 +132,29 @@ class AccountService:
     @staticmethod
     async def update_account(account_id: str, tenant_id: str, account_update: AccountUpdate) -> AccountInDB:
         """
-        계정 정보 업데이트
+        계정 정보 업데이트 (변경된 속성만 단일 UpdateItem으로 반영)
+        활성 상태가 바뀌면 테넌트 집계도 함께 바뀌어야 하므로 읽은 뒤 버전 조건부 트랜잭션으로 반영한다.
         :param account_id: 업데이트할 계정 ID
         :param tenant_id: 테넌트 ID
-        :param account_update: 업데이트할 계정 정보
+        :param account_update: 업데이트할 계정 정보 (version이 주어지면 그 버전일 때만 반영, 아니면 409)
         :return: 업데이트된 계정 정보
         """
+        update_data = account_update.dict(exclude_unset=True)
+        expected_version = update_data.pop("version", None)
+        if "is_active" in update_data:
+            update_data["is_active"] = int(update_data["is_active"])
         try:
-            account = AccountModel.get(account_id, tenant_id)
-            update_data = account_update.dict(exclude_unset=True)
-            for key, value in update_data.items():
-                setattr(account, key, value)
-            account.save()
+            if "is_active" in update_data:
+                account = await db_get(AccountModel, account_id, tenant_id)
+                check_version(account, expected_version, "Account was modified concurrently")
+                active_delta = update_data["is_active"] - int(bool(account.is_active))
+                await AccountService._update_with_stats(account, update_data, active_delta)
+            else:
+                account = await update_item(
+                    AccountModel, account_id, tenant_id, update_data,
+                    expected_version=expected_version, conflict_detail="Account was modified concurrently"
+                )
+                tenant_versions.bump(tenant_id)
             return AccountInDB(
                 account_id=account.account_id,
                 tenant_id=account.tenant_id,
@@ -77,7 +162,8 @@ class AccountService:
                 manager_id=account.manager_id,
                 created_at=account.created_at,
                 updated_at=account.updated_at,
-                is_active=account.is_active
+                is_active=account.is_active,
+                version=current_version(account)
             )
         except AccountModel.DoesNotExist:
             raise HTTPException(status_code=404, detail="Account not found")
@@ -86,52 +172,137 @@ class AccountService:
     async def delete_account(account_id: str, tenant_id: str) -> bool:
         """
         계정 삭제 (소프트 삭제)
+        활성 계정일 때만 비활성화하는 조건부 트랜잭션 한 번으로 처리하며, 조건이 맞지 않을 때만 조회한다.
         :param account_id: 삭제할 계정 ID
         :param tenant_id: 테넌트 ID
         :return: 삭제 성공 여부
         """
         try:
-            account = AccountModel.get(account_id, tenant_id)
-            account.is_active = False
-            account.save()
+            await AccountService._update_with_stats(
+                AccountModel(account_id, tenant_id), {"is_active": 0}, -1, condition=AccountModel.is_active == 1
+            )
+            return True
+        except ConflictException:
+            # 없는 계정(404)인지 이미 비활성화된 계정인지 구분
+            try:
+                account = await db_get(AccountModel, account_id, tenant_id)
+            except AccountModel.DoesNotExist:
+                raise HTTPException(status_code=404, detail="Account not found")
+            if account.is_active:
+                raise
             return True
-        except AccountModel.DoesNotExist:
-            raise HTTPException(status_code=404, detail="Account not found")
 
     @staticmethod
-    async def list_accounts(tenant_id: str) -> List[AccountInDB]:
+    async def list_accounts(tenant_id: str) -> List[AccountRecord]:
         """
         테넌트의 모든 활성 계정 목록 조회
+        (원시 항목을 모델/스키마 객체 생성 없이 __slots__ 레코드로 바로 디코딩)
         :param tenant_id: 테넌트 ID
-        :return: 계정 목록
+        :return: 계정 레코드 목록
         """
-        accounts = AccountModel.query(tenant_id, AccountModel.is_active == True)
-        return [
-            AccountInDB(
-                account_id=account.account_id,
-                tenant_id=account.tenant_id,
-                name=account.name,
-                manager_id=account.manager_id,
-                created_at=account.created_at,
-                updated_at=account.updated_at,
-                is_active=account.is_active
-            )
-            for account in accounts
-        ]
+        # 활성 계정만 담긴 희소 GSI를 조회 (비활성 항목을 읽고 필터로 버리지 않음)
+        items = await db_query_raw(AccountModel, tenant_id, index_name=AccountModel.active_index.Meta.index_name)
+        return AccountRecord.from_items(items)
 
     @staticmethod
-    async def change_account_manager(account_id: str, tenant_id: str, new_manager_id: str) -> AccountInDB:
+    async def get_account_names(tenant_id: str) -> Dict[str, str]:
+        """
+        테넌트의 활성 계정 ID -> 계정 이름 조회 (내보내기의 계정 이름 조인용, 두 속성만 읽음)
+        :param tenant_id: 테넌트 ID
+        :return: 계정 ID -> 계정 이름
         """
-        계정 담당자 변경
+        id_attr, name_attr = AccountModel.account_id.attr_name, AccountModel.name.attr_name
+        items = await db_query_raw(
+            AccountModel,
+            tenant_id,
+            index_name=AccountModel.active_index.Meta.index_name,
+            attributes_to_get=[id_attr, name_attr]
+        )
+        return {item[id_attr]["S"]: item[name_attr]["S"] for item in items}
+
+    @staticmethod
+    async def get_account_names_by_id(tenant_id: str, account_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        지정한 계정들의 ID -> 계정 이름 조회 (활성 인덱스에 없는 비활성 계정용, BatchGetItem으로 두 속성만 읽음)
+        :param tenant_id: 테넌트 ID
+        :param account_ids: 계정 ID 목록
+        :return: 계정 ID -> 계정 이름 (없는 계정은 포함되지 않음)
+        """
+        keys = [(account_id, tenant_id) for account_id in account_ids]
+        attributes = [AccountModel.account_id.attr_name, AccountModel.name.attr_name]
+
+        def read():
+            return {account.account_id: account.name for account in AccountModel.batch_get(keys, attributes_to_get=attributes)}
+        return await db_call(AccountModel, read)
+
+    @staticmethod
+    async def list_accounts_page(tenant_id: str, size: int = 10, cursor: Optional[str] = None, include_total: bool = False, fields: Optional[List[str]] = None) -> CursorPage[Dict[str, Any]]:
+        """
+        테넌트의 활성 계정 목록을 커서 기반으로 한 페이지 조회
+        (원시 항목을 응답용 dict로 바로 디코딩 - 응답 스키마 검증은 라우터에서 한 번만 수행)
+        :param tenant_id: 테넌트 ID
+        :param size: 페이지당 항목 수
+        :param cursor: 이전 페이지의 next_cursor
+        :param include_total: 전체 항목 수 포함 여부
+        :param fields: 응답에 포함할 필드 (주어지면 해당 속성만 읽고 해당 필드만 반환)
+        :return: 계정 페이지
+        """
+        scope = f"active-accounts:{tenant_id}"
+        items, last_evaluated_key = await db_query_raw_page(
+            AccountModel,
+            tenant_id,
+            size,
+            index_name=AccountModel.active_index.Meta.index_name,
+            attributes_to_get=projection(AccountModel, fields),
+            exclusive_start_key=decode_cursor(cursor, scope)
+        )
+        total = None
+        if include_total:
+            total = await db_call(AccountModel, AccountModel.active_index.count, tenant_id)
+        return CursorPage[Dict[str, Any]].construct(
+            items=[AccountRecord.to_dict(item, fields) for item in items],
+            size=size,
+            next_cursor=encode_cursor(last_evaluated_key, scope),
+            total=total
+        )
+
+    @staticmethod
+    async def stream_accounts(tenant_id: str, fields: Optional[List[str]] = None, prefetch: bool = False) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        테넌트의 모든 활성 계정을 DynamoDB 페이지 단위로 응답용 dict로 디코딩하여 순차 반환 (스트리밍 응답용)
+        전체 목록을 메모리에 만들지 않으므로 테넌트 크기와 무관하게 한 페이지 분량만 유지한다.
+        :param tenant_id: 테넌트 ID
+        :param fields: 응답에 포함할 필드 (주어지면 해당 속성만 읽고 해당 필드만 반환)
+        :param prefetch: 현재 페이지를 처리하는 동안 다음 페이지를 미리 조회 (대량 내보내기용)
+        :return: 계정 dict 목록(페이지)의 비동기 이터레이터
+        """
+        pages = db_query_raw_pages(
+            AccountModel,
+            tenant_id,
+            index_name=AccountModel.active_index.Meta.index_name,
+            attributes_to_get=projection(AccountModel, fields),
+            page_size=settings.STREAM_PAGE_SIZE,
+            prefetch=prefetch
+        )
+        async for items in pages:
+            yield [AccountRecord.to_dict(item, fields) for item in items]
+
+    @staticmethod
+    async def change_account_manager(account_id: str, tenant_id: str, new_manager_id: str, expected_version: Optional[int] = None) -> AccountInDB:
+        """
+        계정 담당자 변경 (단일 UpdateItem)
         :param account_id: 계정 ID
         :param tenant_id: 테넌트 ID
         :param new_manager_id: 새로운 담당자 ID
+        :param expected_version: 주어지면 계정 버전이 일치할 때만 변경 (아니면 409)
         :return: 업데이트된 계정 정보
         """
         try:
-            account = AccountModel.get(account_id, tenant_id)
-            account.manager_id = new_manager_id
-            account.save()
+            account = await update_item(
+                AccountModel, account_id, tenant_id, {"manager_id": new_manager_id},
+                expected_version=expected_version, conflict_detail="Account was modified concurrently"
+            )
+            tenant_versions.bump(tenant_id)
             return AccountInDB(
                 account_id=account.account_id,
                 tenant_id=account.tenant_id,
@@ -139,7 +310,8 @@ class AccountService:
                 manager_id=account.manager_id,
                 created_at=account.created_at,
                 updated_at=account.updated_at,
-                is_active=account.is_active
+                is_active=account.is_active,
+                version=current_version(account)
             )
         except AccountModel.DoesNotExist:
-            raise HTTPException(status_code=404, detail="Account not found")
\ No newline at end of file
+            raise HTTPException(status_code=404, detail="Account not found")
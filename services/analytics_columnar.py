@@ -0,0 +1,171 @@
+from app.schemas.opportunity import OpportunityStage
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+import heapq
+
+_UNLOADED = object()
+_numpy = _UNLOADED
+
+def get_numpy():
+    """
+    numpy 모듈 (import 비용이 커서 첫 집계 시 로드, 설치되어 있지 않으면 None - 순수 파이썬 경로로 동작)
+    """
+    global _numpy
+    if _numpy is _UNLOADED:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+# 단계 코드: OpportunityStage 선언 순서의 인덱스
+STAGES: List[OpportunityStage] = list(OpportunityStage)
+STAGE_CODES: Dict[str, int] = {stage.value: code for code, stage in enumerate(STAGES)}
+
+# 컬럼 디코딩에 필요한 속성 (DynamoDB ProjectionExpression에 사용)
+OPPORTUNITY_COLUMN_ATTRIBUTES = ["account_id", "manager_id", "stage", "expected_revenue"]
+
+class OpportunityColumns:
+    """
+    영업 기회를 컬럼 형태로 보관하는 분석용 구조체
+    stage_codes: 단계 코드 (int8), revenue: 기대 매출 (float64),
+    account_codes / manager_codes: account_ids / manager_ids 목록에 대한 범주형 코드 (int32)
+    """
+    __slots__ = ("stage_codes", "revenue", "account_codes", "manager_codes", "account_ids", "manager_ids")
+
+    def __init__(self, stage_codes, revenue, account_codes, manager_codes, account_ids: List[str], manager_ids: List[str]):
+        self.stage_codes = stage_codes
+        self.revenue = revenue
+        self.account_codes = account_codes
+        self.manager_codes = manager_codes
+        self.account_ids = account_ids
+        self.manager_ids = manager_ids
+
+    def __len__(self) -> int:
+        return len(self.revenue)
+
+    @classmethod
+    def from_raw_items(cls, items: Iterable[Dict[str, Dict[str, Any]]]) -> "OpportunityColumns":
+        """
+        DynamoDB 원시 항목({"S": ...} / {"N": ...})을 모델/스키마 객체 생성 없이 바로 컬럼으로 디코딩
+        :param items: DynamoDB Query 응답의 Items
+        :return: 컬럼 구조체
+        """
+        account_index: Dict[str, int] = {}
+        manager_index: Dict[str, int] = {}
+        stage_codes, revenue, account_codes, manager_codes = [], [], [], []
+        for item in items:
+            stage_codes.append(STAGE_CODES[item["stage"]["S"]])
+            revenue.append(float(item["expected_revenue"]["N"]))
+            account_codes.append(account_index.setdefault(item["account_id"]["S"], len(account_index)))
+            manager_codes.append(manager_index.setdefault(item["manager_id"]["S"], len(manager_index)))
+        return cls._build(stage_codes, revenue, account_codes, manager_codes, account_index, manager_index)
+
+    @classmethod
+    def from_opportunities(cls, opportunities: Iterable[Any]) -> "OpportunityColumns":
+        """
+        OpportunityInDB / OpportunityModel 객체 목록을 컬럼으로 변환
+        :param opportunities: 영업 기회 객체 목록
+        :return: 컬럼 구조체
+        """
+        account_index: Dict[str, int] = {}
+        manager_index: Dict[str, int] = {}
+        stage_codes, revenue, account_codes, manager_codes = [], [], [], []
+        for opportunity in opportunities:
+            stage_codes.append(STAGE_CODES[OpportunityStage(opportunity.stage).value])
+            revenue.append(float(opportunity.expected_revenue))
+            account_codes.append(account_index.setdefault(opportunity.account_id, len(account_index)))
+            manager_codes.append(manager_index.setdefault(opportunity.manager_id, len(manager_index)))
+        return cls._build(stage_codes, revenue, account_codes, manager_codes, account_index, manager_index)
+
+    @classmethod
+    def _build(cls, stage_codes, revenue, account_codes, manager_codes, account_index, manager_index) -> "OpportunityColumns":
+        np = get_numpy()
+        if np is not None:
+            stage_codes = np.array(stage_codes, dtype=np.int8)
+            revenue = np.array(revenue, dtype=np.float64)
+            account_codes = np.array(account_codes, dtype=np.int32)
+            manager_codes = np.array(manager_codes, dtype=np.int32)
+        return cls(stage_codes, revenue, account_codes, manager_codes, list(account_index), list(manager_index))
+
+    def total_revenue(self) -> float:
+        """
+        전체 기대 매출 합계
+        """
+        np = get_numpy()
+        if np is not None:
+            return float(self.revenue.sum())
+        return float(sum(self.revenue))
+
+    def stage_totals(self) -> Tuple[List[int], List[float]]:
+        """
+        단계별 (건수, 기대 매출 합계) - STAGES 순서
+        :return: (단계별 건수 목록, 단계별 기대 매출 목록)
+        """
+        np = get_numpy()
+        if np is not None:
+            counts = np.bincount(self.stage_codes, minlength=len(STAGES))
+            sums = np.bincount(self.stage_codes, weights=self.revenue, minlength=len(STAGES))
+            return counts.tolist(), sums.tolist()
+        counts = [0] * len(STAGES)
+        sums = [0.0] * len(STAGES)
+        for code, value in zip(self.stage_codes, self.revenue):
+            counts[code] += 1
+            sums[code] += value
+        return counts, sums
+
+    def account_count(self, account_id: str) -> int:
+        """
+        계정의 영업 기회 수
+        """
+        try:
+            code = self.account_ids.index(account_id)
+        except ValueError:
+            return 0
+        np = get_numpy()
+        if np is not None:
+            return int((self.account_codes == code).sum())
+        return sum(1 for account_code in self.account_codes if account_code == code)
+
+    def revenue_by_account(self) -> Dict[str, float]:
+        """
+        계정별 기대 매출 합계
+        """
+        np = get_numpy()
+        if np is not None:
+            sums = np.bincount(self.account_codes, weights=self.revenue, minlength=len(self.account_ids))
+            return dict(zip(self.account_ids, sums.tolist()))
+        sums = [0.0] * len(self.account_ids)
+        for code, value in zip(self.account_codes, self.revenue):
+            sums[code] += value
+        return dict(zip(self.account_ids, sums))
+
+    def top_accounts(self, account_ids: Sequence[str], limit: int) -> List[Tuple[int, float]]:
+        """
+        주어진 계정 중 기대 매출 합계 상위 limit개 선택 (동률이면 account_ids 순서 유지)
+        :param account_ids: 후보 계정 ID 목록 (예: 활성 계정)
+        :param limit: 선택할 계정 수
+        :return: (account_ids 내 인덱스, 기대 매출 합계) 목록 - 매출 내림차순
+        """
+        np = get_numpy()
+        if limit <= 0 or not account_ids:
+            return []
+        revenue_by_account = self.revenue_by_account()
+        if np is not None:
+            revenue = np.fromiter(
+                (revenue_by_account.get(account_id, 0.0) for account_id in account_ids),
+                dtype=np.float64,
+                count=len(account_ids)
+            )
+            if limit < len(revenue):
+                # 상위 후보만 부분 정렬 후, 경계 동률을 포함하도록 임계값 이상을 모두 취해 안정 정렬
+                threshold = revenue[np.argpartition(-revenue, limit - 1)[limit - 1]]
+                candidates = np.flatnonzero(revenue >= threshold)
+            else:
+                candidates = np.arange(len(revenue))
+            order = candidates[np.argsort(-revenue[candidates], kind="stable")][:limit]
+            return [(int(index), float(revenue[index])) for index in order]
+        revenue = [revenue_by_account.get(account_id, 0.0) for account_id in account_ids]
+        # sorted(..., reverse=True)[:limit]와 같은 순서 (동률은 입력 순서)로 상위 limit개만 힙으로 선택
+        order = heapq.nlargest(limit, range(len(revenue)), key=revenue.__getitem__)
+        return [(index, revenue[index]) for index in order]
@@ -1,82 +1,132 @@
-from app.services.account_service import AccountService
-from app.services.opportunity_service import OpportunityService
-from typing import Dict, List
+from app.core.cache import make_cache, tenant_versions
+from app.core.config import settings
+from app.core.singleflight import single_flight
+from app.models.tenant_stats import TenantStatsModel, STAGE_STAT_ATTRIBUTES
+from app.services.tenant_snapshot import TenantSnapshot, get_tenant_snapshot
+from app.services.tenant_stats_service import TenantStatsService
+from typing import Any, Callable, Dict, List, Optional
+import functools
+
+# 테넌트별 분석 결과 캐시
+# 키에 테넌트 데이터 버전이 포함되므로 계정/영업 기회 쓰기 시 이전 결과는 즉시 무효화되고,
+# TTL은 다른 프로세스에서 발생한 쓰기가 반영되기까지의 최대 지연 시간이 된다.
+# 공유 캐시가 설정되면 버전과 결과를 같은 노드의 워커들이 공유하므로 같은 노드의 쓰기는
+# SHARED_CACHE_LOCAL_TTL_SECONDS 이내에 반영되고, 한 워커가 계산한 결과를 다른 워커도 재사용한다.
+_result_cache = make_cache("analytics", maxsize=settings.ANALYTICS_CACHE_SIZE, ttl=settings.ANALYTICS_CACHE_TTL_SECONDS)
+_analytics_flight = single_flight("AnalyticsService")
+
+def _tenant_cached(func: Callable) -> Callable:
+    """
+    분석 메서드 결과를 (메서드, 테넌트, 데이터 버전, 인자) 단위로 캐시하는 데코레이터
+    snapshot이 주어진 호출은 해당 스냅샷으로 계산해야 하므로 캐시하지 않는다.
+    """
+    @functools.wraps(func)
+    async def wrapper(tenant_id: str, *args: Any, snapshot: Optional[TenantSnapshot] = None, **kwargs: Any) -> Any:
+        if snapshot is not None:
+            return await func(tenant_id, *args, snapshot=snapshot, **kwargs)
+        key = (func.__name__, tenant_id, tenant_versions.get(tenant_id), args, tuple(sorted(kwargs.items())))
+        result = _result_cache.get(key)
+        if result is None:
+            # 캐시 미스 시 동일 키의 동시 계산은 한 번으로 병합
+            result = await _analytics_flight.do(key, func, tenant_id, *args, **kwargs)
+            _result_cache.set(key, result)
+        return result
+    return wrapper
 
 class AnalyticsService:
     @staticmethod
-    async def get_tenant_summary(tenant_id: str) -> Dict:
+    async def _get_stats(tenant_id: str, snapshot: Optional[TenantSnapshot] = None) -> TenantStatsModel:
+        """
+        테넌트 집계 항목 조회 (스냅샷이 주어졌거나 집계 항목이 아직 없으면 스냅샷으로 계산)
+        :param tenant_id: 테넌트 ID
+        :param snapshot: 재사용할 테넌트 스냅샷
+        :return: 테넌트 집계
+        """
+        stats = None if snapshot else await TenantStatsService.get_stats(tenant_id)
+        if stats is None:
+            snapshot = snapshot or await get_tenant_snapshot(tenant_id)
+            stats = TenantStatsService.compute_stats(tenant_id, snapshot.accounts, snapshot.opportunity_columns)
+        return stats
+
+    @staticmethod
+    @_tenant_cached
+    async def get_tenant_summary(tenant_id: str, snapshot: Optional[TenantSnapshot] = None) -> Dict:
         """
-        테넌트의 요약 정보 조회
+        테넌트의 요약 정보 조회 (테넌트 집계 항목 1건 조회)
         :param tenant_id: 테넌트 ID
+        :param snapshot: 재사용할 테넌트 스냅샷 (주어지면 집계 항목 대신 스냅샷으로 계산)
         :return: 테넌트 요약 정보
         """
-        accounts = await AccountService.list_accounts(tenant_id)
-        opportunities = await OpportunityService.list_opportunities(tenant_id)
-        total_expected_revenue = await OpportunityService.calculate_total_expected_revenue(tenant_id)
+        stats = await AnalyticsService._get_stats(tenant_id, snapshot)
 
         return {
-            "total_accounts": len(accounts),
-            "total_opportunities": len(opportunities),
-            "total_expected_revenue": total_expected_revenue
+            "total_accounts": stats.account_count,
+            "total_opportunities": stats.opportunity_count,
+            "total_expected_revenue": stats.total_expected_revenue
         }
 
     @staticmethod
-    async def get_opportunity_stage_distribution(tenant_id: str) -> Dict[str, int]:
+    @_tenant_cached
+    async def get_opportunity_stage_distribution(tenant_id: str, snapshot: Optional[TenantSnapshot] = None) -> Dict[str, int]:
         """
-        테넌트의 영업 기회 단계별 분포 조회
+        테넌트의 영업 기회 단계별 분포 조회 (테넌트 집계 항목 1건 조회)
         :param tenant_id: 테넌트 ID
+        :param snapshot: 재사용할 테넌트 스냅샷 (주어지면 집계 항목 대신 스냅샷으로 계산)
         :return: 단계별 영업 기회 수
         """
-        opportunities = await OpportunityService.list_opportunities(tenant_id)
+        stats = await AnalyticsService._get_stats(tenant_id, snapshot)
         stage_distribution = {}
-        for opportunity in opportunities:
-            stage = opportunity.stage
-            if stage in stage_distribution:
-                stage_distribution[stage] += 1
-            else:
-                stage_distribution[stage] = 1
+        for stage, (count_attr, _) in STAGE_STAT_ATTRIBUTES.items():
+            count = getattr(stats, count_attr)
+            if count:
+                stage_distribution[stage] = count
         return stage_distribution
 
     @staticmethod
-    async def get_top_accounts_by_revenue(tenant_id: str, limit: int = 5) -> List[Dict]:
+    @_tenant_cached
+    async def get_top_accounts_by_revenue(tenant_id: str, limit: int = 5, snapshot: Optional[TenantSnapshot] = None) -> List[Dict]:
         """
         기대 매출 기준 상위 계정 조회
+        영업 기회 컬럼을 계정 코드로 그룹 합산한 뒤 활성 계정과 조인하여
+        상위 계정을 부분 정렬로 선택 (O(영업 기회 수 + 계정 수))
         :param tenant_id: 테넌트 ID
-        :param limit: 조회할 계정 수
+        :param limit: 조회할 계정 수 (최대 ANALYTICS_TOP_ACCOUNTS_MAX_LIMIT)
+        :param snapshot: 재사용할 테넌트 스냅샷 (없으면 캐시 또는 DynamoDB에서 로드)
         :return: 상위 계정 목록
         """
-        accounts = await AccountService.list_accounts(tenant_id)
-        account_revenue = {}
-        for account in accounts:
-            opportunities = await OpportunityService.list_opportunities(tenant_id, account.account_id)
-            total_revenue = sum(opp.expected_revenue for opp in opportunities)
-            account_revenue[account.account_id] = {
-                "account_id": account.account_id,
-                "account_name": account.name,
+        limit = max(0, min(limit, settings.ANALYTICS_TOP_ACCOUNTS_MAX_LIMIT))
+        snapshot = snapshot or await get_tenant_snapshot(tenant_id)
+
+        accounts = snapshot.accounts
+        top_accounts = snapshot.opportunity_columns.top_accounts(
+            [account.account_id for account in accounts], limit
+        )
+        return [
+            {
+                "account_id": accounts[index].account_id,
+                "account_name": accounts[index].name,
                 "total_revenue": total_revenue
             }
-        
-        sorted_accounts = sorted(account_revenue.values(), key=lambda x: x["total_revenue"], reverse=True)
-        return sorted_accounts[:limit]
+            for index, total_revenue in top_accounts
+        ]
 
     @staticmethod
-    async def get_sales_pipeline(tenant_id: str) -> List[Dict]:
+    @_tenant_cached
+    async def get_sales_pipeline(tenant_id: str, snapshot: Optional[TenantSnapshot] = None) -> List[Dict]:
         """
-        테넌트의 영업 파이프라인 조회
+        테넌트의 영업 파이프라인 조회 (테넌트 집계 항목 1건 조회)
         :param tenant_id: 테넌트 ID
+        :param snapshot: 재사용할 테넌트 스냅샷 (주어지면 집계 항목 대신 스냅샷으로 계산)
         :return: 단계별 영업 기회 및 기대 매출
         """
-        opportunities = await OpportunityService.list_opportunities(tenant_id)
-        pipeline = {}
-        for opportunity in opportunities:
-            stage = opportunity.stage
-            if stage not in pipeline:
-                pipeline[stage] = {
+        stats = await AnalyticsService._get_stats(tenant_id, snapshot)
+        pipeline = []
+        for stage, (count_attr, revenue_attr) in STAGE_STAT_ATTRIBUTES.items():
+            count = getattr(stats, count_attr)
+            if count:
+                pipeline.append({
                     "stage": stage,
-                    "count": 0,
-                    "total_expected_revenue": 0
-                }
-            pipeline[stage]["count"] += 1
-            pipeline[stage]["total_expected_revenue"] += opportunity.expected_revenue
-        
-        return list(pipeline.values())
\ No newline at end of file
+                    "count": count,
+                    "total_expected_revenue": getattr(stats, revenue_attr)
+                })
+        return pipeline
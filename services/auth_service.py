@@ -1,7 +1,9 @@
-import boto3
 import traceback
 from botocore.exceptions import ClientError
+from app.core.aws_clients import get_client
+from app.core.cache import principal_cache
 from app.core.config import settings
+from app.core.revocation import revocation_store
 from app.core.security import verify_cognito_token
 from app.schemas.user import UserCreate, UserInDB
 from app.models.user import UserModel
@@ -14,7 +16,7 @@ class AuthService:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(AuthService, cls).__new__(cls)
-            cls._instance.cognito_client = boto3.client('cognito-idp', region_name=settings.AWS_REGION)
+            cls._instance.cognito_client = get_client('cognito-idp', settings.AWS_REGION)
         return cls._instance
 
     async def register_user(self, user: UserCreate) -> UserInDB:
@@ -73,7 +75,7 @@ class AuthService:
             auth_result = auth_response['AuthenticationResult']
             
             # Cognito 토큰 검증
-            claims = verify_cognito_token(auth_result['IdToken'])
+            claims = await verify_cognito_token(auth_result['IdToken'])
             
             return {
                 "access_token": auth_result['AccessToken'],
@@ -136,6 +138,17 @@ class AuthService:
         사용자 로그아웃 처리
         :param access_token: 사용자의 액세스 토큰
         """
+        try:
+            claims = await verify_cognito_token(access_token)
+        except ValueError as e:
+            raise HTTPException(status_code=401, detail=str(e))
+
+        # 로컬 폐기 목록에 기록하여 로그아웃 이전에 발급된 사용자의 모든 토큰(다른 세션/디바이스 포함)을 즉시 거부
+        # (Cognito 글로벌 로그아웃은 로컬 서명 검증에 반영되지 않음, 로그아웃 이후 다시 로그인한 토큰은 유효)
+        revocation_store.revoke(claims)
+        revocation_store.revoke_subject(claims["sub"], settings.TOKEN_MAX_LIFETIME_SECONDS)
+        principal_cache.invalidate_user(claims["sub"])
+
         try:
             # Cognito 글로벌 로그아웃 (모든 디바이스에서 로그아웃)
             self.cognito_client.global_sign_out(AccessToken=access_token)
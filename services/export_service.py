@@ -0,0 +1,72 @@
+from app.schemas.account import AccountInDB
+from app.schemas.opportunity import OpportunityInDB
+from app.services.account_service import AccountService
+from app.services.opportunity_service import OpportunityService
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+ACCOUNT_NAME_COLUMN = "account_name"
+
+class ExportService:
+    @staticmethod
+    def account_columns(fields: Optional[List[str]] = None) -> List[str]:
+        """
+        계정 내보내기의 열 목록
+        :param fields: 선택한 필드 (없으면 스키마의 모든 필드)
+        :return: 열 이름 목록 (스키마 순서)
+        """
+        return list(fields or AccountInDB.__fields__)
+
+    @staticmethod
+    def opportunity_columns(fields: Optional[List[str]] = None, include_account_name: bool = False) -> List[str]:
+        """
+        영업 기회 내보내기의 열 목록
+        :param fields: 선택한 필드 (없으면 스키마의 모든 필드)
+        :param include_account_name: 계정 이름 열 추가 여부
+        :return: 열 이름 목록 (스키마 순서, 계정 이름은 마지막)
+        """
+        columns = list(fields or OpportunityInDB.__fields__)
+        if include_account_name:
+            columns.append(ACCOUNT_NAME_COLUMN)
+        return columns
+
+    @staticmethod
+    async def export_accounts(tenant_id: str, fields: Optional[List[str]] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        테넌트의 모든 활성 계정을 내보내기용 행 페이지로 순차 반환 (다음 페이지를 미리 조회)
+        :param tenant_id: 테넌트 ID
+        :param fields: 내보낼 필드 (없으면 모든 필드)
+        :return: 계정 dict 목록(페이지)의 비동기 이터레이터
+        """
+        async for page in AccountService.stream_accounts(tenant_id, fields, prefetch=True):
+            yield page
+
+    @staticmethod
+    async def export_opportunities(tenant_id: str, account_id: str = None, fields: Optional[List[str]] = None, include_account_name: bool = False) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        테넌트의 모든 활성 영업 기회를 내보내기용 행 페이지로 순차 반환 (다음 페이지를 미리 조회)
+        계정 이름은 테넌트의 활성 계정 ID -> 이름을 한 번 읽어 메모리에서 조인한다 (행마다 계정을 조회하지 않음).
+        :param tenant_id: 테넌트 ID
+        :param account_id: 계정 ID (선택적)
+        :param fields: 내보낼 필드 (없으면 모든 필드)
+        :param include_account_name: 각 행에 account_name 추가 여부
+        :return: 영업 기회 dict 목록(페이지)의 비동기 이터레이터
+        """
+        if not include_account_name:
+            async for page in OpportunityService.stream_opportunities(tenant_id, account_id, fields, prefetch=True):
+                yield page
+            return
+
+        account_names = await AccountService.get_account_names(tenant_id)
+        # 조인에 필요한 account_id를 선택하지 않았으면 함께 읽고 행에서는 뺀다
+        drop_account_id = fields is not None and "account_id" not in fields
+        read_fields = fields + ["account_id"] if drop_account_id else fields
+        async for page in OpportunityService.stream_opportunities(tenant_id, account_id, read_fields, prefetch=True):
+            row_account_ids = [row.pop("account_id") if drop_account_id else row["account_id"] for row in page]
+            missing = set(row_account_ids).difference(account_names)
+            if missing:
+                # 비활성 계정에 연결된 영업 기회 - 처음 나온 계정만 키로 읽고 없는 계정도 기억
+                found = await AccountService.get_account_names_by_id(tenant_id, missing)
+                account_names.update((missing_id, found.get(missing_id)) for missing_id in missing)
+            for row, row_account_id in zip(page, row_account_ids):
+                row[ACCOUNT_NAME_COLUMN] = account_names[row_account_id]
+            yield page
@@ -1,8 +1,9 @@
 # /crm_saas/app/services/onboarding_service.py
 import uuid
-import boto3
 import logging
 import traceback
+from botocore.exceptions import ClientError
+from app.core.aws_clients import get_client
 from app.core.config import settings
 from app.models.tenant import TenantModel
 from app.models.user import UserModel
@@ -19,7 +20,7 @@ logger = logging.getLogger(__name__)
 class OnboardingService:
     def __init__(self):
         self.auth_service = AuthService()
-        self.cognito_client = boto3.client('cognito-idp', region_name=settings.AWS_REGION)
+        self.cognito_client = get_client('cognito-idp', settings.AWS_REGION)
 
     async def create_tenant_and_admin(self, onboarding_request: OnboardingRequest):
         tenant = onboarding_request.tenant
@@ -90,7 +91,7 @@ class OnboardingService:
 
         # 사용자를 Cognito 그룹에 추가
         try:
-            cognito_client = boto3.client('cognito-idp', region_name=settings.AWS_REGION)
+            cognito_client = get_client('cognito-idp', settings.AWS_REGION)
             cognito_client.admin_add_user_to_group(
                 UserPoolId=settings.COGNITO_USER_POOL_ID,
                 Username=new_user.email,
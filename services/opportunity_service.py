@@ -1,10 +1,81 @@
+from app.core.cache import tenant_versions
+from app.core.config import settings
+from app.core.exceptions import ConflictException
 from app.models.opportunity import OpportunityModel
+from app.models.tenant_stats import TenantStatsModel
 from app.schemas.opportunity import OpportunityCreate, OpportunityUpdate, OpportunityInDB
+from app.services.analytics_columnar import OpportunityColumns, OPPORTUNITY_COLUMN_ATTRIBUTES
+from app.services.raw_records import OpportunityRecord
+from app.services.tenant_stats_service import TenantStatsService
+from app.utils.fields import projection, select_fields
+from app.utils.pagination import CursorPage, encode_cursor, decode_cursor
+from app.utils.async_dynamodb import db_call, db_get, db_query_raw, db_query_raw_page, db_query_raw_pages
+from app.utils.item_updates import apply_update, check_version, current_version, transact_write, update_actions, update_item, version_condition, with_active_index
+from datetime import datetime
 from fastapi import HTTPException
-from typing import List
+from pynamodb.expressions.condition import Condition
+from pynamodb.expressions.update import Action
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 import uuid
 
+# 테넌트 집계에 영향을 주는 속성 - 변경 시 집계와 함께 트랜잭션으로 반영
+STATS_ATTRIBUTES = {"stage", "expected_revenue", "is_active"}
+
 class OpportunityService:
+    @staticmethod
+    def _stats_contribution(opportunity: OpportunityModel) -> Optional[tuple]:
+        """
+        영업 기회가 테넌트 집계에 기여하는 (단계, 기대 매출) - 비활성이면 None
+        """
+        if not opportunity.is_active:
+            return None
+        return (opportunity.stage, opportunity.expected_revenue)
+
+    @staticmethod
+    async def _save_with_stats(opportunity: OpportunityModel, stats_actions: List[Action], condition: Optional[Condition] = None):
+        """
+        영업 기회 저장과 테넌트 집계 ADD 업데이트를 하나의 트랜잭션으로 실행
+        :param opportunity: 저장할 영업 기회
+        :param stats_actions: 테넌트 집계 업데이트 액션
+        :param condition: 영업 기회 저장 조건
+        """
+        opportunity.updated_at = datetime.utcnow()
+        opportunity.active_tenant_id = opportunity.tenant_id if opportunity.is_active else None
+        if stats_actions:
+            await TenantStatsService.ensure_stats(opportunity.tenant_id)
+
+        def build(transaction):
+            transaction.save(opportunity, condition=condition)
+            if stats_actions:
+                transaction.update(TenantStatsModel(opportunity.tenant_id), actions=stats_actions)
+
+        await transact_write(OpportunityModel, build, "Opportunity was modified concurrently")
+        tenant_versions.bump(opportunity.tenant_id)
+
+    @staticmethod
+    async def _update_with_stats(opportunity: OpportunityModel, values: Dict[str, Any], stats_actions: List[Action]):
+        """
+        읽은 영업 기회의 지정 속성 UPDATE와 테넌트 집계 ADD 업데이트를 하나의 트랜잭션으로 실행
+        읽은 시점 이후 다른 변경이 있었으면(버전 불일치) 409
+        :param opportunity: 읽은 영업 기회 (성공 시 변경 내용이 반영됨)
+        :param values: 변경할 속성 이름 -> 새 값
+        :param stats_actions: 테넌트 집계 업데이트 액션
+        """
+        values = with_active_index(dict(values, updated_at=datetime.utcnow()), opportunity.tenant_id)
+        actions = update_actions(OpportunityModel, values)
+        condition = version_condition(OpportunityModel, current_version(opportunity))
+        if stats_actions:
+            await TenantStatsService.ensure_stats(opportunity.tenant_id)
+
+        def build(transaction):
+            transaction.update(opportunity, actions=actions, condition=condition)
+            if stats_actions:
+                transaction.update(TenantStatsModel(opportunity.tenant_id), actions=stats_actions)
+
+        await transact_write(OpportunityModel, build, "Opportunity was modified concurrently")
+        apply_update(opportunity, values)
+        tenant_versions.bump(opportunity.tenant_id)
+
     @staticmethod
     async def create_opportunity(opportunity: OpportunityCreate) -> OpportunityInDB:
         """
@@ -20,10 +91,15 @@ class OpportunityService:
             name=opportunity.name,
             stage=opportunity.stage,
             expected_revenue=opportunity.expected_revenue,
-            manager_id=opportunity.manager_id
+            manager_id=opportunity.manager_id,
+            version=1
         )
         try:
-            db_opportunity.save()
+            await OpportunityService._save_with_stats(
+                db_opportunity,
+                TenantStatsService.opportunity_actions(None, OpportunityService._stats_contribution(db_opportunity)),
+                condition=OpportunityModel.opportunity_id.does_not_exist()
+            )
             return OpportunityInDB(
                 opportunity_id=db_opportunity.opportunity_id,
                 tenant_id=db_opportunity.tenant_id,
@@ -34,21 +110,27 @@ class OpportunityService:
                 manager_id=db_opportunity.manager_id,
                 created_at=db_opportunity.created_at,
                 updated_at=db_opportunity.updated_at,
-                is_active=db_opportunity.is_active
+                is_active=db_opportunity.is_active,
+                version=current_version(db_opportunity)
             )
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Could not create opportunity: {str(e)}")
 
     @staticmethod
-    async def get_opportunity(opportunity_id: str, tenant_id: str) -> OpportunityInDB:
+    async def get_opportunity(opportunity_id: str, tenant_id: str, fields: Optional[List[str]] = None) -> Union[OpportunityInDB, Dict[str, Any]]:
         """
         영업 기회 ID와 테넌트 ID로 영업 기회 조회
         :param opportunity_id: 영업 기회 ID
         :param tenant_id: 테넌트 ID
+        :param fields: 응답에 포함할 필드 (주어지면 해당 속성만 읽고 dict로 반환)
         :return: 조회된 영업 기회 정보
         """
         try:
-            opportunity = OpportunityModel.get(opportunity_id, tenant_id)
+            opportunity = await db_get(OpportunityModel, opportunity_id, tenant_id, attributes_to_get=projection(OpportunityModel, fields))
+            if fields:
+                return select_fields(opportunity, fields, OpportunityInDB)
             return OpportunityInDB(
                 opportunity_id=opportunity.opportunity_id,
                 tenant_id=opportunity.tenant_id,
@@ -59,7 +141,8 @@ class OpportunityService:
                 manager_id=opportunity.manager_id,
                 created_at=opportunity.created_at,
                 updated_at=opportunity.updated_at,
-                is_active=opportunity.is_active
+                is_active=opportunity.is_active,
+                version=current_version(opportunity)
             )
         except OpportunityModel.DoesNotExist:
             raise HTTPException(status_code=404, detail="Opportunity not found")
@@ -67,18 +150,37 @@ class OpportunityService:
     @staticmethod
     async def update_opportunity(opportunity_id: str, tenant_id: str, opportunity_update: OpportunityUpdate) -> OpportunityInDB:
         """
-        영업 기회 정보 업데이트
+        영업 기회 정보 업데이트 (변경된 속성만 단일 UpdateItem으로 반영)
+        단계/기대 매출/활성 상태가 바뀌면 테넌트 집계도 함께 바뀌어야 하므로 읽은 뒤 버전 조건부 트랜잭션으로 반영한다.
         :param opportunity_id: 업데이트할 영업 기회 ID
         :param tenant_id: 테넌트 ID
-        :param opportunity_update: 업데이트할 영업 기회 정보
+        :param opportunity_update: 업데이트할 영업 기회 정보 (version이 주어지면 그 버전일 때만 반영, 아니면 409)
         :return: 업데이트된 영업 기회 정보
         """
+        update_data = opportunity_update.dict(exclude_unset=True)
+        expected_version = update_data.pop("version", None)
+        if "is_active" in update_data:
+            update_data["is_active"] = int(update_data["is_active"])
         try:
-            opportunity = OpportunityModel.get(opportunity_id, tenant_id)
-            update_data = opportunity_update.dict(exclude_unset=True)
-            for key, value in update_data.items():
-                setattr(opportunity, key, value)
-            opportunity.save()
+            if update_data.keys() & STATS_ATTRIBUTES:
+                opportunity = await db_get(OpportunityModel, opportunity_id, tenant_id)
+                check_version(opportunity, expected_version, "Opportunity was modified concurrently")
+                new_contribution = None
+                if update_data.get("is_active", opportunity.is_active):
+                    new_contribution = (
+                        update_data.get("stage", opportunity.stage),
+                        update_data.get("expected_revenue", opportunity.expected_revenue)
+                    )
+                stats_actions = TenantStatsService.opportunity_actions(
+                    OpportunityService._stats_contribution(opportunity), new_contribution
+                )
+                await OpportunityService._update_with_stats(opportunity, update_data, stats_actions)
+            else:
+                opportunity = await update_item(
+                    OpportunityModel, opportunity_id, tenant_id, update_data,
+                    expected_version=expected_version, conflict_detail="Opportunity was modified concurrently"
+                )
+                tenant_versions.bump(tenant_id)
             return OpportunityInDB(
                 opportunity_id=opportunity.opportunity_id,
                 tenant_id=opportunity.tenant_id,
@@ -89,7 +191,8 @@ class OpportunityService:
                 manager_id=opportunity.manager_id,
                 created_at=opportunity.created_at,
                 updated_at=opportunity.updated_at,
-                is_active=opportunity.is_active
+                is_active=opportunity.is_active,
+                version=current_version(opportunity)
             )
         except OpportunityModel.DoesNotExist:
             raise HTTPException(status_code=404, detail="Opportunity not found")
@@ -98,60 +201,144 @@ class OpportunityService:
     async def delete_opportunity(opportunity_id: str, tenant_id: str) -> bool:
         """
         영업 기회 삭제 (소프트 삭제)
+        집계에서 뺄 단계/기대 매출을 알아야 하므로 읽은 뒤 버전 조건부 트랜잭션으로 비활성화한다.
         :param opportunity_id: 삭제할 영업 기회 ID
         :param tenant_id: 테넌트 ID
         :return: 삭제 성공 여부
         """
         try:
-            opportunity = OpportunityModel.get(opportunity_id, tenant_id)
-            opportunity.is_active = False
-            opportunity.save()
+            opportunity = await db_get(OpportunityModel, opportunity_id, tenant_id)
+            if not opportunity.is_active:
+                return True
+            await OpportunityService._update_with_stats(
+                opportunity,
+                {"is_active": 0},
+                TenantStatsService.opportunity_actions(OpportunityService._stats_contribution(opportunity), None)
+            )
             return True
         except OpportunityModel.DoesNotExist:
             raise HTTPException(status_code=404, detail="Opportunity not found")
 
     @staticmethod
-    async def list_opportunities(tenant_id: str, account_id: str = None) -> List[OpportunityInDB]:
+    async def list_opportunities(tenant_id: str, account_id: str = None) -> List[OpportunityRecord]:
         """
         테넌트의 모든 활성 영업 기회 목록 조회
+        (원시 항목을 모델/스키마 객체 생성 없이 __slots__ 레코드로 바로 디코딩)
         :param tenant_id: 테넌트 ID
         :param account_id: 계정 ID (선택적)
-        :return: 영업 기회 목록
-        """
-        if account_id:
-            opportunities = OpportunityModel.query(tenant_id, OpportunityModel.account_id == account_id & OpportunityModel.is_active == True)
-        else:
-            opportunities = OpportunityModel.query(tenant_id, OpportunityModel.is_active == True)
-        
-        return [
-            OpportunityInDB(
-                opportunity_id=opportunity.opportunity_id,
-                tenant_id=opportunity.tenant_id,
-                account_id=opportunity.account_id,
-                name=opportunity.name,
-                stage=opportunity.stage,
-                expected_revenue=opportunity.expected_revenue,
-                manager_id=opportunity.manager_id,
-                created_at=opportunity.created_at,
-                updated_at=opportunity.updated_at,
-                is_active=opportunity.is_active
-            )
-            for opportunity in opportunities
-        ]
+        :return: 영업 기회 레코드 목록
+        """
+        # 활성 영업 기회만 담긴 희소 GSI를 조회 (비활성 항목을 읽고 필터로 버리지 않음)
+        filter_condition = OpportunityModel.account_id == account_id if account_id else None
+        items = await db_query_raw(
+            OpportunityModel,
+            tenant_id,
+            index_name=OpportunityModel.active_index.Meta.index_name,
+            filter_condition=filter_condition
+        )
+        return OpportunityRecord.from_items(items)
+
+    @staticmethod
+    async def get_opportunity_columns(tenant_id: str) -> OpportunityColumns:
+        """
+        테넌트의 활성 영업 기회를 분석용 컬럼 구조로 조회
+        (필요한 속성만 읽고 원시 항목을 바로 디코딩하여 객체 생성 비용을 피함)
+        :param tenant_id: 테넌트 ID
+        :return: 영업 기회 컬럼
+        """
+        items = await db_query_raw(
+            OpportunityModel,
+            tenant_id,
+            index_name=OpportunityModel.active_index.Meta.index_name,
+            attributes_to_get=OPPORTUNITY_COLUMN_ATTRIBUTES
+        )
+        return OpportunityColumns.from_raw_items(items)
 
     @staticmethod
-    async def change_opportunity_manager(opportunity_id: str, tenant_id: str, new_manager_id: str) -> OpportunityInDB:
+    async def list_opportunities_page(tenant_id: str, account_id: str = None, size: int = 10, cursor: Optional[str] = None, include_total: bool = False, fields: Optional[List[str]] = None) -> CursorPage[Dict[str, Any]]:
         """
-        영업 기회 담당자 변경
+        테넌트의 활성 영업 기회 목록을 커서 기반으로 한 페이지 조회
+        (원시 항목을 응답용 dict로 바로 디코딩 - 응답 스키마 검증은 라우터에서 한 번만 수행)
+        account_id는 테넌트 인덱스 조회의 필터로 적용되므로 size개를 채울 때까지 이어서 읽되,
+        PAGINATION_FILTER_MAX_EVALUATED개를 평가하면 멈춘다. 이때 페이지는 size개보다 적거나 비어 있을 수 있고
+        next_cursor가 있으면 이어서 조회해야 한다 (next_cursor가 없을 때만 마지막 페이지).
+        :param tenant_id: 테넌트 ID
+        :param account_id: 계정 ID (선택적)
+        :param size: 페이지당 항목 수
+        :param cursor: 이전 페이지의 next_cursor
+        :param include_total: 전체 항목 수 포함 여부 (account_id가 있으면 테넌트 스냅샷에서 계산)
+        :param fields: 응답에 포함할 필드 (주어지면 해당 속성만 읽고 해당 필드만 반환)
+        :return: 영업 기회 페이지
+        """
+        scope = f"active-opportunities:{tenant_id}:{account_id or ''}"
+        filter_condition = OpportunityModel.account_id == account_id if account_id else None
+        items, last_evaluated_key = await db_query_raw_page(
+            OpportunityModel,
+            tenant_id,
+            size,
+            index_name=OpportunityModel.active_index.Meta.index_name,
+            filter_condition=filter_condition,
+            attributes_to_get=projection(OpportunityModel, fields),
+            exclusive_start_key=decode_cursor(cursor, scope),
+            read_size=settings.PAGINATION_FILTER_READ_SIZE,
+            max_evaluated=settings.PAGINATION_FILTER_MAX_EVALUATED
+        )
+        total = None
+        if include_total and account_id:
+            # 필터 COUNT 쿼리는 매번 테넌트의 모든 영업 기회를 읽으므로, 쓰기 전까지 재사용되는 스냅샷에서 계산
+            # (tenant_snapshot이 이 모듈을 import하므로 지연 import)
+            from app.services.tenant_snapshot import get_tenant_snapshot
+            snapshot = await get_tenant_snapshot(tenant_id)
+            total = snapshot.opportunity_columns.account_count(account_id)
+        elif include_total:
+            total = await db_call(OpportunityModel, OpportunityModel.active_index.count, tenant_id)
+        return CursorPage[Dict[str, Any]].construct(
+            items=[OpportunityRecord.to_dict(item, fields) for item in items],
+            size=size,
+            next_cursor=encode_cursor(last_evaluated_key, scope),
+            total=total
+        )
+
+    @staticmethod
+    async def stream_opportunities(tenant_id: str, account_id: str = None, fields: Optional[List[str]] = None, prefetch: bool = False) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        테넌트의 모든 활성 영업 기회를 DynamoDB 페이지 단위로 응답용 dict로 디코딩하여 순차 반환 (스트리밍 응답용)
+        전체 목록을 메모리에 만들지 않으므로 테넌트 크기와 무관하게 한 페이지 분량만 유지한다.
+        :param tenant_id: 테넌트 ID
+        :param account_id: 계정 ID (선택적)
+        :param fields: 응답에 포함할 필드 (주어지면 해당 속성만 읽고 해당 필드만 반환)
+        :param prefetch: 현재 페이지를 처리하는 동안 다음 페이지를 미리 조회 (대량 내보내기용)
+        :return: 영업 기회 dict 목록(페이지)의 비동기 이터레이터
+        """
+        filter_condition = OpportunityModel.account_id == account_id if account_id else None
+        pages = db_query_raw_pages(
+            OpportunityModel,
+            tenant_id,
+            index_name=OpportunityModel.active_index.Meta.index_name,
+            filter_condition=filter_condition,
+            attributes_to_get=projection(OpportunityModel, fields),
+            page_size=settings.STREAM_PAGE_SIZE,
+            prefetch=prefetch
+        )
+        async for items in pages:
+            yield [OpportunityRecord.to_dict(item, fields) for item in items]
+
+    @staticmethod
+    async def change_opportunity_manager(opportunity_id: str, tenant_id: str, new_manager_id: str, expected_version: Optional[int] = None) -> OpportunityInDB:
+        """
+        영업 기회 담당자 변경 (단일 UpdateItem)
         :param opportunity_id: 영업 기회 ID
         :param tenant_id: 테넌트 ID
         :param new_manager_id: 새로운 담당자 ID
+        :param expected_version: 주어지면 영업 기회 버전이 일치할 때만 변경 (아니면 409)
         :return: 업데이트된 영업 기회 정보
         """
         try:
-            opportunity = OpportunityModel.get(opportunity_id, tenant_id)
-            opportunity.manager_id = new_manager_id
-            opportunity.save()
+            opportunity = await update_item(
+                OpportunityModel, opportunity_id, tenant_id, {"manager_id": new_manager_id},
+                expected_version=expected_version, conflict_detail="Opportunity was modified concurrently"
+            )
+            tenant_versions.bump(tenant_id)
             return OpportunityInDB(
                 opportunity_id=opportunity.opportunity_id,
                 tenant_id=opportunity.tenant_id,
@@ -162,7 +349,8 @@ class OpportunityService:
                 manager_id=opportunity.manager_id,
                 created_at=opportunity.created_at,
                 updated_at=opportunity.updated_at,
-                is_active=opportunity.is_active
+                is_active=opportunity.is_active,
+                version=current_version(opportunity)
             )
         except OpportunityModel.DoesNotExist:
             raise HTTPException(status_code=404, detail="Opportunity not found")
@@ -174,6 +362,10 @@ class OpportunityService:
         :param tenant_id: 테넌트 ID
         :return: 총 기대 매출
         """
-        opportunities = OpportunityModel.query(tenant_id, OpportunityModel.is_active == True)
-        total_expected_revenue = sum(opportunity.expected_revenue for opportunity in opportunities)
-        return total_expected_revenue
\ No newline at end of file
+        items = await db_query_raw(
+            OpportunityModel,
+            tenant_id,
+            index_name=OpportunityModel.active_index.Meta.index_name,
+            attributes_to_get=["expected_revenue"]
+        )
+        return sum(float(item["expected_revenue"]["N"]) for item in items)
\ No newline at end of file
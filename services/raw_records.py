@@ -0,0 +1,161 @@
+from app.models.account import AccountModel
+from app.models.opportunity import OpportunityModel
+from app.models.user import UserModel
+from app.schemas.account import AccountInDB
+from app.schemas.opportunity import OpportunityInDB
+from app.schemas.user import UserInDB
+from datetime import datetime
+from operator import itemgetter
+from pydantic import BaseModel
+from pydantic.fields import ModelField
+from pynamodb.attributes import Attribute, BooleanAttribute, ListAttribute, NumberAttribute, UTCDateTimeAttribute
+from pynamodb.models import Model
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type
+import sys
+
+# Python 3.11부터 fromisoformat이 PynamoDB 저장 형식(예: 2024-01-01T00:00:00.000000+0000)을 C 구현으로 바로 파싱한다
+_FROMISOFORMAT_PARSES_UTC = sys.version_info >= (3, 11)
+
+def decode_value(value: Dict[str, Any]) -> Any:
+    """
+    DynamoDB 원시 값({"S": ...} 등) 하나를 파이썬 값으로 변환 (리스트/맵 원소처럼 타입이 정해지지 않은 값용)
+    """
+    if "S" in value:
+        return value["S"]
+    if "N" in value:
+        return decode_number(value["N"])
+    if "BOOL" in value:
+        return value["BOOL"]
+    if "L" in value:
+        return [decode_value(element) for element in value["L"]]
+    if "M" in value:
+        return {key: decode_value(element) for key, element in value["M"].items()}
+    return None
+
+def decode_number(raw: str) -> Any:
+    """
+    DynamoDB 숫자 문자열을 int (정수 표기) 또는 float로 변환
+    """
+    try:
+        return int(raw)
+    except ValueError:
+        return float(raw)
+
+def _decode_bool(value: Dict[str, Any]) -> bool:
+    # is_active는 테이블에 따라 BOOL 또는 1/0 숫자로 저장된다
+    if "BOOL" in value:
+        return value["BOOL"]
+    return value["N"] != "0"
+
+def _none() -> None:
+    return None
+
+def _decoder(attribute: Attribute, field: Optional[ModelField]) -> Callable[[Dict[str, Any]], Any]:
+    """
+    모델 속성(저장 형식)과 스키마 필드(응답 타입, 스키마에 없는 속성이면 None)에 맞는 원시 값 디코더 선택
+    """
+    field_type = field.type_ if field is not None else None
+    if isinstance(attribute, UTCDateTimeAttribute):
+        parse = datetime.fromisoformat if _FROMISOFORMAT_PARSES_UTC else attribute.deserialize
+        return lambda value: parse(value["S"])
+    if isinstance(attribute, BooleanAttribute) or field_type is bool:
+        return _decode_bool
+    if isinstance(attribute, NumberAttribute):
+        if field_type is float:
+            return lambda value: float(value["N"])
+        return lambda value: decode_number(value["N"])
+    if isinstance(attribute, ListAttribute):
+        return lambda value: [decode_value(element) for element in value["L"]]
+    return itemgetter("S")
+
+class RawRecord:
+    """
+    DynamoDB 원시 항목을 PynamoDB 모델/pydantic 스키마 생성 없이 바로 디코딩한 가벼운 레코드 (__slots__)
+    - 하위 클래스는 model(저장 형식)과 schema(필드 타입/기본값)를 지정하고 __slots__에 필드 이름을 나열한다.
+    - from_item은 속성 접근이 가능한 레코드를, to_dict는 응답 스키마 형태의 dict를 만든다.
+    - 값의 검증은 하지 않는다 (애플리케이션이 저장한 항목을 읽는 대량 조회 경로용).
+    """
+    __slots__ = ()
+    _decoders: tuple = ()
+    _response_decoders: tuple = ()
+    _decoder_map: Dict[str, tuple] = {}
+
+    def __init_subclass__(cls, model: Type[Model], schema: Type[BaseModel], **kwargs):
+        super().__init_subclass__(**kwargs)
+        attributes = model.get_attributes()
+        decoders = {}
+        for name in cls.__slots__:
+            attribute, field = attributes[name], schema.__fields__.get(name)
+            # 없는 속성(이전 버전 항목)은 스키마 기본값, 리스트는 빈 리스트
+            if isinstance(attribute, ListAttribute):
+                missing = list
+            elif field is not None:
+                missing = field.get_default
+            else:
+                missing = _none
+            decoders[name] = (name, attribute.attr_name, _decoder(attribute, field), missing)
+        for name, field in schema.__fields__.items():
+            if name not in decoders:
+                # 저장되지 않는 스키마 필드 (예: UserInDB.password)는 항상 기본값
+                decoders[name] = (name, None, None, field.get_default)
+        cls._decoders = tuple(decoders[name] for name in cls.__slots__)
+        # 응답 dict는 response_model로 직렬화한 결과와 같도록 스키마 필드만 스키마 순서로 만든다
+        cls._response_decoders = tuple(decoders[name] for name in schema.__fields__)
+        cls._decoder_map = decoders
+
+    @classmethod
+    def from_item(cls, item: Dict[str, Dict[str, Any]]) -> "RawRecord":
+        """
+        원시 항목을 레코드로 디코딩
+        :param item: DynamoDB Query 응답의 항목
+        :return: 레코드
+        """
+        record = object.__new__(cls)
+        for name, attr_name, decode, missing in cls._decoders:
+            value = item.get(attr_name)
+            setattr(record, name, missing() if value is None else decode(value))
+        return record
+
+    @classmethod
+    def from_items(cls, items: Iterable[Dict[str, Dict[str, Any]]]) -> List["RawRecord"]:
+        from_item = cls.from_item
+        return [from_item(item) for item in items]
+
+    @classmethod
+    def to_dict(cls, item: Dict[str, Dict[str, Any]], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        원시 항목을 응답용 dict로 바로 디코딩
+        :param item: DynamoDB Query 응답의 항목
+        :param fields: 포함할 스키마 필드 (None이면 스키마의 모든 필드)
+        :return: 필드 이름 -> 값
+        """
+        if fields is None:
+            decoders = cls._response_decoders
+        else:
+            decoders = [cls._decoder_map[name] for name in fields]
+        result = {}
+        for name, attr_name, decode, missing in decoders:
+            value = item.get(attr_name)
+            result[name] = missing() if value is None else decode(value)
+        return result
+
+    def dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)})"
+
+class AccountRecord(RawRecord, model=AccountModel, schema=AccountInDB):
+    __slots__ = ("account_id", "tenant_id", "name", "manager_id", "created_at", "updated_at", "is_active", "version")
+
+class OpportunityRecord(RawRecord, model=OpportunityModel, schema=OpportunityInDB):
+    __slots__ = (
+        "opportunity_id", "tenant_id", "account_id", "name", "stage", "expected_revenue", "manager_id",
+        "created_at", "updated_at", "is_active", "version"
+    )
+
+class UserRecord(RawRecord, model=UserModel, schema=UserInDB):
+    __slots__ = (
+        "user_id", "tenant_name", "email", "given_name", "family_name", "role",
+        "created_at", "updated_at", "is_active", "managed_account_ids", "version"
+    )
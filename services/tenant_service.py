@@ -1,9 +1,13 @@
+from app.core.singleflight import single_flight
 from app.models.tenant import TenantModel
 from app.schemas.tenant import TenantCreate, TenantUpdate, TenantInDB
+from app.utils.async_dynamodb import db_get, db_save, db_query
 from fastapi import HTTPException
 from typing import List
 import uuid
 
+_get_tenant_flight = single_flight("TenantService.get_tenant")
+
 class TenantService:
     @staticmethod
     async def create_tenant(tenant: TenantCreate) -> TenantInDB:
@@ -16,7 +20,7 @@ class TenantService:
             name=tenant.name
         )
         try:
-            db_tenant.save()
+            await db_save(db_tenant)
             return TenantInDB(
                 tenant_id=db_tenant.tenant_id,
                 name=db_tenant.name,
@@ -30,10 +34,15 @@ class TenantService:
     @staticmethod
     async def get_tenant(tenant_id: str) -> TenantInDB:
         """
-        테넌트 ID로 테넌트 조회
+        테넌트 ID로 테넌트 조회 (동시 조회는 한 번의 읽기로 병합)
         """
+        tenant = await _get_tenant_flight.do(tenant_id, TenantService._fetch_tenant, tenant_id)
+        return tenant.copy()
+
+    @staticmethod
+    async def _fetch_tenant(tenant_id: str) -> TenantInDB:
         try:
-            tenant = TenantModel.get(tenant_id)
+            tenant = await db_get(TenantModel, tenant_id)
             return TenantInDB(
                 tenant_id=tenant.tenant_id,
                 name=tenant.name,
@@ -50,11 +59,11 @@ class TenantService:
         테넌트 정보 업데이트
         """
         try:
-            tenant = TenantModel.get(tenant_id)
+            tenant = await db_get(TenantModel, tenant_id)
             update_data = tenant_update.dict(exclude_unset=True)
             for key, value in update_data.items():
                 setattr(tenant, key, value)
-            tenant.save()
+            await db_save(tenant)
             return TenantInDB(
                 tenant_id=tenant.tenant_id,
                 name=tenant.name,
@@ -71,9 +80,9 @@ class TenantService:
         테넌트 삭제 (소프트 삭제)
         """
         try:
-            tenant = TenantModel.get(tenant_id)
+            tenant = await db_get(TenantModel, tenant_id)
             tenant.is_active = False
-            tenant.save()
+            await db_save(tenant)
             return True
         except TenantModel.DoesNotExist:
             raise HTTPException(status_code=404, detail="Tenant not found")
@@ -83,7 +92,7 @@ class TenantService:
         """
         모든 활성 테넌트 목록 조회
         """
-        tenants = TenantModel.scan(TenantModel.is_active == True)
+        tenants = await db_query(TenantModel, TenantModel.scan, TenantModel.is_active == True)
         return [
             TenantInDB(
                 tenant_id=tenant.tenant_id,
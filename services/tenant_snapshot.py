@@ -0,0 +1,74 @@
+from app.core.cache import tenant_versions
+from app.core.config import settings
+from app.core.singleflight import single_flight
+from app.services.account_service import AccountService
+from app.services.analytics_columnar import OpportunityColumns
+from app.services.opportunity_service import OpportunityService
+from app.services.raw_records import AccountRecord
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import asyncio
+import time
+
+class TenantSnapshot:
+    """
+    분석 계산에 사용하는 테넌트 데이터 스냅샷
+    계정과 영업 기회를 한 번씩만 읽어 여러 분석 함수가 공유한다.
+    계정은 원시 항목에서 바로 디코딩한 레코드(AccountRecord)로 보관한다.
+    영업 기회는 행 단위 객체 대신 컬럼(OpportunityColumns)으로 보관한다.
+    """
+    def __init__(self, tenant_id: str, accounts: List[AccountRecord], opportunity_columns: OpportunityColumns, version: Optional[str] = None):
+        self.tenant_id = tenant_id
+        self.accounts = accounts
+        self.opportunity_columns = opportunity_columns
+        self.version = version
+        self.loaded_at = time.monotonic()
+
+    @classmethod
+    async def load(cls, tenant_id: str) -> "TenantSnapshot":
+        """
+        DynamoDB에서 테넌트의 활성 계정과 영업 기회를 읽어 스냅샷 생성
+        :param tenant_id: 테넌트 ID
+        :return: 테넌트 스냅샷
+        """
+        version = tenant_versions.get(tenant_id)
+        accounts, opportunity_columns = await asyncio.gather(
+            AccountService.list_accounts(tenant_id),
+            OpportunityService.get_opportunity_columns(tenant_id)
+        )
+        return cls(tenant_id, accounts, opportunity_columns, version)
+
+    @property
+    def total_expected_revenue(self) -> float:
+        return self.opportunity_columns.total_revenue()
+
+    def is_fresh(self, ttl_seconds: float) -> bool:
+        return time.monotonic() - self.loaded_at < ttl_seconds
+
+# 테넌트별 최근 스냅샷 (짧은 TTL, LRU 방식으로 크기 제한)
+_snapshot_cache: "OrderedDict[str, TenantSnapshot]" = OrderedDict()
+_snapshot_flight = single_flight("TenantSnapshot.load")
+
+async def get_tenant_snapshot(tenant_id: str) -> TenantSnapshot:
+    """
+    테넌트 스냅샷 가져오기
+    (ANALYTICS_SNAPSHOT_TTL_SECONDS 이내에 로드되었고 이후 테넌트 데이터 쓰기가 없었던 스냅샷은 재사용)
+    :param tenant_id: 테넌트 ID
+    :return: 테넌트 스냅샷
+    """
+    snapshot = _snapshot_cache.get(tenant_id)
+    if (
+        snapshot is not None
+        and snapshot.version == tenant_versions.get(tenant_id)
+        and snapshot.is_fresh(settings.ANALYTICS_SNAPSHOT_TTL_SECONDS)
+    ):
+        _snapshot_cache.move_to_end(tenant_id)
+        return snapshot
+
+    # 여러 분석 요청이 동시에 스냅샷을 요구하면 한 번만 로드
+    snapshot = await _snapshot_flight.do(tenant_id, TenantSnapshot.load, tenant_id)
+    _snapshot_cache[tenant_id] = snapshot
+    _snapshot_cache.move_to_end(tenant_id)
+    while len(_snapshot_cache) > settings.ANALYTICS_SNAPSHOT_CACHE_SIZE:
+        _snapshot_cache.popitem(last=False)
+    return snapshot
@@ -0,0 +1,175 @@
+from app.core.cache import TTLCache
+from app.models.tenant_stats import TenantStatsModel, STAGE_STAT_ATTRIBUTES
+from app.schemas.opportunity import OpportunityStage
+from app.services.analytics_columnar import OpportunityColumns, STAGES
+from app.utils.async_dynamodb import db_get, db_save
+from datetime import datetime
+from pynamodb.exceptions import PutError
+from pynamodb.expressions.update import Action
+from typing import Dict, List, Optional
+
+# 집계 항목이 있는 것으로 확인된 테넌트 (집계 항목은 삭제되지 않으므로 쓰기마다 다시 확인하지 않음)
+_known_stats = TTLCache(maxsize=100000, ttl=3600.0)
+
+class TenantStatsService:
+    """
+    테넌트별 집계(활성 계정 수, 영업 기회 수, 단계별 건수/기대 매출) 관리
+    """
+    @staticmethod
+    def account_count_actions(delta: int) -> List[Action]:
+        """
+        활성 계정 수 변경을 위한 ADD 업데이트 액션 생성
+        :param delta: 활성 계정 수 증감 (+1 / -1)
+        :return: 업데이트 액션 목록
+        """
+        if not delta:
+            return []
+        return [
+            TenantStatsModel.account_count.add(delta),
+            TenantStatsModel.updated_at.set(datetime.utcnow())
+        ]
+
+    @staticmethod
+    def opportunity_actions(old: Optional[tuple], new: Optional[tuple]) -> List[Action]:
+        """
+        영업 기회 변경에 따른 집계 ADD 업데이트 액션 생성
+        :param old: 변경 전 (단계, 기대 매출) - 활성 상태가 아니었으면 None
+        :param new: 변경 후 (단계, 기대 매출) - 활성 상태가 아니면 None
+        :return: 업데이트 액션 목록 (집계 변화가 없으면 빈 목록)
+        """
+        deltas: Dict[str, float] = {}
+
+        def apply(contribution: Optional[tuple], sign: int):
+            if contribution is None:
+                return
+            stage, revenue = contribution
+            count_attr, revenue_attr = STAGE_STAT_ATTRIBUTES[OpportunityStage(stage)]
+            for attr, value in (
+                ("opportunity_count", 1),
+                ("total_expected_revenue", revenue),
+                (count_attr, 1),
+                (revenue_attr, revenue),
+            ):
+                deltas[attr] = deltas.get(attr, 0) + sign * value
+
+        apply(old, -1)
+        apply(new, 1)
+        actions = [
+            getattr(TenantStatsModel, attr).add(value)
+            for attr, value in deltas.items()
+            if value
+        ]
+        if actions:
+            actions.append(TenantStatsModel.updated_at.set(datetime.utcnow()))
+        return actions
+
+    @staticmethod
+    async def get_stats(tenant_id: str) -> Optional[TenantStatsModel]:
+        """
+        테넌트 집계 항목 조회
+        :param tenant_id: 테넌트 ID
+        :return: 집계 항목 (아직 생성되지 않았으면 None)
+        """
+        try:
+            return await db_get(TenantStatsModel, tenant_id)
+        except TenantStatsModel.DoesNotExist:
+            return None
+
+    @staticmethod
+    def compute_stats(tenant_id: str, accounts: list, opportunity_columns: OpportunityColumns) -> TenantStatsModel:
+        """
+        계정 목록과 영업 기회 컬럼으로부터 집계 항목을 처음부터 계산
+        :param tenant_id: 테넌트 ID
+        :param accounts: 활성 계정 목록
+        :param opportunity_columns: 활성 영업 기회 컬럼
+        :return: 계산된 집계 항목 (저장되지 않음)
+        """
+        stats = TenantStatsModel(
+            tenant_id,
+            account_count=len(accounts),
+            opportunity_count=len(opportunity_columns),
+            total_expected_revenue=opportunity_columns.total_revenue()
+        )
+        counts, sums = opportunity_columns.stage_totals()
+        for stage, count, revenue in zip(STAGES, counts, sums):
+            count_attr, revenue_attr = STAGE_STAT_ATTRIBUTES[stage]
+            setattr(stats, count_attr, count)
+            setattr(stats, revenue_attr, revenue)
+        return stats
+
+    @staticmethod
+    async def _compute_from_source(tenant_id: str) -> TenantStatsModel:
+        """
+        테넌트의 계정/영업 기회 원본 데이터를 새로 읽어 집계 계산
+        """
+        # tenant_snapshot이 계정/영업 기회 서비스를 import하고, 그 서비스들이 이 모듈을 import하므로 지연 import
+        from app.services.tenant_snapshot import TenantSnapshot
+        snapshot = await TenantSnapshot.load(tenant_id)
+        return TenantStatsService.compute_stats(tenant_id, snapshot.accounts, snapshot.opportunity_columns)
+
+    @staticmethod
+    async def _put_if_unchanged(stats: TenantStatsModel, stored: Optional[TenantStatsModel]) -> bool:
+        """
+        읽은 이후 집계 항목이 바뀌지 않았을 때만 저장 (없던 항목은 여전히 없을 때만)
+        집계 ADD 업데이트는 항상 updated_at을 바꾸므로 읽은 updated_at과 같으면 그 사이 반영된 변경이 없다.
+        :return: 저장 여부 (False면 그 사이 다른 쓰기가 있었음)
+        """
+        if stored is None:
+            condition = TenantStatsModel.tenant_id.does_not_exist()
+        elif stored.updated_at is None:
+            condition = TenantStatsModel.updated_at.does_not_exist()
+        else:
+            condition = TenantStatsModel.updated_at == stored.updated_at
+        try:
+            await db_save(stats, condition=condition)
+        except PutError as e:
+            if e.cause_response_code != "ConditionalCheckFailedException":
+                raise
+            return False
+        return True
+
+    @staticmethod
+    async def ensure_stats(tenant_id: str) -> None:
+        """
+        집계 항목이 없으면 원본 데이터로 계산하여 생성 (집계 ADD 업데이트 트랜잭션 전에 호출)
+        항목 없이 ADD 업데이트를 하면 그 변경분만 담긴 부분 항목이 만들어져 잘못된 집계가 계속 제공되므로,
+        첫 쓰기 전에 전체 값을 attribute_not_exists 조건으로 저장한다 (동시에 생성되면 먼저 저장된 항목을 사용).
+        :param tenant_id: 테넌트 ID
+        """
+        if _known_stats.get(tenant_id):
+            return
+        if await TenantStatsService.get_stats(tenant_id) is None:
+            stats = await TenantStatsService._compute_from_source(tenant_id)
+            await TenantStatsService._put_if_unchanged(stats, None)
+        _known_stats.set(tenant_id, True)
+
+    @staticmethod
+    async def reconcile(tenant_id: str, apply: bool = True, attempts: int = 5) -> Dict[str, Dict[str, float]]:
+        """
+        테넌트 집계를 원본 데이터로 처음부터 재계산하고 저장된 값과의 차이(drift)를 보고
+        저장된 항목을 먼저 읽고 원본 데이터를 읽은 뒤, 그 사이 집계가 바뀌지 않았을 때만 덮어쓴다
+        (재계산 중에 반영된 쓰기를 잃지 않도록 - 바뀌었으면 다시 읽어 재시도).
+        :param tenant_id: 테넌트 ID
+        :param apply: True이면 재계산된 값으로 집계 항목을 덮어씀
+        :param attempts: 동시 쓰기로 저장이 거부될 때의 최대 시도 횟수
+        :return: 속성별 {"stored", "actual"} 차이 (차이가 없으면 빈 dict)
+        """
+        for _ in range(attempts):
+            stored = await TenantStatsService.get_stats(tenant_id)
+            actual = await TenantStatsService._compute_from_source(tenant_id)
+
+            drift = {}
+            for attr in TenantStatsModel.get_attributes():
+                if attr in ("tenant_id", "updated_at"):
+                    continue
+                stored_value = (getattr(stored, attr) or 0) if stored else 0
+                actual_value = getattr(actual, attr) or 0
+                if abs(stored_value - actual_value) > 1e-6:
+                    drift[attr] = {"stored": stored_value, "actual": actual_value}
+
+            if not apply or not (drift or stored is None):
+                return drift
+            if await TenantStatsService._put_if_unchanged(actual, stored):
+                _known_stats.set(tenant_id, True)
+                return drift
+        raise RuntimeError(f"Tenant stats for {tenant_id} kept changing during reconcile ({attempts} attempts)")
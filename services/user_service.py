@@ -1,9 +1,26 @@
+from app.core.cache import principal_cache
+from app.core.config import settings
+from app.core.exceptions import ConflictException
+from app.core.singleflight import single_flight
 from app.models.user import UserModel
 from app.schemas.user import UserCreate, UserUpdate, UserInDB
+from app.services.raw_records import UserRecord
+from app.utils.fields import projection
+from app.utils.pagination import CursorPage, encode_cursor, decode_cursor
+from app.utils.async_dynamodb import db_call, db_get, db_save, db_query_raw, db_query_raw_page, db_query_raw_pages
+from app.utils.item_updates import current_version, update_item
 from fastapi import HTTPException
-from typing import List
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 import uuid
 
+# UserUpdate 필드 이름 -> UserModel 속성 이름 (이름이 다른 필드만)
+USER_UPDATE_ATTRIBUTES = {"givenname": "given_name", "familyname": "family_name"}
+
+# 관리 계정 추가/제거가 다른 변경과 겹쳤을 때 다시 읽어 반영하는 최대 시도 횟수
+MANAGED_ACCOUNT_UPDATE_ATTEMPTS = 3
+
+_get_user_flight = single_flight("UserService.get_user")
+
 class UserService:
     @staticmethod
     async def create_user(user: UserCreate) -> UserInDB:
@@ -14,17 +31,18 @@ class UserService:
         """
         db_user = UserModel(
             user_id=user.user_id,
-            tenant_id=user.tenant_id,
+            tenant_name=user.tenant_name,
             email=user.email,
             given_name=user.given_name,  # 'name'을 'given_name'으로 변경
             family_name=user.family_name,  # 'family_name' 추가
-            role=user.role
+            role=user.role,
+            version=1
         )
         try:
-            db_user.save()
+            await db_save(db_user)
             return UserInDB(
                 user_id=db_user.user_id,
-                tenant_id=db_user.tenant_id,
+                tenant_name=db_user.tenant_name,
                 email=db_user.email,
                 given_name=db_user.given_name,  # 'name'을 'given_name'으로 변경
                 family_name=db_user.family_name,  # 'family_name' 추가
@@ -32,7 +50,8 @@ class UserService:
                 created_at=db_user.created_at,
                 updated_at=db_user.updated_at,
                 is_active=db_user.is_active,
-                managed_account_ids=db_user.managed_account_ids
+                managed_account_ids=db_user.managed_account_ids,
+                version=current_version(db_user)
             )
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Could not create user: {str(e)}")
@@ -41,15 +60,22 @@ class UserService:
     async def get_user(user_id: str, tenant_id: str) -> UserInDB:
         """
         사용자 ID와 테넌트 ID로 사용자 조회
+        동일 사용자에 대한 동시 조회는 한 번의 DynamoDB 읽기로 병합되며, 호출자마다 복사본을 반환한다.
+        사용자 변경 후에는 변경 전에 시작된 조회에 합류하지 않는다 (update_user/delete_user에서 병합 항목을 분리).
         :param user_id: 사용자 ID
         :param tenant_id: 테넌트 ID
         :return: 조회된 사용자 정보
         """
+        user = await _get_user_flight.do((user_id, tenant_id), UserService._fetch_user, user_id, tenant_id)
+        return user.copy(deep=True)
+
+    @staticmethod
+    async def _fetch_user(user_id: str, tenant_id: str) -> UserInDB:
         try:
-            user = UserModel.get(user_id, tenant_id)
+            user = await db_get(UserModel, user_id, tenant_id)
             return UserInDB(
                 user_id=user.user_id,
-                tenant_id=user.tenant_id,
+                tenant_name=user.tenant_name,
                 email=user.email,
                 given_name=user.given_name,  # 'name'을 'given_name'으로 변경
                 family_name=user.family_name,  # 'family_name' 추가
@@ -57,7 +83,8 @@ class UserService:
                 created_at=user.created_at,
                 updated_at=user.updated_at,
                 is_active=user.is_active,
-                managed_account_ids=user.managed_account_ids
+                managed_account_ids=user.managed_account_ids,
+                version=current_version(user)
             )
         except UserModel.DoesNotExist:
             raise HTTPException(status_code=404, detail="User not found")
@@ -65,29 +92,34 @@ class UserService:
     @staticmethod
     async def update_user(user_id: str, tenant_id: str, user_update: UserUpdate) -> UserInDB:
         """
-        사용자 정보 업데이트
+        사용자 정보 업데이트 (변경된 속성만 단일 UpdateItem으로 반영)
         :param user_id: 업데이트할 사용자 ID
         :param tenant_id: 테넌트 ID
-        :param user_update: 업데이트할 사용자 정보
+        :param user_update: 업데이트할 사용자 정보 (version이 주어지면 그 버전일 때만 반영, 아니면 409)
         :return: 업데이트된 사용자 정보
         """
+        update_data = user_update.dict(exclude_unset=True)
+        expected_version = update_data.pop("version", None)
+        values = {USER_UPDATE_ATTRIBUTES.get(key, key): value for key, value in update_data.items()}
         try:
-            user = UserModel.get(user_id, tenant_id)
-            update_data = user_update.dict(exclude_unset=True)
-            for key, value in update_data.items():
-                setattr(user, key, value)
-            user.save()
+            user = await update_item(
+                UserModel, user_id, tenant_id, values,
+                expected_version=expected_version, conflict_detail="User was modified concurrently"
+            )
+            _get_user_flight.forget((user_id, tenant_id))
+            principal_cache.invalidate_user(user_id, tenant_id)
             return UserInDB(
                 user_id=user.user_id,
-                tenant_id=user.tenant_id,
+                tenant_name=user.tenant_name,
                 email=user.email,
-                given_name=user.given_name,  # 'name'을 'given_name'으로 변경
-                family_name=user.family_name,  # 'family_name' 추가
+                given_name=user.given_name,
+                family_name=user.family_name,
                 role=user.role,
                 created_at=user.created_at,
                 updated_at=user.updated_at,
                 is_active=user.is_active,
-                managed_account_ids=user.managed_account_ids
+                managed_account_ids=user.managed_account_ids,
+                version=current_version(user)
             )
         except UserModel.DoesNotExist:
             raise HTTPException(status_code=404, detail="User not found")
@@ -95,42 +127,80 @@ class UserService:
     @staticmethod
     async def delete_user(user_id: str, tenant_id: str) -> bool:
         """
-        사용자 삭제 (소프트 삭제)
+        사용자 삭제 (소프트 삭제, 단일 UpdateItem)
         :param user_id: 삭제할 사용자 ID
         :param tenant_id: 테넌트 ID
         :return: 삭제 성공 여부
         """
         try:
-            user = UserModel.get(user_id, tenant_id)
-            user.is_active = False
-            user.save()
+            await update_item(UserModel, user_id, tenant_id, {"is_active": False})
+            _get_user_flight.forget((user_id, tenant_id))
+            principal_cache.invalidate_user(user_id, tenant_id)
             return True
         except UserModel.DoesNotExist:
             raise HTTPException(status_code=404, detail="User not found")
 
     @staticmethod
-    async def list_users(tenant_id: str) -> List[UserInDB]:
+    async def list_users(tenant_id: str) -> List[UserRecord]:
         """
         테넌트의 모든 활성 사용자 목록 조회
+        (원시 항목을 모델/스키마 객체 생성 없이 __slots__ 레코드로 바로 디코딩)
         :param tenant_id: 테넌트 ID
-        :return: 사용자 목록
+        :return: 사용자 레코드 목록
         """
-        users = UserModel.query(tenant_id, UserModel.is_active == True)
-        return [
-            UserInDB(
-                user_id=user.user_id,
-                tenant_id=user.tenant_id,
-                email=user.email,
-                given_name=user.given_name,  # 'name'을 'given_name'으로 변경
-                family_name=user.family_name,  # 'family_name' 추가
-                role=user.role,
-                created_at=user.created_at,
-                updated_at=user.updated_at,
-                is_active=user.is_active,
-                managed_account_ids=user.managed_account_ids
-            )
-            for user in users
-        ]
+        # 활성 사용자만 담긴 희소 GSI를 조회 (비활성 항목을 읽고 필터로 버리지 않음)
+        items = await db_query_raw(UserModel, tenant_id, index_name=UserModel.active_index.Meta.index_name)
+        return UserRecord.from_items(items)
+
+    @staticmethod
+    async def list_users_page(tenant_id: str, size: int = 10, cursor: Optional[str] = None, include_total: bool = False, fields: Optional[List[str]] = None) -> CursorPage[Dict[str, Any]]:
+        """
+        테넌트의 활성 사용자 목록을 커서 기반으로 한 페이지 조회
+        (원시 항목을 응답용 dict로 바로 디코딩 - 응답 스키마 검증은 라우터에서 한 번만 수행)
+        :param tenant_id: 테넌트 ID
+        :param size: 페이지당 항목 수
+        :param cursor: 이전 페이지의 next_cursor
+        :param include_total: 전체 항목 수 포함 여부
+        :param fields: 응답에 포함할 필드 (주어지면 해당 속성만 읽고 해당 필드만 반환)
+        :return: 사용자 페이지
+        """
+        scope = f"active-users:{tenant_id}"
+        items, last_evaluated_key = await db_query_raw_page(
+            UserModel,
+            tenant_id,
+            size,
+            index_name=UserModel.active_index.Meta.index_name,
+            attributes_to_get=projection(UserModel, fields),
+            exclusive_start_key=decode_cursor(cursor, scope)
+        )
+        total = None
+        if include_total:
+            total = await db_call(UserModel, UserModel.active_index.count, tenant_id)
+        return CursorPage[Dict[str, Any]].construct(
+            items=[UserRecord.to_dict(item, fields) for item in items],
+            size=size,
+            next_cursor=encode_cursor(last_evaluated_key, scope),
+            total=total
+        )
+
+    @staticmethod
+    async def stream_users(tenant_id: str, fields: Optional[List[str]] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        테넌트의 모든 활성 사용자를 DynamoDB 페이지 단위로 응답용 dict로 디코딩하여 순차 반환 (스트리밍 응답용)
+        전체 목록을 메모리에 만들지 않으므로 테넌트 크기와 무관하게 한 페이지 분량만 유지한다.
+        :param tenant_id: 테넌트 ID
+        :param fields: 응답에 포함할 필드 (주어지면 해당 속성만 읽고 해당 필드만 반환)
+        :return: 사용자 dict 목록(페이지)의 비동기 이터레이터
+        """
+        pages = db_query_raw_pages(
+            UserModel,
+            tenant_id,
+            index_name=UserModel.active_index.Meta.index_name,
+            attributes_to_get=projection(UserModel, fields),
+            page_size=settings.STREAM_PAGE_SIZE
+        )
+        async for items in pages:
+            yield [UserRecord.to_dict(item, fields) for item in items]
 
     @staticmethod
     async def add_managed_account(user_id: str, tenant_id: str, account_id: str) -> UserInDB:
@@ -141,25 +211,12 @@ class UserService:
         :param account_id: 추가할 계정 ID
         :return: 업데이트된 사용자 정보
         """
-        try:
-            user = UserModel.get(user_id, tenant_id)
-            if account_id not in user.managed_account_ids:
-                user.managed_account_ids.append(account_id)
-                user.save()
-            return UserInDB(
-                user_id=user.user_id,
-                tenant_id=user.tenant_id,
-                email=user.email,
-                given_name=user.given_name,  # 'name'을 'given_name'으로 변경
-                family_name=user.family_name,  # 'family_name' 추가
-                role=user.role,
-                created_at=user.created_at,
-                updated_at=user.updated_at,
-                is_active=user.is_active,
-                managed_account_ids=user.managed_account_ids
-            )
-        except UserModel.DoesNotExist:
-            raise HTTPException(status_code=404, detail="User not found")
+        def add(account_ids: List[str]) -> bool:
+            if account_id in account_ids:
+                return False
+            account_ids.append(account_id)
+            return True
+        return await UserService._change_managed_accounts(user_id, tenant_id, add)
 
     @staticmethod
     async def remove_managed_account(user_id: str, tenant_id: str, account_id: str) -> UserInDB:
@@ -170,22 +227,52 @@ class UserService:
         :param account_id: 제거할 계정 ID
         :return: 업데이트된 사용자 정보
         """
+        def remove(account_ids: List[str]) -> bool:
+            if account_id not in account_ids:
+                return False
+            account_ids.remove(account_id)
+            return True
+        return await UserService._change_managed_accounts(user_id, tenant_id, remove)
+
+    @staticmethod
+    async def _change_managed_accounts(user_id: str, tenant_id: str, change: Callable[[List[str]], bool]) -> UserInDB:
+        """
+        관리 계정 목록을 읽어 변경한 뒤 읽은 버전일 때만 반영 (다른 변경과 겹치면 다시 읽어 재시도)
+        :param user_id: 사용자 ID
+        :param tenant_id: 테넌트 ID
+        :param change: 목록을 제자리에서 변경하고 변경 여부를 반환하는 함수
+        :return: 업데이트된 사용자 정보
+        """
         try:
-            user = UserModel.get(user_id, tenant_id)
-            if account_id in user.managed_account_ids:
-                user.managed_account_ids.remove(account_id)
-                user.save()
+            for attempt in range(MANAGED_ACCOUNT_UPDATE_ATTEMPTS):
+                user = await db_get(UserModel, user_id, tenant_id)
+                account_ids = list(user.managed_account_ids)
+                if not change(account_ids):
+                    break
+                try:
+                    user = await update_item(
+                        UserModel, user_id, tenant_id, {"managed_account_ids": account_ids},
+                        expected_version=current_version(user), conflict_detail="User was modified concurrently"
+                    )
+                except ConflictException:
+                    if attempt + 1 == MANAGED_ACCOUNT_UPDATE_ATTEMPTS:
+                        raise
+                    continue
+                _get_user_flight.forget((user_id, tenant_id))
+                principal_cache.invalidate_user(user_id, tenant_id)
+                break
             return UserInDB(
                 user_id=user.user_id,
-                tenant_id=user.tenant_id,
+                tenant_name=user.tenant_name,
                 email=user.email,
-                given_name=user.given_name,  # 'name'을 'given_name'으로 변경
-                family_name=user.family_name,  # 'family_name' 추가
+                given_name=user.given_name,
+                family_name=user.family_name,
                 role=user.role,
                 created_at=user.created_at,
                 updated_at=user.updated_at,
                 is_active=user.is_active,
-                managed_account_ids=user.managed_account_ids
+                managed_account_ids=user.managed_account_ids,
+                version=current_version(user)
             )
         except UserModel.DoesNotExist:
-            raise HTTPException(status_code=404, detail="User not found")
\ No newline at end of file
+            raise HTTPException(status_code=404, detail="User not found")
@@ -0,0 +1,120 @@
+"""
+테스트 공통 설정
+- 저장소 루트를 app 패키지로 import할 수 있게 하고 (소스는 app.* 경로로 서로 import한다),
+  Parameter Store 없이 환경 변수만으로 설정을 읽도록 한다.
+- 테스트용 RSA 키로 로컬 JWKS 파일(COGNITO_JWKS_FILE)을 만들어 실제 검증 경로로 토큰을 검증한다.
+- DynamoDB가 필요한 테스트는 dynamodb 픽스처(moto)를 사용한다.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import types
+import uuid
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if "app" not in sys.modules:
+    package = types.ModuleType("app")
+    package.__path__ = [str(ROOT)]
+    sys.modules["app"] = package
+
+REGION = "ap-northeast-2"
+USER_POOL_ID = "ap-northeast-2_test"
+CLIENT_ID = "test-client"
+ISSUER = f"https://cognito-idp.{REGION}.amazonaws.com/{USER_POOL_ID}"
+KID = "test-key"
+
+_workdir = tempfile.mkdtemp(prefix="crm-tests-")
+JWKS_FILE = os.path.join(_workdir, "jwks.json")
+
+os.environ.update(
+    PARAMETER_STORE_ENABLED="false",
+    AWS_REGION=REGION,
+    AWS_DEFAULT_REGION=REGION,
+    AWS_ACCESS_KEY_ID="testing",
+    AWS_SECRET_ACCESS_KEY="testing",
+    COGNITO_USER_POOL_ID=USER_POOL_ID,
+    COGNITO_APP_CLIENT_ID=CLIENT_ID,
+    COGNITO_JWKS_FILE=JWKS_FILE,
+    JWT_SECRET_KEY="test-secret",
+    RESPONSE_VALIDATION="true",
+    DYNAMODB_TENANT_TABLE="test-tenants",
+    DYNAMODB_USER_TABLE="test-users",
+    DYNAMODB_ACCOUNT_TABLE="test-accounts",
+    DYNAMODB_OPPORTUNITY_TABLE="test-opportunities",
+    DYNAMODB_TENANT_STATS_TABLE="test-tenant-stats",
+)
+
+def _generate_signing_key():
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from jose import jwk
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    public_jwk = jwk.construct(public_pem, "RS256").to_dict()
+    public_jwk.update(kid=KID, use="sig", alg="RS256")
+    with open(JWKS_FILE, "w") as f:
+        json.dump({"keys": [public_jwk]}, f)
+    return private_pem
+
+PRIVATE_KEY_PEM = _generate_signing_key()
+
+def _make_token(kid: str = KID, headers: dict = None, key: str = None, algorithm: str = "RS256", **claims) -> str:
+    """
+    테스트용 Cognito 형식 토큰 발급 (claims로 기본 클레임을 덮어쓰고, 값이 None이면 클레임을 뺌)
+    """
+    from jose import jwt
+
+    now = int(time.time())
+    payload = {
+        "sub": "user-1",
+        "custom:tenant_id": "tenant-1",
+        "iss": ISSUER,
+        "client_id": CLIENT_ID,
+        "token_use": "access",
+        "iat": now,
+        "exp": now + 3600,
+        "jti": str(uuid.uuid4()),
+    }
+    payload.update(claims)
+    payload = {name: value for name, value in payload.items() if value is not None}
+    token_headers = {"kid": kid} if kid is not None else {}
+    token_headers.update(headers or {})
+    return jwt.encode(payload, key or PRIVATE_KEY_PEM, algorithm=algorithm, headers=token_headers)
+
+@pytest.fixture
+def make_token():
+    """
+    테스트용 토큰 발급 함수
+    """
+    return _make_token
+
+@pytest.fixture
+def dynamodb():
+    """
+    moto DynamoDB에 애플리케이션 테이블을 만들고 테스트가 끝나면 정리
+    """
+    moto = pytest.importorskip("moto")
+    with moto.mock_aws():
+        from app.models import AccountModel, OpportunityModel, TenantModel, TenantStatsModel, UserModel
+        from app.utils.async_dynamodb import reset_db_state
+
+        models = [TenantModel, UserModel, AccountModel, OpportunityModel, TenantStatsModel]
+        for model in models:
+            # PynamoDB 연결은 클래스에 캐시되므로 이전 테스트의 moto 연결을 버린다
+            model._connection = None
+            model.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
+        yield
+        reset_db_state()
+        for model in models:
+            model._connection = None
@@ -0,0 +1,106 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import analytics
+from app.core.cache import tenant_versions
+from app.core.deps import get_current_active_user, get_tenant_id
+from app.models import TenantStatsModel
+from app.services import analytics_columnar, analytics_service
+from app.services.analytics_columnar import OpportunityColumns
+from app.services.analytics_service import AnalyticsService
+from app.services.tenant_stats_service import TenantStatsService
+
+TENANT = "t-analytics"
+
+@pytest.fixture
+def client(dynamodb, monkeypatch):
+    # 다른 워커의 쓰기는 이 프로세스의 데이터 버전을 바꾸지 않으므로 결과 캐시 만료로만 반영된다
+    monkeypatch.setattr(analytics_service._result_cache.local, "ttl", 0.2)
+    analytics_service._result_cache.clear()
+    TenantStatsModel(TENANT, account_count=2, opportunity_count=3, total_expected_revenue=300, committed_count=3, committed_revenue=300).save()
+    app = FastAPI()
+    app.include_router(analytics.router, prefix="/analytics")
+    app.dependency_overrides[get_current_active_user] = lambda: {"sub": "user-1"}
+    app.dependency_overrides[get_tenant_id] = lambda: TENANT
+    return TestClient(app)
+
+def other_worker_write():
+    # 다른 워커/컨테이너에서 처리된 쓰기: 집계는 바뀌지만 이 프로세스의 tenant_versions는 그대로
+    TenantStatsModel(TENANT).update(actions=[
+        TenantStatsModel.opportunity_count.add(1),
+        TenantStatsModel.total_expected_revenue.add(50),
+        TenantStatsModel.prospecting_count.add(1),
+        TenantStatsModel.prospecting_revenue.add(50),
+    ])
+
+def test_matching_etag_returns_304(client):
+    first = client.get("/analytics/tenant-summary")
+    assert first.status_code == 200
+    assert first.json() == {"total_accounts": 2, "total_opportunities": 3, "total_expected_revenue": 300}
+    etag = first.headers["etag"]
+
+    cached = client.get("/analytics/tenant-summary", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert client.get("/analytics/tenant-summary", headers={"If-None-Match": '"other"'}).status_code == 200
+
+def test_etag_depends_on_parameters(client):
+    assert client.get("/analytics/top-accounts-by-revenue?limit=1").headers["etag"] != \
+        client.get("/analytics/top-accounts-by-revenue?limit=2").headers["etag"]
+
+def test_write_on_another_worker_changes_etag(client):
+    etag = client.get("/analytics/tenant-summary").headers["etag"]
+    version = tenant_versions.get(TENANT)
+    other_worker_write()
+    assert tenant_versions.get(TENANT) == version
+
+    time.sleep(0.25)
+    for path in ("/analytics/tenant-summary", "/analytics/sales-pipeline", "/analytics/opportunity-stage-distribution"):
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 200, path
+    assert client.get("/analytics/tenant-summary", headers={"If-None-Match": etag}).json()["total_opportunities"] == 4
+
+def test_local_write_invalidates_cached_result(client):
+    etag = client.get("/analytics/tenant-summary").headers["etag"]
+    other_worker_write()
+    tenant_versions.bump(TENANT)
+    assert client.get("/analytics/tenant-summary", headers={"If-None-Match": etag}).status_code == 200
+
+def test_results_are_cached_per_data_version(client, monkeypatch):
+    reads = []
+    get_stats = TenantStatsService.get_stats
+
+    async def counting_get_stats(tenant_id):
+        reads.append(tenant_id)
+        return await get_stats(tenant_id)
+
+    monkeypatch.setattr(TenantStatsService, "get_stats", staticmethod(counting_get_stats))
+
+    async def summaries():
+        return await asyncio.gather(*(AnalyticsService.get_tenant_summary(TENANT) for _ in range(5)))
+
+    assert len({str(result) for result in asyncio.run(summaries())}) == 1
+    assert asyncio.run(AnalyticsService.get_tenant_summary(TENANT))["total_accounts"] == 2
+    assert len(reads) == 1
+
+    tenant_versions.bump(TENANT)
+    asyncio.run(AnalyticsService.get_tenant_summary(TENANT))
+    assert len(reads) == 2
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_top_accounts_keeps_input_order_for_ties(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(analytics_columnar, "_numpy", None)
+    columns = OpportunityColumns.from_raw_items(
+        {"stage": {"S": "Prospecting"}, "expected_revenue": {"N": str(revenue)}, "account_id": {"S": account_id}, "manager_id": {"S": "m"}}
+        for account_id, revenue in (("a", 10), ("b", 30), ("c", 10), ("d", 30), ("e", 5))
+    )
+    account_ids = ["e", "d", "c", "b", "a", "z"]
+    assert columns.top_accounts(account_ids, 3) == [(1, 30.0), (3, 30.0), (2, 10.0)]
+    assert [index for index, _ in columns.top_accounts(account_ids, 10)] == [1, 3, 2, 4, 0, 5]
@@ -0,0 +1,87 @@
+import asyncio
+import csv
+import io
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import export
+from app.core.config import settings
+from app.core.deps import get_current_active_user, get_tenant_id
+from app.models import AccountModel, OpportunityModel
+from app.schemas.account import AccountInDB
+from app.services.account_service import AccountService
+from app.services.export_service import ACCOUNT_NAME_COLUMN, ExportService
+
+TENANT = "t-export"
+
+@pytest.fixture
+def records(dynamodb):
+    AccountModel("acc-active", TENANT, name="Active Co", manager_id="m").save()
+    AccountModel("acc-closed", TENANT, name="Closed Co", manager_id="m", is_active=0).save()
+    for i, account_id in enumerate(("acc-active", "acc-closed", "acc-missing", "acc-active")):
+        OpportunityModel(
+            f"opp-{i}", TENANT, account_id=account_id, name=f"o{i}", stage="Prospecting",
+            expected_revenue=10 * i, manager_id="m"
+        ).save()
+
+def export_rows(**kwargs):
+    async def collect():
+        return [row async for page in ExportService.export_opportunities(TENANT, **kwargs) for row in page]
+    return asyncio.run(collect())
+
+def test_account_names_join_includes_inactive_accounts(records, monkeypatch):
+    lookups = []
+    get_account_names_by_id = AccountService.get_account_names_by_id
+
+    async def counting_lookup(tenant_id, account_ids):
+        lookups.append(sorted(account_ids))
+        return await get_account_names_by_id(tenant_id, account_ids)
+
+    monkeypatch.setattr(AccountService, "get_account_names_by_id", staticmethod(counting_lookup))
+    rows = export_rows(fields=["name"], include_account_name=True)
+    assert {row["name"]: row[ACCOUNT_NAME_COLUMN] for row in rows} == {
+        "o0": "Active Co", "o1": "Closed Co", "o2": None, "o3": "Active Co"
+    }
+    assert all(set(row) == {"name", ACCOUNT_NAME_COLUMN} for row in rows)
+    # 활성 인덱스에 없는 계정만 한 번 키로 읽음
+    assert lookups == [["acc-closed", "acc-missing"]]
+
+def test_active_account_names_come_from_active_index(records):
+    assert asyncio.run(AccountService.get_account_names(TENANT)) == {"acc-active": "Active Co"}
+
+@pytest.fixture
+def client(records, monkeypatch):
+    # 여러 DynamoDB 페이지에 걸친 내보내기
+    monkeypatch.setattr(settings, "STREAM_PAGE_SIZE", 1)
+    app = FastAPI()
+    app.include_router(export.router, prefix="/export")
+    app.dependency_overrides[get_current_active_user] = lambda: {"sub": "user-1"}
+    app.dependency_overrides[get_tenant_id] = lambda: TENANT
+    return TestClient(app)
+
+def test_export_opportunities_csv(client):
+    response = client.get("/export/opportunities", params={"fields": "name,expected_revenue", "include_account_name": True})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == 'attachment; filename="opportunities.csv"'
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert sorted((row["name"], row["expected_revenue"], row[ACCOUNT_NAME_COLUMN]) for row in rows) == [
+        ("o0", "0.0", "Active Co"), ("o1", "10.0", "Closed Co"), ("o2", "20.0", ""), ("o3", "30.0", "Active Co")
+    ]
+
+def test_export_accounts_ndjson_gzip(client):
+    response = client.get("/export/accounts", params={"format": "ndjson", "fields": "account_id,is_active"}, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    # 비활성 계정은 내보내지 않음
+    assert [json.loads(line) for line in response.text.splitlines()] == [{"account_id": "acc-active", "is_active": True}]
+
+def test_export_without_gzip_and_unknown_field(client):
+    response = client.get("/export/accounts", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in response.headers
+    assert response.text.splitlines()[0] == ",".join(AccountInDB.__fields__)
+    assert client.get("/export/opportunities", params={"fields": "name,secret"}).status_code == 400
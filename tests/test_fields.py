@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import accounts
+from app.core.deps import get_current_active_user, get_tenant_id
+from app.core.exceptions import BadRequestException
+from app.models import AccountModel, UserModel
+from app.schemas.account import AccountInDB
+from app.schemas.user import UserInDB
+from app.services.account_service import AccountService
+from app.utils.fields import parse_fields, projection, select_fields
+
+TENANT = "t-fields"
+
+def test_parse_fields_strips_and_deduplicates():
+    assert parse_fields(None, AccountInDB) is None
+    assert parse_fields(" , ", AccountInDB) is None
+    assert parse_fields("name, is_active,name", AccountInDB) == ["name", "is_active"]
+
+def test_parse_fields_rejects_unknown_fields():
+    with pytest.raises(BadRequestException) as error:
+        parse_fields("name,secret,other", AccountInDB)
+    assert error.value.status_code == 400
+    assert error.value.detail == "Unknown fields: secret, other"
+
+def test_projection_reads_only_selected_attributes():
+    assert projection(AccountModel, None) is None
+    assert projection(AccountModel, ["name", "version"]) == ["name", "version"]
+    # 모델에 저장되지 않는 스키마 필드만 고르면 해시 키만 읽음
+    assert projection(UserModel, ["password"]) == ["user_id"]
+
+def test_select_fields_converts_to_schema_types():
+    account = AccountModel("acc-1", TENANT, name="acme", manager_id="m", is_active=1)
+    assert select_fields(account, ["is_active", "name", "version"], AccountInDB) == {"is_active": True, "name": "acme", "version": 0}
+    assert select_fields(UserModel("u", TENANT), ["password"], UserInDB) == {"password": None}
+
+@pytest.fixture
+def client(dynamodb):
+    AccountModel("acc-1", TENANT, name="acme", manager_id="m", active_tenant_id=TENANT, version=3).save()
+    app = FastAPI()
+    app.include_router(accounts.router, prefix="/accounts")
+    app.dependency_overrides[get_current_active_user] = lambda: {"sub": "user-1"}
+    app.dependency_overrides[get_tenant_id] = lambda: TENANT
+    return TestClient(app)
+
+def test_get_account_with_selected_fields(client, monkeypatch):
+    reads = []
+    get = AccountModel.get
+
+    def recording_get(*args, **kwargs):
+        reads.append(kwargs.get("attributes_to_get"))
+        return get(*args, **kwargs)
+
+    monkeypatch.setattr(AccountModel, "get", recording_get)
+    response = client.get("/accounts/acc-1", params={"fields": "name,version"})
+    assert response.status_code == 200
+    assert response.json() == {"name": "acme", "version": 3}
+    assert reads == [["name", "version"]]
+
+    assert set(client.get("/accounts/acc-1").json()) == set(AccountInDB.__fields__)
+    assert client.get("/accounts/acc-1", params={"fields": "name,password"}).status_code == 400
+
+def test_page_with_selected_fields(client):
+    page = client.get("/accounts/page", params={"fields": "account_id,is_active"}).json()
+    assert page["items"] == [{"account_id": "acc-1", "is_active": True}]
+
+def test_service_returns_schema_without_fields(client):
+    account = asyncio.run(AccountService.get_account("acc-1", TENANT))
+    assert isinstance(account, AccountInDB)
+    assert account.version == 3
@@ -0,0 +1,23 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+
+PATHS = ("/internal/ready", "/internal/single-flight", "/internal/startup")
+
+@pytest.fixture
+def client():
+    from app.main import app
+    return TestClient(app)
+
+def test_internal_endpoints_are_hidden_by_default(client):
+    assert not settings.INTERNAL_ENDPOINTS_ENABLED
+    for path in PATHS:
+        assert client.get(path).status_code == 404, path
+
+def test_internal_endpoints_when_enabled(client, monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_ENDPOINTS_ENABLED", True)
+    assert client.get("/internal/single-flight").status_code == 200
+    assert "phases" in client.get("/internal/startup").json()
+    # startup 핸들러를 실행하지 않았으므로 준비 전 상태
+    assert client.get("/internal/ready").status_code == 503
@@ -0,0 +1,96 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from app.core.jwks import JWKSManager
+from conftest import JWKS_FILE, KID
+
+@pytest.fixture
+def jwks_path(tmp_path):
+    path = tmp_path / "jwks.json"
+    path.write_text(open(JWKS_FILE).read())
+    return path
+
+def rotate(path, *kids):
+    """
+    JWKS 파일의 키를 같은 공개 키에 다른 kid를 붙인 키들로 교체
+    """
+    key = json.loads(open(JWKS_FILE).read())["keys"][0]
+    path.write_text(json.dumps({"keys": [dict(key, kid=kid) for kid in kids]}))
+
+def counting_manager(path, delay: float = 0.0, **kwargs) -> JWKSManager:
+    manager = JWKSManager(file_path=str(path), **kwargs)
+    fetch_document = manager._fetch_document
+    manager.fetches = 0
+
+    def counting_fetch():
+        manager.fetches += 1
+        time.sleep(delay)
+        return fetch_document()
+
+    manager._fetch_document = counting_fetch
+    return manager
+
+def test_unknown_kid_refreshes_key_set(jwks_path):
+    manager = counting_manager(jwks_path, min_refresh_interval=0)
+    assert asyncio.run(manager.get_key(KID)) is not None
+    rotate(jwks_path, KID, "rotated")
+    assert asyncio.run(manager.get_key("rotated")) is not None
+    assert manager.fetches == 2
+    # 이미 아는 kid는 다시 조회하지 않음
+    asyncio.run(manager.get_key("rotated"))
+    assert manager.fetches == 2
+
+def test_concurrent_unknown_kid_lookups_share_one_fetch(jwks_path):
+    manager = counting_manager(jwks_path, delay=0.05, min_refresh_interval=0)
+    rotate(jwks_path, "rotated")
+
+    async def lookups():
+        return await asyncio.gather(*(manager.get_key("rotated") for _ in range(10)))
+
+    keys = asyncio.run(lookups())
+    assert all(key is keys[0] for key in keys)
+    assert manager.fetches == 1
+
+def test_missing_kid_is_remembered(jwks_path):
+    manager = counting_manager(jwks_path, min_refresh_interval=0)
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            asyncio.run(manager.get_key("forged"))
+    assert manager.fetches == 1
+    assert manager.status()["unknown_kids"] == 1
+
+    # 정상 갱신이 일어나면 기억한 kid를 잊으므로 이후 추가된 키를 찾을 수 있음
+    rotate(jwks_path, KID, "forged")
+    assert asyncio.run(manager.refresh())
+    assert asyncio.run(manager.get_key("forged")) is not None
+
+def test_refreshes_are_rate_limited(jwks_path):
+    manager = counting_manager(jwks_path, min_refresh_interval=60)
+    asyncio.run(manager.get_key(KID))
+    for kid in ("a", "b", "c"):
+        with pytest.raises(ValueError):
+            asyncio.run(manager.get_key(kid))
+    assert manager.fetches == 1
+
+def test_failed_refresh_keeps_last_key_set(jwks_path):
+    manager = counting_manager(jwks_path)
+    assert asyncio.run(manager.refresh())
+    jwks_path.write_text("not json")
+    assert not asyncio.run(manager.refresh())
+    assert list(manager.keys) == [KID]
+
+def test_background_refresher_reloads_keys(jwks_path):
+    manager = counting_manager(jwks_path, refresh_interval=0.02)
+
+    async def run():
+        await manager.start()
+        rotate(jwks_path, "rotated")
+        await asyncio.sleep(0.1)
+        await manager.stop()
+
+    asyncio.run(run())
+    assert list(manager.keys) == ["rotated"]
+    assert manager.fetches >= 2
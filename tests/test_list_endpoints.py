@@ -0,0 +1,46 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import accounts
+from app.core.deps import get_current_active_user, get_tenant_id
+from app.models import AccountModel
+
+TENANT = "t-list"
+
+@pytest.fixture
+def client(dynamodb):
+    for i in range(12):
+        AccountModel(f"acc-{i:02d}", TENANT, name=f"a{i}", manager_id="m", active_tenant_id=TENANT).save()
+    AccountModel("acc-inactive", TENANT, name="old", manager_id="m", is_active=0).save()
+    app = FastAPI()
+    app.include_router(accounts.router, prefix="/accounts")
+    app.dependency_overrides[get_current_active_user] = lambda: {"sub": "user-1"}
+    app.dependency_overrides[get_tenant_id] = lambda: TENANT
+    return TestClient(app)
+
+def test_list_returns_every_active_account(client):
+    response = client.get("/accounts/")
+    assert response.status_code == 200
+    body = response.json()
+    assert isinstance(body, list)
+    assert sorted(account["account_id"] for account in body) == [f"acc-{i:02d}" for i in range(12)]
+
+def test_list_with_selected_fields(client):
+    body = client.get("/accounts/?fields=name").json()
+    assert len(body) == 12
+    assert body[0] == {"name": "a0"}
+
+def test_cursor_pages_are_opt_in(client):
+    names, cursor = [], None
+    while True:
+        params = {"size": 5, "include_total": True}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/accounts/page", params=params).json()
+        assert page["total"] == 12
+        names.extend(account["name"] for account in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert sorted(names) == sorted(f"a{i}" for i in range(12))
@@ -0,0 +1,89 @@
+import asyncio
+import base64
+
+import pytest
+
+from app.core.config import settings
+from app.core.exceptions import BadRequestException
+from app.models import OpportunityModel
+from app.services.opportunity_service import OpportunityService
+from app.utils.pagination import check_cursor_secret, decode_cursor, encode_cursor
+
+KEY = {"opportunity_id": {"S": "opp-1"}, "tenant_id": {"S": "tenant-1"}}
+
+def rejected(cursor: str, scope: str = "accounts:tenant-1") -> None:
+    with pytest.raises(BadRequestException) as error:
+        decode_cursor(cursor, scope)
+    assert error.value.status_code == 400
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(KEY, "accounts:tenant-1"), "accounts:tenant-1") == KEY
+
+def test_rejects_tampered_cursor():
+    raw = base64.urlsafe_b64decode(encode_cursor(KEY, "accounts:tenant-1") + "==")
+    forged = raw.replace(b"opp-1", b"opp-9")
+    rejected(base64.urlsafe_b64encode(forged).decode().rstrip("="))
+
+def test_rejects_cursor_from_another_scope():
+    rejected(encode_cursor(KEY, "accounts:tenant-2"))
+    rejected(encode_cursor(KEY, "active-opportunities:tenant-1:acc-1"), "active-opportunities:tenant-1:acc-2")
+
+def test_rejects_malformed_cursor():
+    for cursor in ("not-a-cursor", "!!!", base64.urlsafe_b64encode(b"x" * 16 + b"{").decode()):
+        rejected(cursor)
+
+def test_rejects_cursor_signed_with_another_secret(monkeypatch):
+    cursor = encode_cursor(KEY, "accounts:tenant-1")
+    monkeypatch.setattr(settings, "PAGINATION_CURSOR_SECRET", "rotated")
+    rejected(cursor)
+
+def test_missing_cursor_secret_fails_multi_process_startup(monkeypatch):
+    monkeypatch.setattr(settings, "PAGINATION_CURSOR_SECRET", None)
+    monkeypatch.setattr(settings, "JWT_SECRET_KEY", None)
+    with pytest.raises(RuntimeError):
+        check_cursor_secret(multi_process=True)
+    check_cursor_secret(multi_process=False)
+
+@pytest.fixture
+def opportunities(dynamodb):
+    # 30건 중 acc-x의 영업 기회는 3건 (opp-004, opp-015, opp-027)
+    for i in range(30):
+        OpportunityModel(
+            f"opp-{i:03d}", "t-page", account_id="acc-x" if i in (4, 15, 27) else "acc-y", name=f"o{i}",
+            stage="Prospecting", expected_revenue=1, manager_id="m", active_tenant_id="t-page"
+        ).save()
+
+def list_all(size: int, **kwargs):
+    pages, cursor = [], None
+    while True:
+        page = asyncio.run(OpportunityService.list_opportunities_page("t-page", size=size, cursor=cursor, **kwargs))
+        pages.append([item.get("opportunity_id") or item["name"] for item in page.items])
+        cursor = page.next_cursor
+        if cursor is None:
+            return pages
+
+def test_account_filter_fills_page_across_reads(opportunities, monkeypatch):
+    monkeypatch.setattr(settings, "PAGINATION_FILTER_READ_SIZE", 5)
+    pages = list_all(2, account_id="acc-x")
+    assert pages[0] == ["opp-004", "opp-015"]
+    assert sum(pages, []) == ["opp-004", "opp-015", "opp-027"]
+
+def test_account_filter_stops_at_evaluation_budget(opportunities, monkeypatch):
+    monkeypatch.setattr(settings, "PAGINATION_FILTER_READ_SIZE", 5)
+    monkeypatch.setattr(settings, "PAGINATION_FILTER_MAX_EVALUATED", 10)
+    pages = list_all(2, account_id="acc-x")
+    # 예산 안에서 채우지 못한 페이지는 짧거나 비어 있지만 next_cursor를 따라가면 누락/중복이 없다
+    assert any(len(page) < 2 for page in pages[:-1])
+    assert sum(pages, []) == ["opp-004", "opp-015", "opp-027"]
+
+def test_account_filter_with_selected_fields(opportunities, monkeypatch):
+    monkeypatch.setattr(settings, "PAGINATION_FILTER_READ_SIZE", 20)
+    page = asyncio.run(OpportunityService.list_opportunities_page("t-page", "acc-x", size=1, fields=["name"]))
+    assert page.items == [{"name": "o4"}]
+    next_page = asyncio.run(OpportunityService.list_opportunities_page("t-page", "acc-x", size=5, cursor=page.next_cursor, fields=["name"]))
+    assert next_page.items == [{"name": "o15"}, {"name": "o27"}]
+
+def test_total_counts_only_the_account(opportunities):
+    page = asyncio.run(OpportunityService.list_opportunities_page("t-page", "acc-x", size=1, include_total=True))
+    assert page.total == 3
+    assert asyncio.run(OpportunityService.list_opportunities_page("t-page", size=1, include_total=True)).total == 30
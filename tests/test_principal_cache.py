@@ -0,0 +1,101 @@
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import PrincipalCache, principal_cache
+from app.core.deps import get_current_user
+from app.models import UserModel
+from app.schemas.user import UserInDB, UserUpdate
+from app.services.user_service import UserService
+
+def make_user(user_id: str = "user-1", tenant_name: str = "tenant-1") -> UserInDB:
+    return UserInDB(
+        email="user@example.com", role="user", user_id=user_id, tenant_name=tenant_name,
+        created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 2), is_active=True, managed_account_ids=[]
+    )
+
+def claims_for(user_id: str = "user-1", tenant_id: str = "tenant-1", ttl: float = 60) -> dict:
+    return {"sub": user_id, "custom:tenant_id": tenant_id, "exp": time.time() + ttl}
+
+def test_get_returns_what_was_set_for_the_same_token():
+    cache = PrincipalCache()
+    claims, user = claims_for(), make_user()
+    cache.set("token-a", claims, user, cache.generation)
+    assert cache.get("token-a") == (claims, user)
+    assert cache.get("token-b") is None
+
+def test_invalidate_user_drops_only_that_users_entries():
+    cache = PrincipalCache()
+    cache.set("a-1", claims_for("user-a", "tenant-1"), make_user("user-a"), cache.generation)
+    cache.set("a-2", claims_for("user-a", "tenant-2"), make_user("user-a", "tenant-2"), cache.generation)
+    cache.set("b-1", claims_for("user-b", "tenant-1"), make_user("user-b"), cache.generation)
+
+    cache.invalidate_user("user-a", "tenant-1")
+    assert cache.get("a-1") is None
+    assert cache.get("a-2") is not None
+    assert cache.get("b-1") is not None
+
+    cache.invalidate_user("user-a")
+    assert cache.get("a-2") is None
+
+def test_lookup_racing_with_invalidation_is_not_cached():
+    cache = PrincipalCache()
+    generation = cache.generation
+    # 조회가 진행되는 동안 사용자 정보가 변경됨
+    cache.invalidate_user("user-1")
+    cache.set("token", claims_for(), make_user(), generation)
+    assert cache.get("token") is None
+
+def test_entries_expire_with_the_token_or_max_ttl(monkeypatch):
+    cache = PrincipalCache(max_ttl=30)
+    now = time.time()
+    monkeypatch.setattr(cache_module.time, "time", lambda: now)
+    cache.set("short", claims_for(ttl=10), make_user(), cache.generation)
+    cache.set("long", claims_for(ttl=3600), make_user(), cache.generation)
+
+    monkeypatch.setattr(cache_module.time, "time", lambda: now + 11)
+    assert cache.get("short") is None
+    assert cache.get("long") is not None
+
+    monkeypatch.setattr(cache_module.time, "time", lambda: now + 31)
+    assert cache.get("long") is None
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PrincipalCache(maxsize=2)
+    for token in ("a", "b"):
+        cache.set(token, claims_for(), make_user(), cache.generation)
+    cache.get("a")
+    cache.set("c", claims_for(), make_user(), cache.generation)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+@pytest.fixture
+def stored_user(dynamodb):
+    principal_cache.clear()
+    UserModel("user-1", "tenant-1", email="u@example.com", given_name="a", family_name="b", role="user", version=1).save()
+    yield
+    principal_cache.clear()
+
+def test_get_current_user_reads_user_once_per_token(stored_user, make_token, monkeypatch):
+    reads = []
+    get_user = UserService.get_user
+
+    async def counting_get_user(user_id, tenant_id):
+        reads.append(user_id)
+        return await get_user(user_id, tenant_id)
+
+    monkeypatch.setattr(UserService, "get_user", staticmethod(counting_get_user))
+    token = make_token()
+
+    first = asyncio.run(get_current_user(token))
+    first.role = "changed by caller"
+    second = asyncio.run(get_current_user(token))
+    assert second.role == "user"
+    assert reads == ["user-1"]
+
+    asyncio.run(UserService.update_user("user-1", "tenant-1", UserUpdate(givenname="c", familyname="d", role="admin")))
+    assert asyncio.run(get_current_user(token)).version == 2
+    assert reads == ["user-1", "user-1"]
@@ -0,0 +1,80 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from app.models import AccountModel, OpportunityModel, UserModel
+from app.schemas.account import AccountInDB
+from app.schemas.opportunity import OpportunityInDB
+from app.schemas.user import UserInDB
+from app.services.raw_records import AccountRecord, OpportunityRecord, UserRecord, decode_value
+from app.utils.async_dynamodb import db_query_raw
+
+TENANT = "t-raw"
+AT = datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc)
+
+def raw_items(model_cls, hash_key=TENANT):
+    return asyncio.run(db_query_raw(model_cls, hash_key, index_name=model_cls.active_index.Meta.index_name))
+
+def from_model(schema, item, **overrides):
+    """
+    모델을 거치는 기존 경로로 만든 응답 dict (레코드 디코딩 결과와 비교용)
+    """
+    values = {name: getattr(item, name, None) for name in schema.__fields__}
+    values.update(overrides)
+    return schema(**{name: value for name, value in values.items() if value is not None}).dict()
+
+@pytest.fixture
+def stored(dynamodb):
+    account = AccountModel("acc-1", TENANT, name="acme", manager_id="m", version=2)
+    opportunity = OpportunityModel(
+        "opp-1", TENANT, account_id="acc-1", name="deal", stage="Committed", expected_revenue=1250, manager_id="m", version=1
+    )
+    user = UserModel("user-1", TENANT, email="u@example.com", given_name="a", family_name="b", role="admin", managed_account_ids=["acc-1"])
+    for item in (account, opportunity, user):
+        item.save()
+    # save()가 updated_at을 현재 시각으로 바꾸므로 저장 후 시각을 고정
+    for item in (account, opportunity, user):
+        item.update(actions=[type(item).created_at.set(AT), type(item).updated_at.set(AT)])
+    return account, opportunity, user
+
+def test_records_decode_like_the_model_path(stored):
+    account, opportunity, user = stored
+    for model_cls, record_cls, schema, item in (
+        (AccountModel, AccountRecord, AccountInDB, account),
+        (OpportunityModel, OpportunityRecord, OpportunityInDB, opportunity),
+        (UserModel, UserRecord, UserInDB, user),
+    ):
+        [raw] = raw_items(model_cls)
+        assert record_cls.to_dict(raw) == from_model(schema, item, version=item.version or 0), record_cls
+        assert list(record_cls.to_dict(raw)) == list(schema.__fields__)
+
+def test_from_items_gives_typed_attributes(stored):
+    [account] = AccountRecord.from_items(raw_items(AccountModel))
+    assert (account.account_id, account.is_active, account.version, account.updated_at) == ("acc-1", True, 2, AT)
+    [opportunity] = OpportunityRecord.from_items(raw_items(OpportunityModel))
+    assert opportunity.expected_revenue == 1250.0 and isinstance(opportunity.expected_revenue, float)
+    assert opportunity.dict()["stage"] == "Committed"
+    [user] = UserRecord.from_items(raw_items(UserModel))
+    assert user.managed_account_ids == ["acc-1"]
+    assert repr(user).startswith("UserRecord(user_id='user-1'")
+
+def test_missing_attributes_use_schema_defaults():
+    raw = {
+        "user_id": {"S": "user-1"}, "tenant_name": {"S": TENANT}, "email": {"S": "u@example.com"},
+        "given_name": {"S": "a"}, "family_name": {"S": "b"}, "role": {"S": "user"},
+        "created_at": {"S": "2024-01-02T03:04:05.123456+0000"}, "updated_at": {"S": "2024-01-02T03:04:05.123456+0000"},
+        "is_active": {"BOOL": True}
+    }
+    # version/managed_account_ids가 없는 이전 항목, 저장하지 않는 password
+    record = UserRecord.to_dict(raw)
+    assert (record["version"], record["managed_account_ids"], record["password"]) == (0, [], None)
+    assert record["created_at"] == AT
+
+def test_to_dict_with_selected_fields():
+    raw = {"account_id": {"S": "acc-1"}, "is_active": {"N": "0"}}
+    assert AccountRecord.to_dict(raw, ["is_active", "account_id"]) == {"is_active": False, "account_id": "acc-1"}
+
+def test_decode_value_handles_nested_values():
+    value = {"M": {"n": {"N": "1.5"}, "l": {"L": [{"S": "a"}, {"N": "2"}, {"BOOL": False}, {"NULL": True}]}}}
+    assert decode_value(value) == {"n": 1.5, "l": ["a", 2, False, None]}
@@ -0,0 +1,57 @@
+from datetime import datetime
+from typing import List
+
+from fastapi import APIRouter, FastAPI, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.responses import FastResponseRoute, response_validation_enabled
+
+class Item(BaseModel):
+    name: str
+    created_at: datetime
+
+ITEM = {"name": "a", "created_at": datetime(2024, 1, 2, 3, 4, 5)}
+
+def make_client() -> TestClient:
+    router = APIRouter(route_class=FastResponseRoute)
+
+    @router.get("/items", response_model=List[Item])
+    async def list_items(response: Response):
+        response.headers["X-Total"] = "1"
+        return [ITEM]
+
+    @router.post("/items", response_model=Item, status_code=201)
+    def create_item():
+        return dict(ITEM, internal="kept")
+
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+def test_validation_is_off_unless_configured(monkeypatch):
+    monkeypatch.setattr(settings, "RESPONSE_VALIDATION", False)
+    assert not response_validation_enabled()
+    monkeypatch.setattr(settings, "RESPONSE_VALIDATION", True)
+    assert response_validation_enabled()
+
+def test_trusted_route_serializes_result_without_validation(monkeypatch):
+    monkeypatch.setattr(settings, "RESPONSE_VALIDATION", False)
+    client = make_client()
+
+    listed = client.get("/items")
+    assert listed.status_code == 200
+    assert listed.json() == [{"name": "a", "created_at": "2024-01-02T03:04:05"}]
+    assert listed.headers["x-total"] == "1"
+
+    # response_model로 거르지 않으므로 서비스 결과가 그대로 직렬화된다 (동기 엔드포인트, 라우트 상태 코드 포함)
+    created = client.post("/items")
+    assert created.status_code == 201
+    assert created.json()["internal"] == "kept"
+
+def test_validated_route_filters_to_response_model(monkeypatch):
+    monkeypatch.setattr(settings, "RESPONSE_VALIDATION", True)
+    created = make_client().post("/items")
+    assert created.status_code == 201
+    assert created.json() == {"name": "a", "created_at": "2024-01-02T03:04:05"}
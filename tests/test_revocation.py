@@ -0,0 +1,158 @@
+import asyncio
+import json
+import math
+import time
+
+import pytest
+
+from app.core import revocation
+from app.core.revocation import BloomFilter, RevocationStore, revocation_store
+from app.services.auth_service import AuthService
+
+def claims(sub="user-1", jti="jti-1", iat=None, exp=None):
+    now = int(time.time())
+    return {
+        "sub": sub,
+        "jti": jti,
+        "iat": now - 60 if iat is None else iat,
+        "exp": now + 3600 if exp is None else exp,
+    }
+
+def test_revoke_by_jti():
+    store = RevocationStore()
+    token = claims(jti="a")
+    store.revoke(token)
+    assert store.is_revoked(token)
+    assert not store.is_revoked(claims(jti="b"))
+
+def test_revoke_without_jti_uses_sub_and_iat():
+    store = RevocationStore()
+    token = claims(jti=None)
+    store.revoke(token)
+    assert store.is_revoked(dict(token))
+    assert not store.is_revoked(claims(jti=None, iat=token["iat"] - 1))
+
+def test_expired_token_revocation_is_ignored():
+    store = RevocationStore()
+    token = claims(exp=time.time() - 1)
+    store.revoke(token)
+    assert not store.is_revoked(token)
+
+def test_revoke_subject_revokes_earlier_tokens():
+    store = RevocationStore()
+    old = claims(jti="old", iat=int(time.time()) - 10)
+    store.revoke_subject("user-1", 3600)
+    assert store.is_revoked(old)
+    assert not store.is_revoked(claims(sub="user-2", iat=old["iat"]))
+
+def test_revoke_subject_keeps_token_issued_in_same_second():
+    # 로그아웃 직후 같은 초에 다시 로그인하여 받은 토큰(iat는 초 단위 정수)은 유효해야 한다
+    store = RevocationStore()
+    store.revoke_subject("user-1", 3600)
+    assert not store.is_revoked(claims(jti="relogin", iat=int(time.time())))
+    assert not store.is_revoked(claims(jti="later", iat=int(time.time()) + 5))
+
+def test_revoke_subject_with_issued_before():
+    store = RevocationStore()
+    logged_out = claims(jti="session", iat=int(time.time()) - 100)
+    store.revoke_subject("user-1", 3600, issued_before=logged_out["iat"] + 1)
+    assert store.is_revoked(logged_out)
+    assert store.is_revoked(claims(jti="id-token", iat=logged_out["iat"]))
+    assert not store.is_revoked(claims(jti="relogin", iat=logged_out["iat"] + 1))
+
+def test_revoke_subject_keeps_latest_cutoff():
+    store = RevocationStore()
+    now = math.floor(time.time())
+    store.revoke_subject("user-1", 3600, issued_before=now - 10)
+    store.revoke_subject("user-1", 3600, issued_before=now - 50)
+    assert store.is_revoked(claims(iat=now - 20))
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000)
+    keys = [f"jti:{i}" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(bloom.might_contain(key) for key in keys)
+    false_positives = sum(bloom.might_contain(f"other:{i}") for i in range(10000))
+    assert false_positives < 100
+
+def test_bloom_filter_rebuilds_when_capacity_exceeded():
+    store = RevocationStore(capacity=2)
+    tokens = [claims(jti=f"t{i}") for i in range(10)]
+    for token in tokens:
+        store.revoke(token)
+    assert store._bloom.capacity >= 10
+    assert all(store.is_revoked(token) for token in tokens)
+
+def test_purge_drops_expired_entries():
+    store = RevocationStore()
+    live, expired = claims(jti="live"), claims(jti="expired", exp=time.time() + 0.05)
+    store.revoke(live)
+    store.revoke(expired)
+    time.sleep(0.1)
+    store.purge()
+    assert store.is_revoked(live)
+    assert list(store._tokens) == [RevocationStore.token_key(live)]
+    assert not store._bloom.might_contain(RevocationStore.token_key(expired))
+
+def test_shared_file_sync_between_stores(tmp_path):
+    path = str(tmp_path / "revoked.log")
+    writer = RevocationStore(file_path=path, sync_interval=0)
+    reader = RevocationStore(file_path=path, sync_interval=0)
+    token = claims(jti="shared")
+    writer.revoke(token)
+    writer.revoke_subject("user-2", 3600)
+    assert reader.is_revoked(token)
+    assert reader.is_revoked(claims(sub="user-2", jti="other"))
+
+def test_shared_file_ignores_partial_line(tmp_path):
+    path = str(tmp_path / "revoked.log")
+    reader = RevocationStore(file_path=path, sync_interval=0)
+    entry = json.dumps({"k": "jti:late", "e": time.time() + 3600, "c": None})
+    with open(path, "w") as f:
+        f.write(entry[:10])
+    assert not reader.is_revoked(claims(jti="late"))
+    with open(path, "a") as f:
+        f.write(entry[10:] + "\n")
+    assert reader.is_revoked(claims(jti="late"))
+
+def test_compact_rewrites_file_and_readers_resync(tmp_path):
+    path = str(tmp_path / "revoked.log")
+    writer = RevocationStore(file_path=path, sync_interval=0)
+    reader = RevocationStore(file_path=path, sync_interval=0)
+    live = claims(jti="live")
+    writer.revoke(live)
+    writer.revoke(claims(jti="expired", exp=time.time() + 0.05))
+    writer.revoke_subject("user-2", 3600)
+    assert reader.is_revoked(live)
+    time.sleep(0.1)
+
+    writer.compact()
+    with open(path) as f:
+        keys = [json.loads(line)["k"] for line in f]
+    assert sorted(keys) == ["jti:live", "sub:user-2"]
+
+    # 압축 후 추가된 항목도 다른 프로세스가 읽는다 (교체된 파일을 처음부터 다시 읽음)
+    later = claims(jti="later")
+    writer.revoke(later)
+    assert reader.is_revoked(later)
+    assert reader.is_revoked(live)
+
+def test_logout_revokes_other_sessions_issued_before_logout(make_token, monkeypatch):
+    service = AuthService()
+    monkeypatch.setattr(service, "cognito_client", type("Cognito", (), {"global_sign_out": lambda self, **kwargs: None})())
+    now = int(time.time())
+    # 로그아웃하는 토큰보다 나중에(로그아웃 전에) 다른 디바이스에서 발급된 토큰
+    logged_out = make_token(sub="user-logout", iat=now - 30)
+    asyncio.run(service.logout_user(logged_out))
+
+    assert revocation_store.is_revoked(claims(sub="user-logout", jti="other-device", iat=now - 5))
+    assert not revocation_store.is_revoked(claims(sub="user-logout", jti="after-logout", iat=now + 1))
+
+def test_multiple_workers_require_shared_revocation_file(monkeypatch):
+    monkeypatch.setattr(revocation.revocation_store, "file_path", None)
+    with pytest.raises(RuntimeError):
+        revocation.check_revocation_store(multi_process=True)
+    revocation.check_revocation_store(multi_process=False)
+    monkeypatch.setattr(revocation.revocation_store, "file_path", "/dev/shm/revoked")
+    revocation.check_revocation_store(multi_process=True)
@@ -0,0 +1,76 @@
+import os
+import pickle
+import time
+from datetime import datetime
+
+import pytest
+
+from app.core.cache import PrincipalCache, TieredCache
+from app.core.shared_cache import SharedCache
+from app.schemas.user import UserInDB
+
+class Exploit:
+    def __reduce__(self):
+        return (os.system, ("touch /tmp/shared-cache-pwned",))
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "cache.db")
+
+def test_values_round_trip_as_json(cache_path):
+    cache = SharedCache(cache_path)
+    cache.set("jwks", (1.5, {"keys": [{"kid": "a"}]}), ttl=60)
+    assert cache.get("jwks") == [1.5, {"keys": [{"kid": "a"}]}]
+    assert os.stat(cache_path).st_mode & 0o777 == 0o600
+
+def test_rejects_values_that_are_not_json(cache_path):
+    with pytest.raises(TypeError):
+        SharedCache(cache_path).set("key", object(), ttl=60)
+
+def test_pickled_entries_are_not_loaded(cache_path):
+    cache = SharedCache(cache_path)
+    cache._connect().execute(
+        "INSERT INTO entries (key, value, expires_at) VALUES (?, ?, ?)",
+        ("evil", pickle.dumps(Exploit()), time.time() + 60)
+    )
+    assert cache.get("evil", "default") == "default"
+    assert not os.path.exists("/tmp/shared-cache-pwned")
+
+def test_rejects_file_accessible_to_others(cache_path):
+    os.close(os.open(cache_path, os.O_WRONLY | os.O_CREAT, 0o600))
+    os.chmod(cache_path, 0o644)
+    with pytest.raises(PermissionError):
+        SharedCache(cache_path)
+
+@pytest.mark.skipif(os.geteuid() != 0, reason="chown requires root")
+def test_rejects_file_owned_by_another_user(cache_path):
+    os.close(os.open(cache_path, os.O_WRONLY | os.O_CREAT, 0o600))
+    os.chown(cache_path, 12345, -1)
+    with pytest.raises(PermissionError):
+        SharedCache(cache_path)
+
+def test_rejects_symlink(cache_path, tmp_path):
+    target = tmp_path / "target.db"
+    target.touch(mode=0o600)
+    os.symlink(target, cache_path)
+    with pytest.raises(OSError):
+        SharedCache(cache_path)
+
+def test_tiered_cache_reads_shared_entries(cache_path):
+    shared = SharedCache(cache_path)
+    TieredCache("analytics", shared=shared).set(("tenant-1", "summary"), {"total_accounts": 3})
+    assert TieredCache("analytics", shared=shared).get(("tenant-1", "summary")) == {"total_accounts": 3}
+
+def test_principal_cache_restores_user_from_shared_entry(cache_path):
+    shared = SharedCache(cache_path)
+    user = UserInDB(
+        email="user@example.com", role="admin", user_id="user-1",
+        tenant_name="Tenant", created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 2),
+        is_active=True, managed_account_ids=["acc-1"]
+    )
+    claims = {"sub": "user-1", "custom:tenant_id": "tenant-1", "exp": time.time() + 60}
+    PrincipalCache(shared=shared, user_model=UserInDB).set("token", claims, user, generation=0)
+
+    cached_claims, cached_user = PrincipalCache(shared=shared, user_model=UserInDB).get("token")
+    assert cached_claims == claims
+    assert cached_user == user
@@ -0,0 +1,71 @@
+import asyncio
+
+from app.core.singleflight import SingleFlight
+from app.models import UserModel
+from app.schemas.user import UserUpdate
+from app.services.user_service import UserService
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test")
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    async def main():
+        return await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+
+    assert asyncio.run(main()) == [1] * 5
+    assert flight.stats()["executions"] == 1
+
+def test_forget_starts_new_execution_for_later_calls():
+    flight = SingleFlight("test")
+    values = iter(["before write", "after write"])
+    release = None
+
+    async def fetch():
+        value = next(values)
+        await release.wait()
+        return value
+
+    async def main():
+        nonlocal release
+        release = asyncio.Event()
+        early = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        flight.forget("key")
+        late = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        release.set()
+        return await early, await late
+
+    assert asyncio.run(main()) == ("before write", "after write")
+
+def test_get_user_after_update_does_not_join_stale_fetch(dynamodb, monkeypatch):
+    UserModel("user-1", "t-flight", email="u@example.com", given_name="old", family_name="b", role="user").save()
+    read_done = None
+    release = None
+
+    async def fetch_user(user_id, tenant_id):
+        # 쓰기 전에 읽은 값을 쓰기가 끝날 때까지 돌려주지 않는 느린 조회
+        user = UserModel.get(user_id, tenant_id)
+        read_done.set()
+        await release.wait()
+        return UserUpdate(givenname=user.given_name, familyname=user.family_name)
+
+    monkeypatch.setattr(UserService, "_fetch_user", staticmethod(fetch_user))
+
+    async def main():
+        nonlocal read_done, release
+        read_done, release = asyncio.Event(), asyncio.Event()
+        stale = asyncio.ensure_future(UserService.get_user("user-1", "t-flight"))
+        await read_done.wait()
+        await UserService.update_user("user-1", "t-flight", UserUpdate(givenname="new", familyname="b"))
+        fresh = asyncio.ensure_future(UserService.get_user("user-1", "t-flight"))
+        await asyncio.sleep(0)
+        release.set()
+        return (await stale).givenname, (await fresh).givenname
+
+    assert asyncio.run(main()) == ("old", "new")
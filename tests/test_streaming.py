@@ -0,0 +1,53 @@
+import asyncio
+import gzip
+import json
+from datetime import datetime
+
+from app.utils.streaming import ExportFormat, StreamFormat, encode_export, encode_stream
+
+PAGES = [[{"id": 1, "ok": True}, {"id": 2, "ok": None}], [], [{"id": 3, "ok": False}]]
+
+async def pages():
+    for page in PAGES:
+        yield page
+
+def collect(chunks) -> bytes:
+    async def run():
+        return b"".join([chunk async for chunk in chunks])
+    return asyncio.run(run())
+
+def test_encode_stream_json_array():
+    assert json.loads(collect(encode_stream(pages(), StreamFormat.JSON))) == sum(PAGES, [])
+
+def test_encode_stream_empty_json_array():
+    async def empty():
+        return
+        yield
+    assert collect(encode_stream(empty(), StreamFormat.JSON)) == b"[]"
+
+def test_encode_stream_ndjson():
+    lines = collect(encode_stream(pages(), StreamFormat.NDJSON)).splitlines()
+    assert [json.loads(line) for line in lines] == sum(PAGES, [])
+
+def test_encode_export_csv():
+    body = collect(encode_export(pages(), ExportFormat.CSV, ["id", "ok", "missing"]))
+    assert body.decode() == "id,ok,missing\r\n1,true,\r\n2,,\r\n3,false,\r\n"
+
+def test_encode_export_csv_formats_datetimes_and_lists():
+    async def rows():
+        yield [{"at": datetime(2024, 1, 2, 3, 4, 5), "ids": ["a", "b"]}]
+    body = collect(encode_export(rows(), ExportFormat.CSV, ["at", "ids"]))
+    assert body.decode() == 'at,ids\r\n2024-01-02T03:04:05,"[""a"",""b""]"\r\n'
+
+def test_encode_export_gzip_is_one_stream():
+    body = collect(encode_export(pages(), ExportFormat.NDJSON, [], compress=True))
+    lines = gzip.decompress(body).splitlines()
+    assert [json.loads(line) for line in lines] == sum(PAGES, [])
+
+def test_encode_export_csv_escapes_formula_cells():
+    async def rows():
+        yield [{"name": value, "revenue": -5} for value in ("=HYPERLINK(\"x\")", "+1", "-2", "@SUM(A1)", "\tx", "\rx", "safe = 1")]
+    lines = collect(encode_export(rows(), ExportFormat.CSV, ["name", "revenue"])).decode().split("\r\n")
+    assert lines[1:-1] == [
+        "\"'=HYPERLINK(\"\"x\"\")\",-5", "'+1,-5", "'-2,-5", "'@SUM(A1),-5", "'\tx,-5", "\"'\rx\",-5", "safe = 1,-5"
+    ]
@@ -0,0 +1,94 @@
+import asyncio
+import base64
+import json
+import time
+
+import pytest
+
+from app.core.jwks import JWKSManager
+from app.core.token_verifier import CognitoTokenVerifier
+from conftest import CLIENT_ID, ISSUER, JWKS_FILE
+
+def b64(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+@pytest.fixture
+def verifier():
+    # 실제 설정과 같은 경로: 로컬 JWKS 파일 -> JWKSManager.get_key -> CognitoTokenVerifier
+    manager = JWKSManager(file_path=JWKS_FILE, min_refresh_interval=0)
+    return CognitoTokenVerifier(manager.get_key, issuer=ISSUER, client_id=CLIENT_ID)
+
+def verify(verifier, token):
+    return asyncio.run(verifier.verify(token))
+
+def rejected(verifier, token) -> str:
+    with pytest.raises(ValueError) as error:
+        verify(verifier, token)
+    return str(error.value)
+
+def test_valid_access_token(verifier, make_token):
+    claims = verify(verifier, make_token(sub="user-9"))
+    assert claims["sub"] == "user-9"
+    assert claims["token_use"] == "access"
+
+def test_valid_id_token_checks_aud(verifier, make_token):
+    token = make_token(token_use="id", aud=CLIENT_ID, client_id=None)
+    assert verify(verifier, token)["token_use"] == "id"
+    assert rejected(verifier, make_token(token_use="id", aud="other-client", client_id=None)) == "Invalid token audience"
+
+def test_cached_result_is_a_copy(verifier, make_token):
+    token = make_token()
+    first = verify(verifier, token)
+    first["sub"] = "changed"
+    assert verify(verifier, token)["sub"] == "user-1"
+
+def test_rejects_hmac_algorithm(verifier, make_token):
+    token = make_token(algorithm="HS256", key="secret")
+    assert rejected(verifier, token) == "Unsupported token algorithm"
+
+def test_rejects_none_algorithm(verifier, make_token):
+    _, payload, _ = make_token().split(".")
+    token = f"{b64({'alg': 'none', 'kid': 'test-key'})}.{payload}."
+    assert rejected(verifier, token) == "Unsupported token algorithm"
+
+def test_rejects_missing_kid(verifier, make_token):
+    assert rejected(verifier, make_token(kid=None)) == "Token has no key id"
+
+def test_rejects_unknown_kid(verifier, make_token):
+    assert rejected(verifier, make_token(kid="rotated-away")) == "Public key not found in JWKS"
+
+def test_rejects_tampered_payload(verifier, make_token):
+    header, _, signature = make_token().split(".")
+    _, forged, _ = make_token(sub="admin").split(".")
+    assert rejected(verifier, f"{header}.{forged}.{signature}") == "Signature verification failed"
+
+def test_rejects_malformed_token(verifier):
+    assert rejected(verifier, "not-a-jwt") == "Malformed token"
+
+def test_rejects_expired_token(verifier, make_token):
+    assert rejected(verifier, make_token(exp=int(time.time()) - 1)) == "Token is expired"
+
+def test_rejects_missing_exp(verifier, make_token):
+    assert rejected(verifier, make_token(exp=None)) == "Token has no expiration"
+
+def test_cached_token_expires(verifier, make_token):
+    token = make_token(exp=time.time() + 0.5)
+    verify(verifier, token)
+    time.sleep(0.6)
+    assert rejected(verifier, token) == "Token is expired"
+
+def test_rejects_wrong_issuer(verifier, make_token):
+    assert rejected(verifier, make_token(iss="https://cognito-idp.us-east-1.amazonaws.com/other")) == "Invalid token issuer"
+
+def test_rejects_wrong_token_use(verifier, make_token):
+    assert rejected(verifier, make_token(token_use="refresh")) == "Invalid token use"
+
+def test_rejects_wrong_client_id(verifier, make_token):
+    assert rejected(verifier, make_token(client_id="other-client")) == "Invalid token audience"
+
+def test_application_verifier_uses_settings(make_token):
+    from app.core.security import verify_cognito_token
+
+    assert asyncio.run(verify_cognito_token(make_token()))["iss"] == ISSUER
+    with pytest.raises(ValueError):
+        asyncio.run(verify_cognito_token(make_token(client_id="other-client")))
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+from pynamodb.exceptions import CancellationReason, TransactWriteError, VerboseClientError
+
+from app.core.config import settings
+from app.core.exceptions import ConflictException, ServiceUnavailableException
+from app.models import AccountModel, OpportunityModel, TenantStatsModel
+from app.schemas.account import AccountCreate, AccountUpdate
+from app.schemas.opportunity import OpportunityCreate, OpportunityUpdate
+from app.services.account_service import AccountService
+from app.services.opportunity_service import OpportunityService
+from app.utils import item_updates
+
+TENANT = "t-tx"
+
+def cancelled(*codes):
+    reasons = [CancellationReason(code=code, message=None) if code else None for code in codes]
+    error = VerboseClientError(
+        {"Error": {"Code": "TransactionCanceledException", "Message": "Transaction cancelled"}},
+        "TransactWriteItems",
+        cancellation_reasons=reasons
+    )
+    return TransactWriteError("Failed to write transaction items", cause=error)
+
+@pytest.fixture
+def conflicts(dynamodb, monkeypatch):
+    """
+    트랜잭션마다 처음 N번은 다른 트랜잭션과 집계 항목에서 충돌한 것처럼 취소
+    """
+    monkeypatch.setattr(settings, "TRANSACTION_RETRY_BASE_DELAY_SECONDS", 0.001)
+    transact_write = item_updates.db_transact_write
+    state = {"failures": 1, "calls": 0}
+    pending = {}
+
+    async def conflicting_transact_write(model_cls, build):
+        state["calls"] += 1
+        key = id(build.__code__), asyncio.current_task()
+        pending[key] = pending.get(key, 0) + 1
+        if pending[key] <= state["failures"]:
+            raise cancelled(None, "TransactionConflict")
+        return await transact_write(model_cls, build)
+
+    monkeypatch.setattr(item_updates, "db_transact_write", conflicting_transact_write)
+    return state
+
+def run(coro):
+    return asyncio.run(coro)
+
+def create_opportunity(account_id: str, revenue: float = 10):
+    return OpportunityService.create_opportunity(OpportunityCreate(
+        tenant_id=TENANT, account_id=account_id, name="deal", stage="Prospecting",
+        expected_revenue=revenue, manager_id="m"
+    ))
+
+def test_concurrent_writes_to_unrelated_records_are_retried(conflicts):
+    account = run(AccountService.create_account(AccountCreate(tenant_id=TENANT, name="acme", manager_id="m")))
+
+    async def main():
+        return await asyncio.gather(*(create_opportunity(account.account_id, revenue=i) for i in range(1, 6)))
+
+    assert len(run(main())) == 5
+    stats = TenantStatsModel.get(TENANT)
+    assert stats.opportunity_count == 5
+    assert stats.total_expected_revenue == 15
+    assert conflicts["calls"] == 12
+
+def test_update_is_retried_after_transaction_conflict(conflicts):
+    account = run(AccountService.create_account(AccountCreate(tenant_id=TENANT, name="acme", manager_id="m")))
+    conflicts["failures"] = 2
+    updated = run(AccountService.update_account(account.account_id, TENANT, AccountUpdate(is_active=False, version=account.version)))
+    assert updated.version == account.version + 1
+    assert not AccountModel.get(account.account_id, TENANT).is_active
+    assert TenantStatsModel.get(TENANT).account_count == 0
+
+def test_persistent_conflicts_return_503(conflicts, monkeypatch):
+    monkeypatch.setattr(settings, "TRANSACTION_MAX_ATTEMPTS", 3)
+    conflicts["failures"] = 3
+    with pytest.raises(ServiceUnavailableException) as error:
+        run(AccountService.create_account(AccountCreate(tenant_id=TENANT, name="acme", manager_id="m")))
+    assert error.value.status_code == 503
+    assert conflicts["calls"] == 3
+    assert AccountModel.count(TENANT, AccountModel.tenant_id == TENANT) == 0
+
+def test_failed_condition_on_target_returns_409_without_retry(dynamodb, monkeypatch):
+    calls = []
+
+    async def failing_transact_write(model_cls, build):
+        calls.append(1)
+        raise cancelled("ConditionalCheckFailed", "TransactionConflict")
+
+    monkeypatch.setattr(item_updates, "db_transact_write", failing_transact_write)
+    with pytest.raises(ConflictException) as error:
+        run(item_updates.transact_write(AccountModel, lambda transaction: None))
+    assert error.value.status_code == 409
+    assert len(calls) == 1
+
+def test_other_cancellation_reasons_are_not_reported_as_conflict(dynamodb, monkeypatch):
+    async def failing_transact_write(model_cls, build):
+        raise cancelled(None, "ValidationError")
+
+    monkeypatch.setattr(item_updates, "db_transact_write", failing_transact_write)
+    with pytest.raises(TransactWriteError):
+        run(item_updates.transact_write(AccountModel, lambda transaction: None))
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.core.exceptions import ConflictException
+from app.models import AccountModel, OpportunityModel, UserModel
+from app.schemas.account import AccountCreate, AccountUpdate
+from app.schemas.opportunity import OpportunityCreate, OpportunityUpdate
+from app.schemas.user import UserCreate, UserUpdate
+from app.services.account_service import AccountService
+from app.services.opportunity_service import OpportunityService
+from app.services.user_service import UserService
+
+def run(coro):
+    return asyncio.run(coro)
+
+def assert_conflict(coro):
+    with pytest.raises(ConflictException) as error:
+        run(coro)
+    assert error.value.status_code == 409
+
+@pytest.fixture
+def account(dynamodb):
+    return run(AccountService.create_account(AccountCreate(tenant_id="t-ver", name="acme", manager_id="m")))
+
+def test_account_update_with_current_version(account):
+    updated = run(AccountService.update_account(account.account_id, "t-ver", AccountUpdate(name="acme 2", version=account.version)))
+    assert updated.name == "acme 2"
+    assert updated.version == account.version + 1
+
+def test_account_update_with_stale_version_returns_409(account):
+    run(AccountService.update_account(account.account_id, "t-ver", AccountUpdate(name="first")))
+    assert_conflict(AccountService.update_account(account.account_id, "t-ver", AccountUpdate(name="second", version=account.version)))
+    assert AccountModel.get(account.account_id, "t-ver").name == "first"
+
+def test_account_deactivation_with_stale_version_returns_409(account):
+    # is_active 변경은 집계와 함께 트랜잭션으로 반영되는 경로
+    run(AccountService.update_account(account.account_id, "t-ver", AccountUpdate(name="first")))
+    assert_conflict(AccountService.update_account(account.account_id, "t-ver", AccountUpdate(is_active=False, version=account.version)))
+    assert AccountModel.get(account.account_id, "t-ver").is_active
+
+def test_manager_change_with_stale_version_returns_409(account):
+    run(AccountService.change_account_manager(account.account_id, "t-ver", "m2"))
+    assert_conflict(AccountService.change_account_manager(account.account_id, "t-ver", "m3", expected_version=account.version))
+    assert AccountModel.get(account.account_id, "t-ver").manager_id == "m2"
+
+def test_legacy_item_without_version_counts_as_zero(dynamodb):
+    AccountModel("legacy", "t-ver", name="old", manager_id="m", active_tenant_id="t-ver").save()
+    assert_conflict(AccountService.update_account("legacy", "t-ver", AccountUpdate(name="x", version=1)))
+    assert run(AccountService.update_account("legacy", "t-ver", AccountUpdate(name="x", version=0))).version == 1
+
+def test_opportunity_update_with_stale_version_returns_409(account):
+    opportunity = run(OpportunityService.create_opportunity(OpportunityCreate(
+        tenant_id="t-ver", account_id=account.account_id, name="deal", stage="Prospecting",
+        expected_revenue=10, manager_id="m"
+    )))
+    run(OpportunityService.update_opportunity(opportunity.opportunity_id, "t-ver", OpportunityUpdate(stage="Committed")))
+    for update in (OpportunityUpdate(name="late", version=opportunity.version), OpportunityUpdate(stage="Closed Won", version=opportunity.version)):
+        assert_conflict(OpportunityService.update_opportunity(opportunity.opportunity_id, "t-ver", update))
+    stored = OpportunityModel.get(opportunity.opportunity_id, "t-ver")
+    assert (stored.name, stored.stage) == ("deal", "Committed")
+
+def test_user_update_with_stale_version_returns_409(dynamodb):
+    UserModel("user-1", "t-ver", email="u@example.com", given_name="a", family_name="b", role="user", version=3).save()
+    assert_conflict(UserService.update_user("user-1", "t-ver", UserUpdate(givenname="c", familyname="d", version=2)))
+    updated = run(UserService.update_user("user-1", "t-ver", UserUpdate(givenname="c", familyname="d", version=3)))
+    assert updated.version == 4
+    assert UserModel.get("user-1", "t-ver").given_name == "c"
+
+def test_concurrent_managed_account_changes_are_not_lost(dynamodb, monkeypatch):
+    # moto는 조건 검사와 쓰기를 원자적으로 처리하지 않으므로 호출을 직렬화 (읽기/쓰기는 여전히 서로 교차함)
+    monkeypatch.setattr(settings, "DYNAMODB_TABLE_CONCURRENCY", 1)
+    UserModel("user-1", "t-ver", email="u@example.com", given_name="a", family_name="b", role="user", version=1).save()
+
+    async def add_all():
+        return await asyncio.gather(*(UserService.add_managed_account("user-1", "t-ver", f"acc-{i}") for i in range(3)))
+
+    run(add_all())
+    stored = UserModel.get("user-1", "t-ver")
+    assert sorted(stored.managed_account_ids) == ["acc-0", "acc-1", "acc-2"]
+    assert stored.version == 4
+
+    removed = run(UserService.remove_managed_account("user-1", "t-ver", "acc-1"))
+    assert (removed.tenant_name, removed.version) == ("t-ver", 5)
+    assert sorted(removed.managed_account_ids) == ["acc-0", "acc-2"]
+    # 변경이 없으면 버전도 그대로
+    assert run(UserService.remove_managed_account("user-1", "t-ver", "acc-1")).version == 5
+
+def test_managed_account_change_conflicting_with_every_retry_returns_409(dynamodb, monkeypatch):
+    UserModel("user-1", "t-ver", email="u@example.com", given_name="a", family_name="b", role="user", version=1).save()
+    get = UserModel.get
+
+    def get_then_concurrent_write(*args, **kwargs):
+        user = get(*args, **kwargs)
+        UserModel("user-1", "t-ver").update(actions=[UserModel.version.add(1)])
+        return user
+
+    monkeypatch.setattr(UserModel, "get", get_then_concurrent_write)
+    assert_conflict(UserService.add_managed_account("user-1", "t-ver", "acc-1"))
+    assert get("user-1", "t-ver").managed_account_ids == []
+
+def test_created_and_fetched_users_carry_tenant_name(dynamodb):
+    created = run(UserService.create_user(UserCreate(
+        user_id="user-2", tenant_name="t-ver", email="n@example.com", role="user", given_name="n", family_name="m"
+    )))
+    assert created.tenant_name == "t-ver"
+    assert UserModel.get("user-2", "t-ver").version == 1
+    assert run(UserService.get_user("user-2", "t-ver")).tenant_name == "t-ver"
@@ -0,0 +1,287 @@
+import asyncio
+import functools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Type
+from pynamodb.connection import Connection
+from pynamodb.models import Model
+from pynamodb.transactions import TransactWrite
+from app.core.aws_clients import AWS_MAX_POOL_CONNECTIONS
+from app.core.config import settings
+
+# PynamoDB는 동기(blocking) 클라이언트이므로 전용 스레드 풀에서 실행하여
+# 이벤트 루프가 DynamoDB I/O 대기로 멈추지 않도록 한다.
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# 여러 테이블에 걸친 트랜잭션용 PynamoDB 연결 (botocore 세션은 스레드별로 생성됨)
+_transaction_connection: Optional[Connection] = None
+
+# 이벤트 루프별, 테이블별 동시 요청 수 제한용 세마포어
+_table_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """
+    DynamoDB 호출 전용 스레드 풀 가져오기 (최초 호출 시 생성)
+    :return: ThreadPoolExecutor 객체
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.DYNAMODB_EXECUTOR_MAX_WORKERS,
+                    thread_name_prefix="dynamodb"
+                )
+    return _executor
+
+def reset_db_state() -> None:
+    """
+    스레드 풀과 트랜잭션 연결 폐기 (fork 이후 워커에서 호출 - 스레드는 fork로 복사되지 않음)
+    """
+    global _executor, _transaction_connection
+    _executor = None
+    _transaction_connection = None
+    _table_semaphores.clear()
+
+def _get_table_semaphore(table_name: str) -> asyncio.Semaphore:
+    """
+    현재 이벤트 루프에서 테이블별 동시성 제한 세마포어 가져오기
+    :param table_name: 테이블 이름
+    :return: asyncio.Semaphore 객체
+    """
+    loop = asyncio.get_running_loop()
+    semaphores = _table_semaphores.setdefault(loop, {})
+    semaphore = semaphores.get(table_name)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(settings.DYNAMODB_TABLE_CONCURRENCY)
+        semaphores[table_name] = semaphore
+    return semaphore
+
+async def db_call(model_cls: Type[Model], func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """
+    블로킹 DynamoDB 호출을 테이블별 동시성 제한 하에 스레드 풀에서 실행
+    :param model_cls: 호출 대상 테이블의 PynamoDB 모델 클래스
+    :param func: 실행할 블로킹 함수
+    :return: 함수 실행 결과
+    """
+    async with _get_table_semaphore(model_cls.Meta.table_name):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_db_executor(), functools.partial(func, *args, **kwargs))
+
+async def db_get(model_cls: Type[Model], hash_key: Any, range_key: Any = None, attributes_to_get: Optional[List[str]] = None) -> Model:
+    """
+    단일 항목 조회 (Model.get의 비동기 버전)
+    :param model_cls: PynamoDB 모델 클래스
+    :param hash_key: 해시 키
+    :param range_key: 범위 키 (선택적)
+    :param attributes_to_get: 읽을 속성 목록 (ProjectionExpression, 없으면 모든 속성)
+    :return: 조회된 모델 인스턴스 (없으면 model_cls.DoesNotExist 발생)
+    """
+    return await db_call(model_cls, model_cls.get, hash_key, range_key, attributes_to_get=attributes_to_get)
+
+async def db_save(instance: Model, **kwargs: Any) -> Any:
+    """
+    항목 저장 (Model.save의 비동기 버전)
+    :param instance: 저장할 모델 인스턴스
+    :return: save 결과
+    """
+    return await db_call(type(instance), instance.save, **kwargs)
+
+async def db_update(instance: Model, actions: List[Any], condition: Any = None) -> Any:
+    """
+    단일 UpdateItem 실행 (Model.update의 비동기 버전 - ReturnValues=ALL_NEW로 instance를 갱신)
+    :param instance: 키가 설정된 모델 인스턴스
+    :param actions: 업데이트 액션 목록
+    :param condition: 업데이트 조건 (선택적)
+    :return: update 결과
+    """
+    return await db_call(type(instance), instance.update, actions=actions, condition=condition)
+
+async def db_query(model_cls: Type[Model], query_func: Callable, *args: Any, **kwargs: Any) -> List[Model]:
+    """
+    쿼리를 실행하고 모든 결과를 스레드 풀 안에서 읽어옴
+    (ResultIterator는 순회 시 지연 요청하므로 이벤트 루프에서 순회하면 안 됨)
+    :param model_cls: PynamoDB 모델 클래스
+    :param query_func: 쿼리 함수 (예: Model.query, Model.active_index.query)
+    :return: 조회된 모델 인스턴스 목록
+    """
+    return await db_call(model_cls, lambda: list(query_func(*args, **kwargs)))
+
+async def db_query_raw(model_cls: Type[Model], hash_key: Any, index_name: Optional[str] = None, filter_condition: Any = None, attributes_to_get: Optional[List[str]] = None) -> List[Dict[str, Dict[str, Any]]]:
+    """
+    모델 역직렬화 없이 쿼리의 모든 페이지를 DynamoDB 원시 항목({"S": ...} 형식)으로 반환
+    :param model_cls: PynamoDB 모델 클래스
+    :param hash_key: 파티션 키 값
+    :param index_name: 조회할 인덱스 이름 (선택적)
+    :param filter_condition: 필터 조건 (선택적)
+    :param attributes_to_get: 읽을 속성 목록 (ProjectionExpression)
+    :return: 원시 항목 목록
+    """
+    def run_query():
+        connection = model_cls._get_connection()
+        items = []
+        exclusive_start_key = None
+        while True:
+            page = connection.query(
+                hash_key,
+                filter_condition=filter_condition,
+                attributes_to_get=attributes_to_get,
+                exclusive_start_key=exclusive_start_key,
+                index_name=index_name
+            )
+            items.extend(page.get("Items", ()))
+            exclusive_start_key = page.get("LastEvaluatedKey")
+            if not exclusive_start_key:
+                return items
+    return await db_call(model_cls, run_query)
+
+def _key_attribute_names(model_cls: Type[Model], index_name: Optional[str] = None) -> List[str]:
+    """
+    LastEvaluatedKey를 구성하는 키 속성 이름 (테이블 키 + 조회한 인덱스의 키)
+    """
+    schemas = [model_cls._get_schema()]
+    if index_name:
+        schemas.append(model_cls._indexes[index_name]._get_schema())
+    return list(dict.fromkeys(key["AttributeName"] for schema in schemas for key in schema["key_schema"]))
+
+async def db_query_raw_page(
+    model_cls: Type[Model],
+    hash_key: Any,
+    limit: int,
+    index_name: Optional[str] = None,
+    filter_condition: Any = None,
+    attributes_to_get: Optional[List[str]] = None,
+    exclusive_start_key: Optional[Dict[str, Any]] = None,
+    read_size: Optional[int] = None,
+    max_evaluated: Optional[int] = None
+) -> Tuple[List[Dict[str, Dict[str, Any]]], Optional[Dict[str, Any]]]:
+    """
+    모델 역직렬화 없이 최대 limit개의 원시 항목과 LastEvaluatedKey를 반환 (커서 페이지네이션용)
+    필터로 버려진 항목이 있으면 limit개를 채우거나 마지막 페이지에 도달할 때까지 이어서 조회한다.
+    필터가 있으면 요청마다 read_size개 이상씩 평가하고, 평가한 항목 수가 max_evaluated에 이르면
+    limit개를 채우지 못했더라도 그때까지의 항목과 LastEvaluatedKey를 반환한다 (빈 목록일 수 있음).
+    :param model_cls: PynamoDB 모델 클래스
+    :param hash_key: 파티션 키 값
+    :param limit: 반환할 최대 항목 수
+    :param index_name: 조회할 인덱스 이름 (선택적)
+    :param filter_condition: 필터 조건 (선택적)
+    :param attributes_to_get: 읽을 속성 목록 (ProjectionExpression)
+    :param exclusive_start_key: 이전 페이지의 LastEvaluatedKey
+    :param read_size: 필터가 있을 때 요청당 평가할 최소 항목 수 (없으면 남은 개수만큼)
+    :param max_evaluated: 필터가 있을 때 한 번의 호출에서 평가할 최대 항목 수 (없으면 제한 없음)
+    :return: (원시 항목 목록, LastEvaluatedKey)
+    """
+    filtered = filter_condition is not None
+    key_names = _key_attribute_names(model_cls, index_name) if filtered else []
+    if filtered and attributes_to_get is not None:
+        # 필터 결과가 남은 개수보다 많으면 마지막 반환 항목의 키로 LastEvaluatedKey를 만들어야 한다
+        attributes_to_get = list(dict.fromkeys([*attributes_to_get, *key_names]))
+
+    def run_query():
+        connection = model_cls._get_connection()
+        items = []
+        evaluated = 0
+        last_evaluated_key = exclusive_start_key
+        while True:
+            remaining = limit - len(items)
+            # 필터가 없으면 남은 개수만큼만 평가하므로 limit개를 넘겨 읽지 않고, LastEvaluatedKey가 마지막 반환 항목과 일치한다
+            page = connection.query(
+                hash_key,
+                filter_condition=filter_condition,
+                attributes_to_get=attributes_to_get,
+                exclusive_start_key=last_evaluated_key,
+                index_name=index_name,
+                limit=max(remaining, read_size or 0) if filtered else remaining
+            )
+            page_items = page.get("Items", [])
+            evaluated += page.get("ScannedCount", len(page_items))
+            if len(page_items) > remaining:
+                # 남는 항목은 버리고 다음 페이지가 마지막 반환 항목 다음부터 시작하도록 키를 만든다
+                items.extend(page_items[:remaining])
+                return items, {name: items[-1][name] for name in key_names}
+            items.extend(page_items)
+            last_evaluated_key = page.get("LastEvaluatedKey")
+            if not last_evaluated_key or len(items) >= limit:
+                return items, last_evaluated_key
+            if filtered and max_evaluated and evaluated >= max_evaluated:
+                return items, last_evaluated_key
+    return await db_call(model_cls, run_query)
+
+async def db_query_raw_pages(
+    model_cls: Type[Model],
+    hash_key: Any,
+    index_name: Optional[str] = None,
+    filter_condition: Any = None,
+    attributes_to_get: Optional[List[str]] = None,
+    page_size: Optional[int] = None,
+    prefetch: bool = False
+) -> AsyncIterator[List[Dict[str, Dict[str, Any]]]]:
+    """
+    쿼리 결과를 DynamoDB 페이지 단위 원시 항목 목록으로 순차 반환 (스트리밍용)
+    다음 페이지는 이전 페이지를 소비한 뒤에 조회하므로 메모리에는 한 페이지만 유지된다.
+    :param model_cls: PynamoDB 모델 클래스
+    :param hash_key: 파티션 키 값
+    :param index_name: 조회할 인덱스 이름 (선택적)
+    :param filter_condition: 필터 조건 (선택적)
+    :param attributes_to_get: 읽을 속성 목록 (ProjectionExpression)
+    :param page_size: 페이지당 평가할 최대 항목 수 (없으면 DynamoDB 기본 1MB 단위)
+    :param prefetch: 현재 페이지를 소비하는 동안 다음 페이지를 미리 조회 (메모리에는 최대 두 페이지)
+    :return: 원시 항목 목록의 비동기 이터레이터 (빈 페이지는 건너뜀)
+    """
+    def run_page(exclusive_start_key):
+        return model_cls._get_connection().query(
+            hash_key,
+            filter_condition=filter_condition,
+            attributes_to_get=attributes_to_get,
+            exclusive_start_key=exclusive_start_key,
+            index_name=index_name,
+            limit=page_size
+        )
+    next_page: Optional[asyncio.Future] = None
+    try:
+        page = await db_call(model_cls, run_page, None)
+        while True:
+            exclusive_start_key = page.get("LastEvaluatedKey")
+            if exclusive_start_key and prefetch:
+                next_page = asyncio.ensure_future(db_call(model_cls, run_page, exclusive_start_key))
+            items = page.get("Items")
+            if items:
+                yield items
+            if not exclusive_start_key:
+                return
+            if next_page is None:
+                page = await db_call(model_cls, run_page, exclusive_start_key)
+            else:
+                page, next_page = await next_page, None
+    finally:
+        # 소비자가 중간에 멈추면(클라이언트 연결 종료 등) 미리 시작한 조회를 취소
+        if next_page is not None:
+            next_page.cancel()
+
+def get_transaction_connection() -> Connection:
+    """
+    TransactWrite에 사용할 공유 PynamoDB 연결 가져오기
+    :return: PynamoDB Connection 객체
+    """
+    global _transaction_connection
+    if _transaction_connection is None:
+        with _executor_lock:
+            if _transaction_connection is None:
+                _transaction_connection = Connection(
+                    region=settings.AWS_REGION,
+                    max_pool_connections=AWS_MAX_POOL_CONNECTIONS
+                )
+    return _transaction_connection
+
+async def db_transact_write(model_cls: Type[Model], build: Callable[[TransactWrite], None]) -> None:
+    """
+    TransactWrite 트랜잭션을 스레드 풀에서 실행
+    :param model_cls: 동시성 제한에 사용할 주 테이블의 모델 클래스
+    :param build: 트랜잭션에 쓰기 작업을 추가하는 함수
+    """
+    def run_transaction():
+        with TransactWrite(connection=get_transaction_connection()) as transaction:
+            build(transaction)
+    await db_call(model_cls, run_transaction)
@@ -1,17 +1,13 @@
-import boto3
 from botocore.exceptions import ClientError
+from app.core.aws_clients import get_client, get_session
 from app.core.config import settings
 
 def get_aws_session():
     """
-    AWS 세션 생성
+    프로세스 공유 AWS 세션 가져오기
     :return: boto3 Session 객체
     """
-    return boto3.Session(
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_REGION
-    )
+    return get_session()
 
 def get_ssm_parameter(param_name: str, with_decryption: bool = True):
     """
@@ -20,8 +16,7 @@ def get_ssm_parameter(param_name: str, with_decryption: bool = True):
     :param with_decryption: 암호화된 파라미터 복호화 여부
     :return: 파라미터 값
     """
-    session = get_aws_session()
-    ssm_client = session.client('ssm')
+    ssm_client = get_client('ssm', settings.AWS_REGION)
     
     try:
         response = ssm_client.get_parameter(
@@ -41,8 +36,7 @@ def create_cognito_user(username: str, password: str, user_attributes: list):
     :param user_attributes: 사용자 속성 리스트
     :return: 생성된 사용자 정보
     """
-    session = get_aws_session()
-    cognito_client = session.client('cognito-idp')
+    cognito_client = get_client('cognito-idp', settings.AWS_REGION)
     
     try:
         response = cognito_client.sign_up(
@@ -61,8 +55,7 @@ def confirm_cognito_signup(username: str):
     Cognito 사용자 가입 확인
     :param username: 사용자 이름
     """
-    session = get_aws_session()
-    cognito_client = session.client('cognito-idp')
+    cognito_client = get_client('cognito-idp', settings.AWS_REGION)
     
     try:
         cognito_client.admin_confirm_sign_up(
@@ -78,8 +71,7 @@ def delete_cognito_user(username: str):
     Cognito 사용자 삭제
     :param username: 사용자 이름
     """
-    session = get_aws_session()
-    cognito_client = session.client('cognito-idp')
+    cognito_client = get_client('cognito-idp', settings.AWS_REGION)
     
     try:
         cognito_client.admin_delete_user(
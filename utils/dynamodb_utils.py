@@ -1,18 +1,20 @@
-import boto3
 from botocore.exceptions import ClientError
+from app.core.aws_clients import get_client, get_resource
 from app.core.config import settings
 
+def get_dynamodb_client():
+    """
+    공유 DynamoDB 클라이언트 가져오기
+    :return: boto3 DynamoDB 클라이언트
+    """
+    return get_client('dynamodb', settings.AWS_REGION)
+
 def get_dynamodb_resource():
     """
-    DynamoDB 리소스 객체 생성
+    현재 스레드용 DynamoDB 리소스 객체 가져오기 (스레드별로 한 번만 생성)
     :return: boto3 DynamoDB 리소스 객체
     """
-    return boto3.resource(
-        'dynamodb',
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_REGION
-    )
+    return get_resource('dynamodb', settings.AWS_REGION)
 
 def create_table_if_not_exists(table_name: str, key_schema: list, attribute_definitions: list, provisioned_throughput: dict):
     """
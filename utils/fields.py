@@ -0,0 +1,74 @@
+from fastapi import Query
+from pydantic import BaseModel
+from pynamodb.models import Model
+from typing import Any, Dict, List, Optional, Type
+from app.core.exceptions import BadRequestException
+from app.core.responses import FastJSONResponse
+
+class FieldSelectionParams:
+    """
+    응답 필드 선택 파라미터를 위한 의존성 클래스
+    """
+    def __init__(
+        self,
+        fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표로 구분, 예: name,stage,expected_revenue)")
+    ):
+        self.fields = fields
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> Optional[List[str]]:
+    """
+    fields 파라미터를 검증하여 필드 이름 목록으로 변환
+    :param fields: 쉼표로 구분된 필드 이름
+    :param schema: 응답 스키마 (선택 가능한 필드)
+    :return: 필드 이름 목록 (선택하지 않았으면 None)
+    """
+    if not fields:
+        return None
+    selected = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in selected if name not in schema.__fields__]
+    if unknown:
+        raise BadRequestException(f"Unknown fields: {', '.join(unknown)}")
+    return selected or None
+
+def projection(model_cls: Type[Model], fields: Optional[List[str]]) -> Optional[List[str]]:
+    """
+    선택한 필드를 DynamoDB에서 읽을 속성 목록(ProjectionExpression)으로 변환
+    :param model_cls: PynamoDB 모델 클래스
+    :param fields: 필드 이름 목록 (None이면 모든 속성)
+    :return: 속성 이름 목록 (None이면 모든 속성)
+    """
+    if not fields:
+        return None
+    attributes = model_cls.get_attributes()
+    names = [attributes[name].attr_name for name in fields if name in attributes]
+    # 모델에 없는 필드만 선택된 경우에도 빈 projection이 되지 않도록 해시 키는 읽음
+    return names or [model_cls._hash_key_attribute().attr_name]
+
+def select_fields(source: Any, fields: List[str], schema: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    선택한 필드만 스키마의 타입으로 변환하여 dict 생성 (선택하지 않은 필드는 검증/생성하지 않음)
+    :param source: 값을 읽을 객체 (PynamoDB 모델 또는 스키마 인스턴스)
+    :param fields: 필드 이름 목록
+    :param schema: 응답 스키마
+    :return: 필드 이름 -> 값
+    """
+    result = {}
+    for name in fields:
+        field = schema.__fields__[name]
+        value = getattr(source, name, None)
+        if value is None:
+            result[name] = field.get_default()
+            continue
+        value, error = field.validate(value, result, loc=name)
+        if error:
+            raise ValueError(f"Invalid value for field {name}")
+        result[name] = value
+    return result
+
+def selection_response(result: Any) -> FastJSONResponse:
+    """
+    필드를 선택한 응답은 일부 필드만 가지므로 response_model 검증 없이 그대로 직렬화
+    :param result: select_fields로 만든 dict 또는 그 dict를 항목으로 갖는 페이지
+    :return: JSON 응답
+    """
+    return FastJSONResponse(result)
@@ -0,0 +1,154 @@
+from app.core.config import settings
+from app.core.exceptions import ConflictException, ServiceUnavailableException
+from app.utils.async_dynamodb import db_get, db_transact_write, db_update
+from datetime import datetime
+from enum import Enum
+from pynamodb.exceptions import TransactWriteError, UpdateError
+from pynamodb.expressions.condition import Condition
+from pynamodb.expressions.update import Action
+from pynamodb.models import Model
+from pynamodb.transactions import TransactWrite
+from typing import Any, Callable, Dict, List, Optional, Type
+import asyncio
+import random
+
+# 다른 트랜잭션과 같은 항목(테넌트 집계 등)을 동시에 변경하여 취소된 경우 - 다시 시도하면 성공할 수 있음
+_RETRYABLE_CANCELLATIONS = {"TransactionConflict", "ThrottlingError", "ProvisionedThroughputExceeded"}
+
+def current_version(item: Model) -> int:
+    """
+    항목의 버전 (version 속성이 없던 기존 항목은 0)
+    """
+    return item.version or 0
+
+def version_condition(model_cls: Type[Model], expected_version: int) -> Condition:
+    """
+    항목 버전이 expected_version일 때만 쓰기를 허용하는 조건
+    :param model_cls: PynamoDB 모델 클래스
+    :param expected_version: 기대하는 버전
+    :return: 조건
+    """
+    if expected_version == 0:
+        return model_cls.version.does_not_exist() | (model_cls.version == 0)
+    return model_cls.version == expected_version
+
+def check_version(item: Model, expected_version: Optional[int], detail: str) -> None:
+    """
+    읽은 항목의 버전이 요청한 버전과 다르면 409
+    :param item: 읽은 항목
+    :param expected_version: 요청한 버전 (None이면 검사하지 않음)
+    :param detail: 충돌 시 오류 메시지
+    """
+    if expected_version is not None and current_version(item) != expected_version:
+        raise ConflictException(detail)
+
+def update_actions(model_cls: Type[Model], values: Dict[str, Any]) -> List[Action]:
+    """
+    변경된 속성만 SET하고 updated_at 갱신(values에 없으면 현재 시각), version을 1 증가시키는 업데이트 액션 생성
+    :param model_cls: PynamoDB 모델 클래스
+    :param values: 속성 이름 -> 새 값 (None이면 속성 제거)
+    :return: 업데이트 액션 목록
+    """
+    values = {"updated_at": datetime.utcnow(), **values}
+    actions = [
+        getattr(model_cls, name).remove() if value is None
+        else getattr(model_cls, name).set(value.value if isinstance(value, Enum) else value)
+        for name, value in values.items()
+    ]
+    actions.append(model_cls.version.add(1))
+    return actions
+
+def with_active_index(values: Dict[str, Any], tenant_key: str) -> Dict[str, Any]:
+    """
+    is_active가 바뀌면 희소 활성 인덱스 키(active_tenant_id)도 함께 설정/제거하도록 values에 추가
+    :param values: 속성 이름 -> 새 값
+    :param tenant_key: 활성 항목의 active_tenant_id 값 (항목의 테넌트 ID)
+    :return: active_tenant_id가 포함된 values
+    """
+    if "is_active" not in values:
+        return values
+    return dict(values, active_tenant_id=tenant_key if values["is_active"] else None)
+
+def apply_update(item: Model, values: Dict[str, Any]) -> None:
+    """
+    update_actions로 반영한 변경을 읽어 둔 항목 객체에도 적용 (트랜잭션은 변경 후 항목을 돌려주지 않음)
+    :param item: 읽은 항목
+    :param values: update_actions에 전달한 속성 이름 -> 새 값 (updated_at 포함)
+    """
+    for name, value in values.items():
+        setattr(item, name, value.value if isinstance(value, Enum) else value)
+    item.version = current_version(item) + 1
+
+async def update_item(
+    model_cls: Type[Model],
+    hash_key: Any,
+    range_key: Any,
+    values: Dict[str, Any],
+    expected_version: Optional[int] = None,
+    condition: Optional[Condition] = None,
+    conflict_detail: str = "Resource was modified concurrently"
+) -> Model:
+    """
+    기존 항목의 지정한 속성만 단일 UpdateItem으로 변경하고 변경 후 항목을 반환 (ReturnValues=ALL_NEW)
+    :param model_cls: PynamoDB 모델 클래스
+    :param hash_key: 해시 키
+    :param range_key: 범위 키 (테넌트 ID - is_active가 바뀌면 활성 인덱스 키로도 사용)
+    :param values: 속성 이름 -> 새 값
+    :param expected_version: 주어지면 항목 버전이 일치할 때만 변경
+    :param condition: 추가 조건 (선택적)
+    :param conflict_detail: 충돌 시 오류 메시지
+    :return: 변경된 항목 (없으면 model_cls.DoesNotExist, 조건 불일치 시 ConflictException)
+    """
+    item = model_cls(hash_key, range_key)
+    values = with_active_index(values, range_key)
+    # 없는 항목이 새로 만들어지지 않도록 키 존재를 조건으로 건다
+    update_condition = model_cls._hash_key_attribute().exists()
+    if expected_version is not None:
+        update_condition &= version_condition(model_cls, expected_version)
+    if condition is not None:
+        update_condition &= condition
+    try:
+        await db_update(item, update_actions(model_cls, values), update_condition)
+    except UpdateError as e:
+        if e.cause_response_code != "ConditionalCheckFailedException":
+            raise
+        if expected_version is None and condition is None:
+            raise model_cls.DoesNotExist()
+        # 항목이 없는 것인지 버전/조건이 맞지 않는 것인지 구분 (실패 시에만 추가 조회)
+        await db_get(model_cls, hash_key, range_key)
+        raise ConflictException(conflict_detail)
+    return item
+
+async def transact_write(
+    model_cls: Type[Model],
+    build: Callable[[TransactWrite], None],
+    conflict_detail: str = "Resource was modified concurrently",
+    target_index: int = 0
+) -> None:
+    """
+    TransactWrite를 실행하고 취소 사유(CancellationReasons)에 따라 처리
+    - 대상 항목(target_index번째 쓰기)의 조건 불일치(ConditionalCheckFailed): ConflictException (409)
+    - 다른 트랜잭션과의 충돌/처리량 초과: 지수 백오프로 재시도 (TRANSACTION_MAX_ATTEMPTS회까지, 모두 실패하면 503)
+    트랜잭션이 취소되면 어떤 쓰기도 반영되지 않으므로 집계 ADD 업데이트를 포함해도 다시 시도할 수 있다.
+    :param model_cls: 동시성 제한에 사용할 주 테이블의 모델 클래스
+    :param build: 트랜잭션에 쓰기 작업을 추가하는 함수 (재시도마다 다시 호출됨)
+    :param conflict_detail: 충돌 시 오류 메시지
+    :param target_index: 조건을 검사하는 대상 항목의 트랜잭션 내 순서
+    """
+    attempts = max(1, settings.TRANSACTION_MAX_ATTEMPTS)
+    for attempt in range(attempts):
+        try:
+            await db_transact_write(model_cls, build)
+            return
+        except TransactWriteError as e:
+            if e.cause_response_code != "TransactionCanceledException":
+                raise
+            codes = [reason.code if reason else None for reason in e.cancellation_reasons]
+            if not codes or (len(codes) > target_index and codes[target_index] == "ConditionalCheckFailed"):
+                raise ConflictException(conflict_detail)
+            if not set(filter(None, codes)) <= _RETRYABLE_CANCELLATIONS:
+                raise
+        if attempt + 1 < attempts:
+            delay = settings.TRANSACTION_RETRY_BASE_DELAY_SECONDS * (2 ** attempt)
+            await asyncio.sleep(delay * (0.5 + random.random()))
+    raise ServiceUnavailableException("Too many concurrent updates, please retry")
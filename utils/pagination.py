@@ -1,48 +1,98 @@
 from fastapi import Query
-from typing import Optional, Generic, TypeVar, List
-from pydantic import BaseModel
+from typing import Optional, Generic, TypeVar, List, Dict, Any
+from pydantic.generics import GenericModel
+from app.core.config import settings
+from app.core.exceptions import BadRequestException
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
-class Page(BaseModel, Generic[T]):
+_FALLBACK_CURSOR_SECRET = os.urandom(32)
+
+class CursorPage(GenericModel, Generic[T]):
     """
-    페이지네이션 결과를 나타내는 Pydantic 모델
+    커서(keyset) 기반 페이지네이션 결과를 나타내는 Pydantic 모델
     """
     items: List[T]
-    total: int
-    page: int
     size: int
-    pages: int
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+def _cursor_secret() -> bytes:
+    """
+    커서 서명에 사용할 비밀 키
+    설정이 없으면 프로세스 단위 임의 키를 사용 (해당 프로세스에서만 유효 - check_cursor_secret 참고)
+    """
+    secret = settings.PAGINATION_CURSOR_SECRET or settings.JWT_SECRET_KEY
+    if secret:
+        return secret.encode()
+    return _FALLBACK_CURSOR_SECRET
+
+def check_cursor_secret(multi_process: bool) -> None:
+    """
+    커서 서명 키 설정 확인 (애플리케이션 시작 시 호출)
+    키가 없으면 프로세스마다 다른 임의 키로 서명하므로 다른 워커/인스턴스나 재시작 후에는 커서가 거부된다.
+    :param multi_process: 여러 워커 프로세스로 실행 중인지 여부 (True이면 키가 없을 때 시작 실패)
+    """
+    if settings.PAGINATION_CURSOR_SECRET or settings.JWT_SECRET_KEY:
+        return
+    message = "Neither PAGINATION_CURSOR_SECRET nor JWT_SECRET_KEY is set; pagination cursors are signed with a per-process random key"
+    if multi_process:
+        raise RuntimeError(f"{message} and would be rejected by other workers")
+    logger.warning("%s - cursors will be rejected after a restart or by other instances", message)
+
+def encode_cursor(last_evaluated_key: Optional[Dict[str, Any]], scope: str) -> Optional[str]:
+    """
+    DynamoDB LastEvaluatedKey를 서명된 불투명 커서 문자열로 인코딩
+    :param last_evaluated_key: 쿼리의 LastEvaluatedKey
+    :param scope: 커서가 유효한 범위 (예: "accounts:<tenant_id>")
+    :return: 커서 문자열 (더 이상 페이지가 없으면 None)
+    """
+    if not last_evaluated_key:
+        return None
+    payload = json.dumps({"s": scope, "k": last_evaluated_key}, separators=(",", ":"), sort_keys=True).encode()
+    signature = hmac.new(_cursor_secret(), payload, hashlib.sha256).digest()[:16]
+    return base64.urlsafe_b64encode(signature + payload).decode().rstrip("=")
 
-def paginate(items: List[T], page: int = 1, size: int = 10) -> Page[T]:
+def decode_cursor(cursor: Optional[str], scope: str) -> Optional[Dict[str, Any]]:
     """
-    주어진 항목 리스트를 페이지네이션
-    :param items: 페이지네이션할 항목 리스트
-    :param page: 현재 페이지 번호
-    :param size: 페이지당 항목 수
-    :return: 페이지네이션된 결과
+    커서 문자열을 검증하고 DynamoDB ExclusiveStartKey로 디코딩
+    :param cursor: 커서 문자열
+    :param scope: 커서가 유효한 범위
+    :return: LastEvaluatedKey (커서가 없으면 None)
     """
-    total = len(items)
-    pages = (total + size - 1) // size
-    start = (page - 1) * size
-    end = start + size
-    
-    return Page(
-        items=items[start:end],
-        total=total,
-        page=page,
-        size=size,
-        pages=pages
-    )
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        signature, payload = raw[:16], raw[16:]
+        expected = hmac.new(_cursor_secret(), payload, hashlib.sha256).digest()[:16]
+        if not hmac.compare_digest(signature, expected):
+            raise ValueError("signature mismatch")
+        data = json.loads(payload)
+    except (ValueError, TypeError):
+        raise BadRequestException("Invalid pagination cursor")
+    if data.get("s") != scope:
+        raise BadRequestException("Invalid pagination cursor")
+    return data["k"]
 
-class PaginationParams:
+class CursorPaginationParams:
     """
-    페이지네이션 파라미터를 위한 의존성 클래스
+    커서 기반 페이지네이션 파라미터를 위한 의존성 클래스
     """
     def __init__(
         self,
-        page: int = Query(1, ge=1, description="페이지 번호"),
-        size: Optional[int] = Query(10, ge=1, le=100, description="페이지당 항목 수")
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor 값"),
+        size: int = Query(10, ge=1, le=100, description="페이지당 항목 수"),
+        include_total: bool = Query(False, description="전체 항목 수 포함 여부 (추가 COUNT 쿼리 발생)")
     ):
-        self.page = page
-        self.size = size
\ No newline at end of file
+        self.cursor = cursor
+        self.size = size
+        self.include_total = include_total
@@ -0,0 +1,214 @@
+from app.core.responses import dumps
+from datetime import date, datetime
+from enum import Enum
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+import csv
+import io
+import logging
+import zlib
+
+logger = logging.getLogger(__name__)
+
+class StreamFormat(str, Enum):
+    """스트리밍 목록 응답 형식"""
+    NDJSON = "ndjson"  # 한 줄에 항목 하나 (application/x-ndjson)
+    JSON = "json"  # 점진적으로 인코딩한 JSON 배열
+
+class ExportFormat(str, Enum):
+    """대량 내보내기 형식"""
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+MEDIA_TYPES = {
+    StreamFormat.NDJSON: "application/x-ndjson",
+    StreamFormat.JSON: "application/json",
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+async def _chain(first: List[Any], pages: AsyncIterator[List[Any]]) -> AsyncIterator[List[Any]]:
+    yield first
+    async for page in pages:
+        yield page
+
+async def _first_page(pages: AsyncIterator[List[Any]]) -> List[Any]:
+    # 응답을 시작하기 전에 첫 페이지를 읽어 첫 조회의 오류가 일반 오류 응답이 되도록 한다
+    try:
+        return await pages.__anext__()
+    except StopAsyncIteration:
+        return []
+
+async def _encode_pages(pages: AsyncIterator[List[Any]], stream_format: StreamFormat) -> AsyncIterator[bytes]:
+    """
+    페이지 단위로 인코딩하여 청크 반환 (한 번에 한 페이지만 메모리에 유지)
+    """
+    try:
+        if stream_format is StreamFormat.NDJSON:
+            async for page in pages:
+                if page:
+                    yield b"".join(dumps(item) + b"\n" for item in page)
+            return
+        separator = b""
+        yield b"["
+        async for page in pages:
+            if page:
+                # 페이지를 배열로 한 번에 인코딩한 뒤 대괄호를 떼어 이어 붙인다
+                yield separator + dumps(page)[1:-1]
+                separator = b","
+        yield b"]"
+    except Exception:
+        # 헤더를 이미 보냈으므로 상태 코드를 바꿀 수 없다 - 응답을 끝맺지 않고 종료하여
+        # 클라이언트가 불완전한 응답(닫히지 않은 배열 / 청크 스트림 중단)을 알 수 있게 한다
+        logger.exception("Streaming list response failed")
+        raise
+
+def encode_stream(pages: AsyncIterator[List[Any]], stream_format: StreamFormat) -> AsyncIterator[bytes]:
+    """
+    페이지 이터레이터를 스트리밍 목록 응답 본문 청크로 인코딩 (streaming_response와 같은 인코딩)
+    :param pages: 응답 항목(dict 등) 페이지의 비동기 이터레이터
+    :param stream_format: 응답 형식 (ndjson 또는 json 배열)
+    :return: 응답 본문 청크의 비동기 이터레이터
+    """
+    return _encode_pages(pages, stream_format)
+
+async def streaming_response(pages: AsyncIterator[List[Any]], stream_format: StreamFormat) -> StreamingResponse:
+    """
+    페이지 이터레이터를 청크 단위 스트리밍 응답으로 변환
+    첫 페이지를 읽은 뒤 응답을 시작하므로 첫 조회의 오류는 일반 오류 응답으로 반환된다.
+    :param pages: 응답 항목(dict 등) 페이지의 비동기 이터레이터
+    :param stream_format: 응답 형식 (ndjson 또는 json 배열)
+    :return: 스트리밍 응답
+    """
+    first = await _first_page(pages)
+    return StreamingResponse(encode_stream(_chain(first, pages), stream_format), media_type=MEDIA_TYPES[stream_format])
+
+# 스프레드시트가 수식으로 해석하는 첫 글자
+_CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+def _csv_text(value: str) -> str:
+    """
+    수식으로 해석될 수 있는 문자열 셀 앞에 '를 붙여 텍스트로 내보냄 (CSV 수식 주입 방지)
+    """
+    if value.startswith(_CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+# CSV 셀 값 변환 (JSON 응답과 같은 표기 - ISO 8601 시각, 소문자 불리언, None은 빈 칸)
+# 숫자는 그대로 쓰므로 타입별 변환 함수만 찾는다 (셀마다 isinstance 검사를 반복하지 않음)
+_CSV_FORMATTERS = {
+    str: _csv_text,
+    type(None): lambda value: "",
+    bool: lambda value: "true" if value else "false",
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    list: lambda value: dumps(value).decode("utf-8"),
+}
+
+def _csv_row(row: Dict[str, Any], columns: Sequence[str]) -> List[Any]:
+    get_formatter = _CSV_FORMATTERS.get
+    values = []
+    for value in map(row.get, columns):
+        formatter = get_formatter(value.__class__)
+        values.append(value if formatter is None else formatter(value))
+    return values
+
+async def _encode_csv(pages: AsyncIterator[List[Dict[str, Any]]], columns: Sequence[str]) -> AsyncIterator[bytes]:
+    """
+    페이지 단위로 CSV 행을 인코딩하여 청크 반환 (첫 청크는 헤더 행 포함)
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\r\n")
+    writer.writerow(columns)
+    try:
+        async for page in pages:
+            writer.writerows([_csv_row(row, columns) for row in page])
+            chunk = buffer.getvalue()
+            if chunk:
+                yield chunk.encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+    except Exception:
+        logger.exception("Streaming export failed")
+        raise
+
+async def _gzip(chunks: AsyncIterator[bytes], level: int) -> AsyncIterator[bytes]:
+    """
+    청크를 이어지는 하나의 gzip 스트림으로 압축 (zlib은 GIL을 놓으므로 압축은 스레드 풀에서 실행)
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        compressed = await run_in_threadpool(compressor.compress, chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """
+    Accept-Encoding 헤더가 gzip을 허용하는지 여부 (q=0은 거부)
+    """
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() in ("gzip", "x-gzip", "*"):
+            quality = params.strip().lower()
+            if not quality.startswith("q="):
+                return True
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+    return False
+
+def encode_export(
+    pages: AsyncIterator[List[Dict[str, Any]]],
+    export_format: ExportFormat,
+    columns: Sequence[str],
+    compress: bool = False,
+    compress_level: int = 6
+) -> AsyncIterator[bytes]:
+    """
+    행 페이지 이터레이터를 내보내기 파일 본문 청크로 인코딩 (export_response와 같은 인코딩)
+    :param pages: 행(dict) 페이지의 비동기 이터레이터
+    :param export_format: 내보내기 형식
+    :param columns: CSV 열 순서 (헤더 행)
+    :param compress: 하나의 gzip 스트림으로 압축
+    :param compress_level: gzip 압축 수준 (1-9)
+    :return: 본문 청크의 비동기 이터레이터
+    """
+    if export_format is ExportFormat.CSV:
+        chunks = _encode_csv(pages, columns)
+    else:
+        chunks = _encode_pages(pages, StreamFormat.NDJSON)
+    if compress:
+        chunks = _gzip(chunks, compress_level)
+    return chunks
+
+async def export_response(
+    pages: AsyncIterator[List[Dict[str, Any]]],
+    export_format: ExportFormat,
+    columns: Sequence[str],
+    filename: str,
+    compress: bool = False,
+    compress_level: int = 6
+) -> StreamingResponse:
+    """
+    페이지 이터레이터를 파일 다운로드용 스트리밍 응답(CSV 또는 NDJSON)으로 변환
+    첫 페이지를 읽은 뒤 응답을 시작하므로 첫 조회의 오류는 일반 오류 응답으로 반환된다.
+    :param pages: 행(dict) 페이지의 비동기 이터레이터
+    :param export_format: 내보내기 형식
+    :param columns: CSV 열 순서 (헤더 행)
+    :param filename: 확장자를 뺀 다운로드 파일 이름
+    :param compress: gzip으로 압축하여 Content-Encoding: gzip으로 전송
+    :param compress_level: gzip 압축 수준 (1-9)
+    :return: 스트리밍 응답
+    """
+    first = await _first_page(pages)
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"',
+        "Vary": "Accept-Encoding",
+    }
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    chunks = encode_export(_chain(first, pages), export_format, columns, compress, compress_level)
+    return StreamingResponse(chunks, media_type=MEDIA_TYPES[export_format], headers=headers)